@@ -19,11 +19,17 @@ from typing import Tuple, Union, Optional
 
 from .databus import Databus
 from .internal_interface import Interface
+from .metrics import MetricsRegistry
+from .rate_limiter import RateLimiter
 from .session_manager import SessionManager
+from .template_cache import TemplateCache
 from .virtual_fs import VirtualFS, AbstractFS
 
-databus = Databus()
-sessionManager = SessionManager()
+templateCache = TemplateCache()
+databus = Databus(templateCache)
+metricsRegistry = MetricsRegistry()
+sessionManager = SessionManager(metricsRegistry)
+rateLimiter = RateLimiter(metricsRegistry)
 virtualFS = VirtualFS()
 core_interface = Interface()
 
@@ -42,6 +48,24 @@ def get_session(*args, **kwargs):
     return sessionManager.get_session(*args, **kwargs)
 
 
+# metrics related  --
+
+
+def get_metrics():
+    return metricsRegistry
+
+
+def get_rate_limiter():
+    return rateLimiter
+
+
+# template related  --
+
+
+def get_template_cache():
+    return templateCache
+
+
 # file-system related  --
 
 
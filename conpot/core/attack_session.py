@@ -16,17 +16,127 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import logging
+import sys
 import uuid
 
+from collections import deque
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+def _event_size(event_data):
+    # rough estimate, good enough to keep an eye on the retained history
+    size = sys.getsizeof(event_data)
+    if isinstance(event_data, dict):
+        for key, value in event_data.items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+def _payload_length(payload):
+    if isinstance(payload, str):
+        # some protocols log decoded payloads, count the bytes on the wire
+        return len(payload.encode("utf-8"))
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return len(payload)
+    return 0
+
+
+class SessionSummary(object):
+    """Aggregates the events of a session when only a summary is logged."""
+
+    __slots__ = (
+        "events",
+        "bytes_in",
+        "bytes_out",
+        "first_event",
+        "last_event",
+        "event_types",
+        "function_codes",
+        "oids",
+        "transcript",
+        "transcript_size",
+    )
+
+    def __init__(self, transcript_size=0):
+        self.transcript_size = transcript_size
+        self.reset()
+
+    def reset(self):
+        self.events = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.first_event = None
+        self.last_event = None
+        self.event_types = set()
+        self.function_codes = set()
+        self.oids = set()
+        self.transcript = []
+
+    def add(self, key, timestamp, event_data):
+        if self.first_event is None:
+            self.first_event = timestamp
+        self.last_event = timestamp
+        self.events += 1
+        if len(self.transcript) < self.transcript_size:
+            self.transcript.append({"offset": key, "event": event_data})
+        if not isinstance(event_data, dict):
+            return
+        request = event_data.get("request")
+        response = event_data.get("response")
+        self.bytes_in += _payload_length(request)
+        self.bytes_out += _payload_length(response)
+        if "type" in event_data:
+            self.event_types.add(event_data["type"])
+        if event_data.get("function_code") is not None:
+            self.function_codes.add(event_data["function_code"])
+        if isinstance(request, dict) and "oid" in request:
+            self.oids.add(request["oid"])
+
+    def to_dict(self):
+        return {
+            "events": self.events,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "first_event": self.first_event,
+            "last_event": self.last_event,
+            "event_types": sorted(self.event_types, key=str),
+            "function_codes": sorted(self.function_codes, key=str),
+            "oids": sorted(self.oids),
+            "transcript": self.transcript,
+        }
+
+
 # one instance per connection
 
 
 class AttackSession(object):
+    __slots__ = (
+        "log_queue",
+        "id",
+        "protocol",
+        "source_ip",
+        "source_port",
+        "destination_ip",
+        "destination_port",
+        "timestamp",
+        "last_activity",
+        "public_ip",
+        "event_count",
+        "memory",
+        "summary",
+        "metrics",
+        "_events",
+        "_last_key",
+        "_ended",
+        "_counted",
+    )
+
+    # retained events and their estimated size across all sessions
+    total_events = 0
+    total_memory = 0
+
     def __init__(
         self,
         protocol,
@@ -35,6 +145,10 @@ class AttackSession(object):
         destination_ip,
         destination_port,
         log_queue,
+        max_events=1000,
+        log_mode="event",
+        transcript_size=0,
+        metrics=None,
     ):
         self.log_queue = log_queue
         self.id = uuid.uuid4()
@@ -45,9 +159,33 @@ class AttackSession(object):
         self.destination_ip = destination_ip
         self.destination_port = destination_port
         self.timestamp = datetime.utcnow()
+        # time of the last event, used by the SessionManager for expiry
+        self.last_activity = self.timestamp
         self.public_ip = None
-        self.data = dict()
+        # number of events ever added, also the sequence number of the next event
+        self.event_count = 0
+        # estimated size of the retained events
+        self.memory = 0
+        # only the last max_events events are kept, as (key, event, size)
+        self._events = deque(maxlen=max_events)
+        self._last_key = -1
         self._ended = False
+        # whether the retained events are part of total_events and total_memory, see clear
+        self._counted = True
+        # ProtocolMetrics of the protocol, if any
+        self.metrics = metrics
+        # in "summary" mode events are aggregated and logged once when the session ends
+        if log_mode == "summary":
+            self.summary = SessionSummary(transcript_size)
+        elif log_mode == "event":
+            self.summary = None
+        else:
+            raise ValueError("Unknown session log mode: {0}".format(log_mode))
+
+    @property
+    def data(self):
+        """Retained events keyed by milliseconds elapsed since the session started."""
+        return {key: event_data for key, event_data, _ in self._events}
 
     def _dump_data(self, data):
         return {
@@ -65,16 +203,69 @@ class AttackSession(object):
         }
 
     def add_event(self, event_data):
-        sec_elapsed = (datetime.utcnow() - self.timestamp).total_seconds()
-        elapse_ms = int(sec_elapsed * 1000)
-        while elapse_ms in self.data:
-            elapse_ms += 1
-        self.data[elapse_ms] = event_data
-        # TODO: We should only log the session when it is finished
-        self.log_queue.put(self._dump_data(event_data))
+        self.last_activity = datetime.utcnow()
+        sec_elapsed = (self.last_activity - self.timestamp).total_seconds()
+        # keys are strictly increasing, events within the same millisecond get the next free one
+        key = max(int(sec_elapsed * 1000), self._last_key + 1)
+        self._last_key = key
+        self.event_count += 1
+        self._retain(key, event_data)
+        if self.metrics is not None and "request" in event_data:
+            self.metrics.requests.inc()
+            self.metrics.bytes_in.inc(_payload_length(event_data["request"]))
+            self.metrics.bytes_out.inc(_payload_length(event_data.get("response")))
+        if self.summary is not None:
+            self.summary.add(key, self.last_activity, event_data)
+            if not self._counted:
+                # the SessionManager removed the session and will not end it again, log the
+                # events of handlers still holding it right away instead of losing them
+                self._log_summary()
+        else:
+            self.log_queue.put(self._dump_data(event_data))
+
+    def _log_summary(self):
+        if self.summary is None or not self.summary.events:
+            return
+        self.log_queue.put(
+            self._dump_data(
+                {"type": "SESSION_SUMMARY", "summary": self.summary.to_dict()}
+            )
+        )
+        # a session can be picked up again after it ended, start a fresh summary
+        self.summary.reset()
+
+    def _retain(self, key, event_data):
+        events = self._events
+        if events.maxlen == 0:
+            return
+        if len(events) == events.maxlen:
+            _, _, evicted_size = events.popleft()
+            self.memory -= evicted_size
+            if self._counted:
+                AttackSession.total_memory -= evicted_size
+                AttackSession.total_events -= 1
+        size = _event_size(event_data)
+        events.append((key, event_data, size))
+        self.memory += size
+        if self._counted:
+            AttackSession.total_memory += size
+            AttackSession.total_events += 1
+
+    def clear(self):
+        """
+        Drop the retained events and leave the totals, the SessionManager calls this when it removes the session.
+        Handlers may still hold the session and add events, these are retained but no longer counted.
+        """
+        if self._counted:
+            AttackSession.total_memory -= self.memory
+            AttackSession.total_events -= len(self._events)
+            self._counted = False
+        self._events.clear()
+        self.memory = 0
 
     def dump(self):
         return self._dump_data(self.data)
 
     def set_ended(self):
         self._ended = True
+        self._log_summary()
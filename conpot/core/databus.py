@@ -15,24 +15,137 @@
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import ast
+import copy
+import functools
 import logging
 import inspect
+import itertools
+import time
 
 # this is needed because we use it in the xml.
 import random
 
 import gevent
 import gevent.event
-from lxml import etree
 
+from .template_cache import TemplateCache
 
 logger = logging.getLogger(__name__)
 
 
+def compile_key_value_mappings(dom):
+    """
+    Key value mappings of a template as (key, value type, value, param, ttl) tuples.
+
+    Values which are Python literals are evaluated here and have the value type "literal", so they are
+    not evaluated again when the compiled template is used.
+    """
+    mappings = []
+    for entry in dom.xpath("//core/databus/key_value_mappings/*"):
+        value = entry.xpath("./value/text()")[0].strip()
+        value_type = str(entry.xpath("./value/@type")[0])
+        if value_type == "value":
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                # expressions such as random.randint(0, 1) are evaluated every start
+                pass
+            else:
+                value_type = "literal"
+        params = entry.xpath("./value/@param")
+        ttl = entry.xpath("./value/@ttl")
+        mappings.append(
+            (
+                entry.attrib["name"],
+                value_type,
+                value,
+                str(params[0]) if params else None,
+                float(ttl[0]) if ttl else None,
+            )
+        )
+    return mappings
+
+
+class DatabusHandle(object):
+    """
+    Pre-resolved read accessor of a databus key, returned by Databus.handle.
+
+    get_value calls the provider of the value directly, without the lookups and logging of
+    Databus.get_value. The handle is rebound whenever the key is written.
+    """
+
+    __slots__ = ("key", "get_value")
+
+    def __init__(self, key):
+        self.key = key
+        self.get_value = None
+
+    def bind(self, item):
+        if getattr(item, "get_value", None):
+            self.get_value = item.get_value
+        elif hasattr(item, "__call__"):
+            self.get_value = item
+        else:
+            # a static value, repeat returns it without any lookup
+            self.get_value = itertools.repeat(item).__next__
+
+
+class CachedValue(object):
+    """
+    Wraps a value provider so it is called at most once every ttl seconds.
+
+    Readers arriving while the provider is being called wait for that call instead of calling it again.
+    """
+
+    def __init__(self, provider, ttl):
+        self.provider = provider
+        self.ttl = ttl
+        self._value = None
+        self._expires = None
+        self._refresh = None
+
+    def get_value(self):
+        if self._expires is not None and time.monotonic() < self._expires:
+            return self._value
+        if self._refresh is not None:
+            return self._refresh.get()
+        self._refresh = refresh = gevent.event.AsyncResult()
+        try:
+            if getattr(self.provider, "get_value", None):
+                value = self.provider.get_value()
+            else:
+                value = self.provider()
+        except Exception as e:
+            refresh.set_exception(e)
+            raise
+        else:
+            self._value = value
+            self._expires = time.monotonic() + self.ttl
+            refresh.set(value)
+            return value
+        finally:
+            self._refresh = None
+
+    def stop(self):
+        if getattr(self.provider, "stop", None):
+            self.provider.stop()
+
+
 class Databus(object):
-    def __init__(self):
+    def __init__(self, template_cache=None):
+        self.template_cache = template_cache or TemplateCache()
         self._data = {}
         self._observer_map = {}
+        # key -> sequence number of its last write, ordered from the oldest to the latest write
+        self._versions = {}
+        # incremented on every write, never reset
+        self.sequence = 0
+        # observed keys written since their observers were last notified, in write order
+        self._pending = {}
+        self._dispatcher = None
+        # key -> DatabusHandle, kept across resets so handles survive a re-initialization
+        self._handles = {}
         self.initialized = gevent.event.Event()
 
     # the idea here is that we can store both values and functions in the key value store
@@ -58,12 +171,57 @@ class Databus(object):
     def set_value(self, key, value):
         logger.debug("DataBus: Storing key: [%s] value: [%s]", key, value)
         self._data[key] = value
-        # notify observers
+        if key in self._handles:
+            self._handles[key].bind(value)
+        self.sequence += 1
+        # move the key to the end, changed_since relies on the write order
+        self._versions.pop(key, None)
+        self._versions[key] = self.sequence
+        # notify observers, writes until the dispatcher runs are notified once
         if key in self._observer_map:
-            gevent.spawn(self.notify_observers, key)
+            self._pending[key] = None
+            if self._dispatcher is None:
+                self._dispatcher = gevent.spawn(self._dispatch)
+
+    def handle(self, key):
+        """Return a DatabusHandle to read key from hot code paths."""
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = self._handles[key] = DatabusHandle(key)
+            if key in self._data:
+                handle.bind(self._data[key])
+            else:
+                # bound once the key is set, until then reading fails like get_value
+                handle.get_value = functools.partial(self.get_value, key)
+        return handle
+
+    def version(self, key):
+        """Sequence number of the last write to key, 0 if it was never written."""
+        return self._versions.get(key, 0)
+
+    def changed_since(self, sequence):
+        """Keys written after the given sequence number, latest write first."""
+        changed = []
+        for key in reversed(self._versions):
+            if self._versions[key] <= sequence:
+                break
+            changed.append(key)
+        return changed
+
+    def _dispatch(self):
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, {}
+                for key in pending:
+                    try:
+                        self.notify_observers(key)
+                    except Exception:
+                        logger.exception("DataBus: Observer of key [%s] failed", key)
+        finally:
+            self._dispatcher = None
 
     def notify_observers(self, key):
-        for cb in self._observer_map[key]:
+        for cb in self._observer_map.get(key, ()):
             cb(key)
 
     def observe_value(self, key, callback):
@@ -75,31 +233,34 @@ class Databus(object):
             self._observer_map[key] = []
         self._observer_map[key].append(callback)
 
-    def initialize(self, config_file):
+    def initialize(self, config_file, xsd_file=None):
         self.reset()
         assert self.initialized.isSet() is False
         logger.debug("Initializing databus using %s.", config_file)
-        dom = etree.parse(config_file)
-        entries = dom.xpath("//core/databus/key_value_mappings/*")
-        for entry in entries:
-            key = entry.attrib["name"]
-            value = entry.xpath("./value/text()")[0].strip()
-            value_type = str(entry.xpath("./value/@type")[0])
+        mappings = self.template_cache.compile(
+            config_file, compile_key_value_mappings, xsd_file
+        )
+        for key, value_type, value, params, ttl in mappings:
             assert key not in self._data
             logging.debug("Initializing %s with %s as a %s.", key, value, value_type)
-            if value_type == "value":
+            if value_type == "literal":
+                # the compiled template is shared, never hand out its lists
+                self.set_value(key, copy.deepcopy(value))
+            elif value_type == "value":
                 self.set_value(key, eval(value))
             elif value_type == "function":
                 namespace, _classname = value.rsplit(".", 1)
-                params = entry.xpath("./value/@param")
                 module = __import__(namespace, fromlist=[_classname])
                 _class = getattr(module, _classname)
-                if len(params) > 0:
+                if params is not None:
                     # eval param to list
-                    params = eval(params[0])
-                    self.set_value(key, _class(*(tuple(params))))
+                    params = eval(params)
+                    provider = _class(*(tuple(params)))
                 else:
-                    self.set_value(key, _class())
+                    provider = _class()
+                if ttl is not None:
+                    provider = CachedValue(provider, ttl)
+                self.set_value(key, provider)
             else:
                 raise Exception("Unknown value type: {0}".format(value_type))
         self.initialized.set()
@@ -113,5 +274,9 @@ class Databus(object):
                 value.stop()
 
         self._data.clear()
+        for handle in self._handles.values():
+            handle.get_value = functools.partial(self.get_value, handle.key)
         self._observer_map.clear()
+        self._versions.clear()
+        self._pending.clear()
         self.initialized.clear()
@@ -15,24 +15,125 @@
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import functools
 import json
 import logging
 import time
 
-from datetime import datetime
-
 import configparser
-from gevent.queue import Empty
+import gevent
+from gevent.queue import Empty, Full, Queue
 
-from conpot.core.loggers.sqlite_log import SQLiteLogger
-from conpot.core.loggers.hpfriends import HPFriendsLogger
-from conpot.core.loggers.syslog import SysLogger
-from conpot.core.loggers.taxii_log import TaxiiLogger
-from conpot.core.loggers.json_log import JsonLogger
+# the loggers are imported when they are enabled, some pull in large dependencies
 from .loggers.helpers import json_default
 
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES = ("block", "drop-oldest", "drop-newest")
+
+
+class LogSink(object):
+    """
+    Delivers events to a single logger from its own greenlet and bounded queue,
+    so a slow or dead logger only ever delays its own backlog.
+    """
+
+    _stop = object()
+
+    def __init__(
+        self,
+        name,
+        log,
+        close=None,
+        queue_size=10000,
+        overflow="drop-oldest",
+        metrics=None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "Invalid overflow policy for {0}: {1}".format(name, overflow)
+            )
+        self.name = name
+        self.log = log
+        self.close = close
+        self.overflow = overflow
+        self.queue = Queue(maxsize=queue_size)
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.lag = None
+        if metrics is not None:
+            self._register_metrics(metrics)
+        self.greenlet = gevent.spawn(self._consume)
+
+    def _register_metrics(self, metrics):
+        self.lag = metrics.histogram(
+            "conpot_sink_lag_seconds",
+            "Time events wait in a logger queue",
+            sink=self.name,
+        )
+        metrics.callback(
+            "conpot_sink_queue_length",
+            "Events waiting in a logger queue",
+            self.queue.qsize,
+            sink=self.name,
+        )
+        for counter in ("delivered", "dropped", "failed"):
+            metrics.callback(
+                "conpot_sink_{0}_total".format(counter),
+                "Events {0} by a logger".format(counter),
+                functools.partial(getattr, self, counter),
+                metric_type="counter",
+                sink=self.name,
+            )
+
+    def put(self, event):
+        item = (time.monotonic(), event)
+        if self.overflow == "block":
+            self.queue.put(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except Full:
+            self.dropped += 1
+            if self.overflow == "drop-oldest":
+                self.queue.get_nowait()
+                self.queue.put_nowait(item)
+
+    def _consume(self):
+        while True:
+            queued_at, event = self.queue.get()
+            if event is self._stop:
+                break
+            if self.lag is not None:
+                self.lag.observe(time.monotonic() - queued_at)
+            try:
+                self.log(event)
+            except Exception:
+                self.failed += 1
+                logger.exception("%s logger failed to log event", self.name)
+            else:
+                self.delivered += 1
+
+    def stop(self, timeout=10):
+        """Deliver the queued events, then close the logger."""
+        try:
+            self.queue.put((None, self._stop), timeout=timeout)
+        except Full:
+            pass
+        else:
+            self.greenlet.join(timeout)
+        self.greenlet.kill()
+        if self.close:
+            self.close()
+        logger.info(
+            "%s logger stopped: %s delivered, %s dropped, %s failed",
+            self.name,
+            self.delivered,
+            self.dropped,
+            self.failed,
+        )
+
 
 class LogWorker(object):
     def __init__(self, config, dom, session_manager, public_ip):
@@ -46,15 +147,41 @@ class LogWorker(object):
         self.public_ip = public_ip
         self.taxii_logger = None
 
+        try:
+            self.session_timeout = config.getfloat("session", "timeout")
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            self.session_timeout = 5
+        self._last_session_sweep = time.monotonic()
+
         if config.getboolean("sqlite", "enabled"):
-            self.sqlite_logger = SQLiteLogger()
+            from conpot.core.loggers.sqlite_log import SQLiteLogger
+
+            self.sqlite_logger = SQLiteLogger(
+                batch_size=config.getint("sqlite", "batch_size", fallback=100),
+                flush_interval=config.getint("sqlite", "flush_interval", fallback=1000),
+                synchronous=config.get("sqlite", "synchronous", fallback="NORMAL"),
+            )
 
         if config.getboolean("json", "enabled"):
+            from conpot.core.loggers.json_log import JsonLogger
+
             filename = config.get("json", "filename")
             sensorid = config.get("common", "sensorid")
-            self.json_logger = JsonLogger(filename, sensorid, public_ip)
+            self.json_logger = JsonLogger(
+                filename,
+                sensorid,
+                public_ip,
+                buffer_size=config.getint("json", "buffer_size", fallback=65536),
+                flush_interval=config.getint("json", "flush_interval", fallback=1000),
+                rotate_size=config.getint("json", "rotate_size", fallback=0),
+                rotate_interval=config.getint("json", "rotate_interval", fallback=0),
+                compress=config.getboolean("json", "compress", fallback=False),
+                encoder=config.get("json", "encoder", fallback="auto"),
+            )
 
         if config.getboolean("hpfriends", "enabled"):
+            from conpot.core.loggers.hpfriends import HPFriendsLogger
+
             host = config.get("hpfriends", "host")
             port = config.getint("hpfriends", "port")
             ident = config.get("hpfriends", "ident")
@@ -69,6 +196,8 @@ class LogWorker(object):
                 self.friends_feeder = None
 
         if config.getboolean("syslog", "enabled"):
+            from conpot.core.loggers.syslog import SysLogger
+
             host = config.get("syslog", "host")
             port = config.getint("syslog", "port")
             facility = config.get("syslog", "facility")
@@ -77,31 +206,47 @@ class LogWorker(object):
             self.syslog_client = SysLogger(host, port, facility, logdevice, logsocket)
 
         if config.getboolean("taxii", "enabled"):
+            from conpot.core.loggers.taxii_log import TaxiiLogger
+
             # TODO: support for certificates
             self.taxii_logger = TaxiiLogger(config, dom)
 
+        self.sinks = []
+        if self.friends_feeder:
+            self._add_sink(
+                "hpfriends",
+                lambda event: self.friends_feeder.log(
+                    json.dumps(event, default=json_default)
+                ),
+            )
+        if self.sqlite_logger:
+            self._add_sink("sqlite", self.sqlite_logger.log, self.sqlite_logger.close)
+        if self.syslog_client:
+            self._add_sink("syslog", self.syslog_client.log)
+        if self.taxii_logger:
+            self._add_sink("taxii", self.taxii_logger.log)
+        if self.json_logger:
+            self._add_sink("json", self.json_logger.log, self.json_logger.close)
+
         self.enabled = True
 
+    def _add_sink(self, name, log, close=None):
+        self.sinks.append(
+            LogSink(
+                name,
+                log,
+                close,
+                queue_size=self.config.getint(name, "queue_size", fallback=10000),
+                overflow=self.config.get(name, "overflow", fallback="drop-oldest"),
+                metrics=self.session_manager.metrics,
+            )
+        )
+
     def _process_sessions(self):
-        sessions = self.session_manager._sessions
-        try:
-            session_timeout = self.config.get("session", "timeout")
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            session_timeout = 5
-        for session in sessions:
-            if len(session.data) > 0:
-                sec_last_event = max(session.data) / 1000
-            else:
-                sec_last_event = 0
-            sec_session_start = time.mktime(session.timestamp.timetuple())
-            sec_now = time.mktime(datetime.utcnow().timetuple())
-            if (sec_now - (sec_session_start + sec_last_event)) >= float(
-                session_timeout
-            ):
-                # TODO: We need to close sockets in this case
-                logger.info("Session timed out: %s", session.id)
-                session.set_ended()
-                sessions.remove(session)
+        for session in self.session_manager.expire_sessions(self.session_timeout):
+            # TODO: We need to close sockets in this case
+            logger.info("Session timed out: %s", session.id)
+        self._last_session_sweep = time.monotonic()
 
     def start(self):
         self.enabled = True
@@ -111,23 +256,26 @@ class LogWorker(object):
             except Empty:
                 self._process_sessions()
             else:
-                if self.public_ip:
-                    event["public_ip"] = self.public_ip
+                # a busy queue never hits the timeout above, so sweep here as well
+                if time.monotonic() - self._last_session_sweep >= 2:
+                    self._process_sessions()
 
-                if self.friends_feeder:
-                    self.friends_feeder.log(json.dumps(event, default=json_default))
+                self._dispatch(event)
 
-                if self.sqlite_logger:
-                    self.sqlite_logger.log(event)
+        # end the remaining sessions so their summaries are logged as well
+        self.session_manager.expire_sessions(0)
+        while not self.log_queue.empty():
+            self._dispatch(self.log_queue.get_nowait())
 
-                if self.syslog_client:
-                    self.syslog_client.log(event)
+        for sink in self.sinks:
+            sink.stop()
 
-                if self.taxii_logger:
-                    self.taxii_logger.log(event)
+    def _dispatch(self, event):
+        if self.public_ip:
+            event["public_ip"] = self.public_ip
 
-                if self.json_logger:
-                    self.json_logger.log(event)
+        for sink in self.sinks:
+            sink.put(event)
 
     def stop(self):
         self.enabled = False
@@ -1,13 +1,22 @@
 from datetime import datetime
 import uuid
 
+PAYLOAD_TYPES = (bytes, bytearray, memoryview)
+
+
+def encode_payload(value):
+    """Events carry raw payloads, loggers hex encode them when they are written."""
+    if isinstance(value, PAYLOAD_TYPES):
+        return value.hex()
+    return value
+
 
 def json_default(obj):
     if isinstance(obj, datetime):
         return obj.isoformat()
     elif isinstance(obj, uuid.UUID):
         return str(obj)
-    elif isinstance(obj, bytes):
-        return str(obj)
+    elif isinstance(obj, PAYLOAD_TYPES):
+        return encode_payload(obj)
     else:
         return None
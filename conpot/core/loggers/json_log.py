@@ -16,15 +16,98 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 
+import gzip
 import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+
+import gevent
+from gevent.threadpool import ThreadPool
+
 from .helpers import json_default
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_json(data):
+    return json.dumps(data, default=json_default).encode("utf-8")
+
+
+def _encode_orjson(data):
+    return orjson.dumps(data, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_encoder(name="auto"):
+    """
+    Get a function serializing an event to bytes.
+    :param name: "json", "orjson" or "auto" to pick the fastest available encoder
+    """
+    if name == "auto":
+        name = "orjson" if orjson else "json"
+    if name == "json":
+        return _encode_json
+    if name == "orjson" and orjson:
+        return _encode_orjson
+    raise ValueError("JSON encoder not available: {0}".format(name))
+
+
+def _compress(path):
+    # runs in the compression thread
+    with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+
 
 class JsonLogger(object):
-    def __init__(self, filename, sensorid, public_ip):
-        self.fileHandle = open(filename, "a")
+    """
+    Writes one JSON document per line. Lines are buffered and written once
+    `buffer_size` bytes are pending or every `flush_interval` milliseconds.
+    The file is rotated once it reaches `rotate_size` bytes or is older than
+    `rotate_interval` seconds (0 disables either), rotated files are optionally
+    gzip compressed in a background thread.
+    """
+
+    def __init__(
+        self,
+        filename,
+        sensorid,
+        public_ip,
+        buffer_size=65536,
+        flush_interval=1000,
+        rotate_size=0,
+        rotate_interval=0,
+        compress=False,
+        encoder="auto",
+    ):
+        self.filename = filename
         self.sensorid = sensorid
         self.public_ip = public_ip
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval / 1000.0
+        self.rotate_size = rotate_size
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        if callable(encoder):
+            self.encode = encoder
+        else:
+            self.encode = get_encoder(encoder)
+        self._buffer = []
+        self._buffered = 0
+        self._compressor = ThreadPool(1) if compress else None
+        self._open()
+        self._flusher = gevent.spawn(self._flush_periodically)
+
+    def _open(self):
+        self.fileHandle = open(self.filename, "ab")
+        self._opened_at = time.monotonic()
 
     def log(self, event):
 
@@ -46,7 +129,61 @@ class JsonLogger(object):
             "response": event["data"].get("response"),
             "event_type": event["data"].get("type"),
         }
+        if "summary" in event["data"]:
+            data["summary"] = event["data"]["summary"]
+
+        line = self.encode(data) + b"\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.fileHandle.write(b"".join(self._buffer))
+            self.fileHandle.flush()
+            self._buffer = []
+            self._buffered = 0
+        if self._should_rotate():
+            self.rotate()
+
+    def _should_rotate(self):
+        if self.rotate_size and self.fileHandle.tell() >= self.rotate_size:
+            return True
+        if (
+            self.rotate_interval
+            and time.monotonic() - self._opened_at >= self.rotate_interval
+            and self.fileHandle.tell() > 0
+        ):
+            return True
+        return False
+
+    def rotate(self):
+        """Close the current file, move it aside and start a new one."""
+        self.fileHandle.close()
+        rotated = "{0}.{1}".format(
+            self.filename, datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+        )
+        suffix = 0
+        candidate = rotated
+        while os.path.exists(candidate) or os.path.exists(candidate + ".gz"):
+            suffix += 1
+            candidate = "{0}.{1}".format(rotated, suffix)
+        os.rename(self.filename, candidate)
+        self._open()
+        if self._compressor is not None:
+            self._compressor.spawn(_compress, candidate)
+        logger.debug("Rotated JSON log to %s", candidate)
+
+    def _flush_periodically(self):
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
 
-        json.dump(data, self.fileHandle, default=json_default)
-        self.fileHandle.write("\n")
-        self.fileHandle.flush()
+    def close(self):
+        self._flusher.kill()
+        self.flush()
+        self.fileHandle.close()
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor.kill()
@@ -16,14 +16,31 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 
+import logging
 import sqlite3
 import pwd
 import os
 import platform
 import grp
 
+import gevent
+from gevent.threadpool import ThreadPool
+
+from .helpers import encode_payload
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
 
 class SQLiteLogger(object):
+    """
+    Buffers events and writes them in batches from a dedicated OS thread, so that
+    commits (and their fsyncs) never block the gevent hub.
+    Batches are flushed every `batch_size` events or `flush_interval` milliseconds,
+    whichever comes first.
+    """
+
     def _chown_db(self, path, uid_name="nobody", gid_name="nogroup"):
         path = path.rpartition("/")[0]
         if not os.path.isdir(path):
@@ -37,15 +54,37 @@ class SQLiteLogger(object):
             wanted_gid = grp.getgrnam(gid_name)[2]
         os.chown(path, wanted_uid, wanted_gid)
 
-    def __init__(self, db_path="logs/conpot.db"):
+    def __init__(
+        self,
+        db_path="logs/conpot.db",
+        batch_size=100,
+        flush_interval=1000,
+        synchronous="NORMAL",
+    ):
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                "Invalid sqlite synchronous level: {0}".format(synchronous)
+            )
         self._chown_db(db_path)
-        self.conn = sqlite3.connect(db_path)
-        self._create_db()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval / 1000.0
+        self._buffer = []
+        # a single worker keeps the batches in order and owns the connection
+        self._pool = ThreadPool(1)
+        self.conn = self._pool.apply(self._connect, (db_path, synchronous))
+        self._flusher = gevent.spawn(self._flush_periodically)
+
+    def _connect(self, db_path, synchronous):
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous={0}".format(synchronous))
+        self._create_db(conn)
+        return conn
 
-    def _create_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS events
+    def _create_db(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("""CREATE TABLE IF NOT EXISTS events
             (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 session TEXT,
@@ -54,20 +93,49 @@ class SQLiteLogger(object):
                 protocol TEXT,
                 request TEXT,
                 response TEXT
-            )"""
-        )
+            )""")
+        conn.commit()
+
+    def _write(self, rows):
+        # runs in the worker thread
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO events(session, remote, protocol, request, response) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error:
+            logger.exception("Failed to write %s events to sqlite", len(rows))
+
+    def _flush_periodically(self):
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
 
     def log(self, event):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO events(session, remote, protocol, request, response) VALUES (?, ?, ?, ?, ?)",
+        """Buffer the event for the next batch, no row id is returned as the row is not written yet."""
+        self._buffer.append(
             (
                 str(event["id"]),
                 str(event["remote"]),
                 event["data_type"],
-                str(event["data"].get("request")),
-                str(event["data"].get("response")),
-            ),
+                str(encode_payload(event["data"].get("request"))),
+                str(encode_payload(event["data"].get("response"))),
+            )
         )
-        self.conn.commit()
-        return cursor.lastrowid
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Hand the buffered events to the writer thread."""
+        if self._buffer:
+            rows, self._buffer = self._buffer, []
+            self._pool.spawn(self._write, rows)
+
+    def close(self):
+        """Write all pending events and close the database."""
+        self._flusher.kill()
+        self.flush()
+        self._pool.join()
+        self._pool.apply(self.conn.close)
+        self._pool.kill()
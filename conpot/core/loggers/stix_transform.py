@@ -43,6 +43,7 @@ from cybox.common import Time as CyboxTime
 from datetime import datetime
 
 import conpot
+from .helpers import json_default
 
 CONPOT_NAMESPACE = "mushmush-conpot"
 CONPOT_NAMESPACE_URL = "http://mushmush.org/conpot"
@@ -167,7 +168,7 @@ class StixTransformer(object):
         indicator.add_observable(Observable(network_connection))
 
         artifact = Artifact()
-        artifact.data = json.dumps(event["data"])
+        artifact.data = json.dumps(event["data"], default=json_default)
         artifact.packaging.append(ZlibCompression())
         artifact.packaging.append(Base64Encoding())
         indicator.add_observable(Observable(artifact))
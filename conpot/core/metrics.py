@@ -0,0 +1,296 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Runtime metrics, exposed in the Prometheus text format.
+
+Metrics are created once and kept by the code that records them, so recording a value is a plain attribute
+update without any lookups. Values that already exist elsewhere (queue sizes, session counts) are registered
+as callbacks and only evaluated when the metrics are scraped.
+"""
+
+import bisect
+import functools
+import logging
+import time
+
+from gevent.pywsgi import WSGIServer
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+)
+
+
+class Counter(object):
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge(object):
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class Callback(object):
+    __slots__ = ("function",)
+
+    def __init__(self, function):
+        self.function = function
+
+    @property
+    def value(self):
+        return self.function()
+
+
+class Histogram(object):
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # the last slot counts observations above the largest bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class ProtocolMetrics(object):
+    """Metrics recorded by a protocol server, bound once per protocol."""
+
+    __slots__ = (
+        "connections",
+        "active_connections",
+        "requests",
+        "bytes_in",
+        "bytes_out",
+        "latency",
+    )
+
+    def __init__(self, registry, protocol):
+        self.connections = registry.counter(
+            "conpot_connections_total", "Accepted connections", protocol=protocol
+        )
+        self.active_connections = registry.gauge(
+            "conpot_active_connections", "Open connections", protocol=protocol
+        )
+        self.requests = registry.counter(
+            "conpot_requests_total", "Logged requests", protocol=protocol
+        )
+        self.bytes_in = registry.counter(
+            "conpot_request_bytes_total",
+            "Logged request payload bytes",
+            protocol=protocol,
+        )
+        self.bytes_out = registry.counter(
+            "conpot_response_bytes_total",
+            "Logged response payload bytes",
+            protocol=protocol,
+        )
+        self.latency = registry.histogram(
+            "conpot_request_duration_seconds",
+            "Time spent handling a request",
+            protocol=protocol,
+        )
+
+
+class MetricsRegistry(object):
+    def __init__(self):
+        # name -> [type, help, {labels: metric}]
+        self._families = {}
+        self._protocols = {}
+
+    def _get(self, name, help_text, metric_type, factory, labels):
+        family = self._families.setdefault(name, [metric_type, help_text, {}])
+        assert family[0] == metric_type, "{0} is a {1}".format(name, family[0])
+        key = tuple(sorted(labels.items()))
+        if key not in family[2]:
+            family[2][key] = factory()
+        return family[2][key]
+
+    def counter(self, name, help_text, **labels):
+        return self._get(name, help_text, "counter", Counter, labels)
+
+    def gauge(self, name, help_text, **labels):
+        return self._get(name, help_text, "gauge", Gauge, labels)
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, **labels):
+        return self._get(
+            name, help_text, "histogram", lambda: Histogram(buckets), labels
+        )
+
+    def callback(self, name, help_text, function, metric_type="gauge", **labels):
+        """Register a value that is only computed when the metrics are rendered."""
+        family = self._families.setdefault(name, [metric_type, help_text, {}])
+        family[2][tuple(sorted(labels.items()))] = Callback(function)
+
+    def protocol(self, name):
+        if name not in self._protocols:
+            self._protocols[name] = ProtocolMetrics(self, name)
+        return self._protocols[name]
+
+    @staticmethod
+    def _format_labels(labels, extra=()):
+        labels = tuple(labels) + tuple(extra)
+        if not labels:
+            return ""
+        return "{%s}" % ",".join('%s="%s"' % (k, v) for k, v in labels)
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, (metric_type, help_text, metrics) in sorted(self._families.items()):
+            lines.append("# HELP {0} {1}".format(name, help_text))
+            lines.append("# TYPE {0} {1}".format(name, metric_type))
+            for labels, metric in sorted(metrics.items()):
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + ("+Inf",), metric.counts):
+                        cumulative += count
+                        lines.append(
+                            "{0}_bucket{1} {2}".format(
+                                name,
+                                self._format_labels(labels, (("le", bound),)),
+                                cumulative,
+                            )
+                        )
+                    lines.append(
+                        "{0}_sum{1} {2}".format(
+                            name, self._format_labels(labels), metric.sum
+                        )
+                    )
+                    lines.append(
+                        "{0}_count{1} {2}".format(
+                            name, self._format_labels(labels), metric.count
+                        )
+                    )
+                else:
+                    lines.append(
+                        "{0}{1} {2}".format(
+                            name, self._format_labels(labels), metric.value
+                        )
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _protocol_metrics(protocol):
+    # imported here, conpot.core imports this module
+    from conpot import core
+
+    return core.get_metrics().protocol(protocol)
+
+
+def track_connections(protocol):
+    """Decorate a connection handler to count accepted and open connections."""
+
+    def decorator(handler):
+        metrics = _protocol_metrics(protocol)
+
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            metrics.connections.inc()
+            metrics.active_connections.inc()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                metrics.active_connections.dec()
+
+        return wrapper
+
+    return decorator
+
+
+def track_latency(protocol):
+    """Decorate a request handler to record how long it takes."""
+
+    def decorator(handler):
+        latency = _protocol_metrics(protocol).latency
+
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                latency.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsServer(object):
+    """Serves the registry over HTTP for Prometheus to scrape."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.server = None
+
+    def application(self, environ, start_response):
+        if environ["PATH_INFO"] not in ("/", "/metrics"):
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not Found\n"]
+        body = self.registry.render().encode("utf-8")
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+            ],
+        )
+        return [body]
+
+    def start(self, host, port):
+        self.server = WSGIServer((host, port), self.application, log=None)
+        logger.info("Metrics server started on: %s", (host, port))
+        self.server.serve_forever()
+
+    def stop(self):
+        if self.server:
+            self.server.stop()
@@ -0,0 +1,204 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Token bucket rate limiting of connections and datagrams, per source and across all sources.
+
+Buckets of individual sources are kept in a LRU table of bounded size, so a flood from spoofed addresses can
+evict buckets but never grow the table. Such a flood is still capped by the global bucket.
+"""
+
+import functools
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket(object):
+    """Allows ``rate`` events per second on average and bursts of up to ``burst`` events."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class ProtocolLimiter(object):
+    """Per source buckets of one protocol."""
+
+    def __init__(self, rate, burst, max_sources):
+        self.rate = rate
+        self.burst = burst
+        self.max_sources = max_sources
+        # source ip -> TokenBucket, least recently seen first
+        self._buckets = OrderedDict()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def bucket(self, source, now):
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            if len(self._buckets) >= self.max_sources:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[source] = TokenBucket(self.rate, self.burst, now)
+        else:
+            self._buckets.move_to_end(source)
+            bucket.refill(now)
+        return bucket
+
+
+class RateLimiter(object):
+    """
+    Decides whether a connection or datagram from a source is processed.
+
+    Limits are configured in the ``[rate_limit]`` section. ``rate`` and ``burst`` apply to every source of a
+    protocol and can be overridden per protocol with ``<protocol>_rate`` and ``<protocol>_burst``,
+    ``global_rate`` and ``global_burst`` apply to all traffic together. A rate of 0 disables the limit.
+    """
+
+    def __init__(self, metrics=None):
+        self.enabled = False
+        self.rate = 0
+        self.burst = 0
+        self.global_rate = 0
+        self.global_burst = 0
+        self.max_sources = 65536
+        self.config = None
+        self.metrics = metrics
+        self._global = None
+        self._protocols = {}
+        self._rejected = {}
+
+    def configure(self, config):
+        """Apply the [rate_limit] section of the configuration."""
+        self.config = config
+        self.enabled = config.getboolean("rate_limit", "enabled", fallback=False)
+        self.rate = config.getfloat("rate_limit", "rate", fallback=0)
+        # a burst of 0 defaults to one second worth of tokens
+        self.burst = config.getfloat("rate_limit", "burst", fallback=0) or max(
+            self.rate, 1
+        )
+        self.global_rate = config.getfloat("rate_limit", "global_rate", fallback=0)
+        self.global_burst = config.getfloat(
+            "rate_limit", "global_burst", fallback=0
+        ) or max(self.global_rate, 1)
+        self.max_sources = config.getint(
+            "rate_limit", "max_sources", fallback=self.max_sources
+        )
+        self.reset()
+
+    def reset(self):
+        self._global = None
+        if self.global_rate > 0:
+            self._global = TokenBucket(
+                self.global_rate, self.global_burst, time.monotonic()
+            )
+        self._protocols = {}
+
+    def _protocol(self, protocol):
+        # None is cached for protocols without a per source limit
+        if protocol not in self._protocols:
+            rate = self.rate
+            burst = self.burst
+            if self.config is not None and self.config.has_option(
+                "rate_limit", protocol + "_rate"
+            ):
+                rate = self.config.getfloat("rate_limit", protocol + "_rate")
+                burst = self.config.getfloat(
+                    "rate_limit", protocol + "_burst", fallback=0
+                ) or max(rate, 1)
+            limiter = None
+            if rate > 0:
+                limiter = ProtocolLimiter(rate, burst, self.max_sources)
+            self._protocols[protocol] = limiter
+        return self._protocols[protocol]
+
+    def rejected(self, protocol):
+        """Counter of rejected connections and datagrams of a protocol."""
+        if protocol not in self._rejected:
+            if self.metrics is None:
+                from conpot import core
+
+                self.metrics = core.get_metrics()
+            self._rejected[protocol] = self.metrics.counter(
+                "conpot_rate_limited_total",
+                "Connections and datagrams rejected by the rate limiter",
+                protocol=protocol,
+            )
+        return self._rejected[protocol]
+
+    def allow(self, protocol, source):
+        """Take a token for source, return False if the source or all traffic is over its limit."""
+        if not self.enabled:
+            return True
+        now = time.monotonic()
+        limiter = self._protocol(protocol)
+        bucket = None
+        if limiter is not None:
+            bucket = limiter.bucket(source, now)
+            if bucket.tokens < 1:
+                self.rejected(protocol).inc()
+                return False
+        if self._global is not None:
+            self._global.refill(now)
+            if self._global.tokens < 1:
+                self.rejected(protocol).inc()
+                return False
+            self._global.tokens -= 1
+        if bucket is not None:
+            bucket.tokens -= 1
+        return True
+
+
+def rate_limited(protocol):
+    """
+    Decorate a connection handler ``handle(sock, address)`` or datagram handler ``handle(data, address)``.
+
+    Rejected connections are closed and rejected datagrams dropped before the handler runs, so they are
+    neither processed nor logged.
+    """
+
+    def decorator(handler):
+        # imported here, conpot.core imports this module
+        from conpot import core
+
+        limiter = core.get_rate_limiter()
+
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            # the handler may be a method or a classmethod, the address is the last positional argument.
+            # It is None for servers that hand over a whole UDP socket rather than single datagrams,
+            # these limit every datagram they receive themselves.
+            address = args[-1]
+            if address is None or limiter.allow(protocol, address[0]):
+                return handler(*args, **kwargs)
+            if hasattr(args[-2], "close"):
+                args[-2].close()
+
+        return wrapper
+
+    return decorator
@@ -15,23 +15,80 @@
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import heapq
+import itertools
+from datetime import datetime, timedelta
+
 from gevent.queue import Queue
 
 from conpot.core.attack_session import AttackSession
+from conpot.core.metrics import MetricsRegistry
 
 
 # one instance only
 class SessionManager:
-    def __init__(self):
-        self._sessions = []
+    def __init__(self, metrics=None):
+        # (protocol, source_ip) -> AttackSession
+        self._sessions = {}
+        # min-heap of (last_activity, seq, session) used to find idle sessions
+        # without walking the whole session table. Entries are not updated when a
+        # session sees new activity; stale entries are re-queued when they surface.
+        self._expiry = []
+        self._expiry_seq = itertools.count()
+        # number of events each session keeps for dump()
+        self.max_session_events = 1000
+        # "event" logs every event, "summary" logs one record per finished session
+        self.log_mode = "event"
+        self.summary_transcript = 0
         self.log_queue = Queue()
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.metrics.callback(
+            "conpot_sessions", "Sessions in the session table", lambda: len(self)
+        )
+        self.metrics.callback(
+            "conpot_log_queue_length",
+            "Events waiting for the log worker",
+            lambda: self.log_queue.qsize(),
+        )
+        self.metrics.callback(
+            "conpot_session_events",
+            "Events retained by all sessions",
+            lambda: AttackSession.total_events,
+        )
+        self.metrics.callback(
+            "conpot_session_memory_bytes",
+            "Estimated size of the events retained by all sessions",
+            lambda: AttackSession.total_memory,
+        )
+
+    def configure(self, config):
+        """Apply the [session] section of the configuration."""
+        self.max_session_events = config.getint(
+            "session", "max_events", fallback=self.max_session_events
+        )
+        log_mode = config.get("session", "log_mode", fallback=self.log_mode)
+        if log_mode not in ("event", "summary"):
+            raise ValueError("Unknown session log mode: {0}".format(log_mode))
+        # only the JSON logger records SESSION_SUMMARY events
+        if log_mode == "summary" and not config.getboolean(
+            "json", "enabled", fallback=False
+        ):
+            raise ValueError("Session log mode summary requires the JSON logger")
+        self.log_mode = log_mode
+        self.summary_transcript = config.getint(
+            "session", "summary_transcript", fallback=self.summary_transcript
+        )
+
+    def __len__(self):
+        return len(self._sessions)
 
     def _find_sessions(self, protocol, source_ip):
-        for session in self._sessions:
-            if session.protocol == protocol:
-                if session.source_ip == source_ip:
-                    return session
-        return None
+        return self._sessions.get((protocol, source_ip))
+
+    def _schedule_expiry(self, session):
+        heapq.heappush(
+            self._expiry, (session.last_activity, next(self._expiry_seq), session)
+        )
 
     def get_session(
         self,
@@ -51,10 +108,45 @@ class SessionManager:
                 destination_ip,
                 destination_port,
                 self.log_queue,
+                self.max_session_events,
+                self.log_mode,
+                self.summary_transcript,
+                self.metrics.protocol(protocol),
             )
-            self._sessions.append(attack_session)
+            self._sessions[(protocol, source_ip)] = attack_session
+            self._schedule_expiry(attack_session)
         return attack_session
 
+    def expire_sessions(self, timeout, now=None):
+        """
+        End and evict every session that has been idle for at least `timeout` seconds.
+        :param timeout: idle time in seconds after which a session is considered finished
+        :param now: utc datetime to compare against, defaults to datetime.utcnow()
+        :return: list of sessions that were expired
+        """
+        if now is None:
+            now = datetime.utcnow()
+        deadline = now - timedelta(seconds=float(timeout))
+        expired = []
+        while self._expiry and self._expiry[0][0] <= deadline:
+            last_activity, _, session = heapq.heappop(self._expiry)
+            if session.last_activity > last_activity:
+                # session was active since it was queued, look at it again later
+                self._schedule_expiry(session)
+                continue
+            key = (session.protocol, session.source_ip)
+            if self._sessions.get(key) is session:
+                del self._sessions[key]
+            session.set_ended()
+            session.clear()
+            expired.append(session)
+        return expired
+
     def purge_sessions(self):
         # there is no native purge/clear mechanism for gevent queues, so...
         self.log_queue = Queue()
+        # existing sessions still reference the old queue, drop them as well
+        for session in self._sessions.values():
+            session.clear()
+        self._sessions.clear()
+        self._expiry = []
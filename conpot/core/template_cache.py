@@ -0,0 +1,186 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Compiled templates.
+
+A template is validated against its schema once and compiled into plain Python objects by a compiler, a
+function taking the parsed template. Compiled templates are kept for the lifetime of the process and, when a
+cache on disk is enabled, stored in a private directory keyed by the path, modification time and content hash of the
+template. Later starts load them from there and skip the schema validation and XPath queries.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import tempfile
+
+from lxml import etree
+
+import conpot
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateError(Exception):
+    """Raised when a template does not validate against its schema."""
+
+
+class TemplateCache(object):
+    """
+    Compiles templates, the ``[template_cache]`` section of the configuration enables the cache on disk.
+
+    The cache directory holds pickles, entries are only loaded when the directory and the entry are owned by
+    the user running conpot and not writable by anyone else.
+    """
+
+    # bump when the format of the stored entries changes
+    FORMAT = 1
+
+    def __init__(self):
+        self.directory = None
+        self.hits = 0
+        self.misses = 0
+        # (path, compiler name) -> entry, see _stamp
+        self._compiled = {}
+        self._schemas = {}
+
+    def configure(self, config, temp_dir=None):
+        """
+        Apply the [template_cache] section of the configuration.
+
+        :param temp_dir: Directory holding the default cache directory, the system temp directory if None.
+        """
+        self.directory = None
+        if not config.getboolean("template_cache", "enabled", fallback=False):
+            return
+        directory = config.get("template_cache", "directory", fallback=None)
+        if not directory:
+            directory = os.path.join(
+                temp_dir or tempfile.gettempdir(),
+                "conpot_template_cache_{0}".format(os.getuid()),
+            )
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            self._check_private(os.stat(directory))
+        except OSError as e:
+            logger.warning("Template cache disabled, %s: %s", directory, e)
+        else:
+            self.directory = directory
+            logger.info("Using template cache at %s", directory)
+
+    def reset(self):
+        self._compiled.clear()
+        self._schemas.clear()
+        self.hits = self.misses = 0
+
+    def compile(self, template, compiler, xsd_file=None):
+        """
+        Return compiler(dom) of the template, validated against xsd_file first.
+
+        :param template: Path of the template.
+        :param compiler: Function turning the parsed template into picklable objects.
+        :param xsd_file: Optional path of the schema the template must validate against.
+        """
+        path = os.path.abspath(template)
+        with open(path, "rb") as f:
+            content = f.read()
+        stamp = self._stamp(path, content, xsd_file)
+        name = "{0}.{1}".format(compiler.__module__, compiler.__qualname__)
+
+        entry = self._compiled.get((path, name))
+        if entry is None or entry[0] != stamp:
+            entry = self._load(path, name, stamp)
+        if entry is None:
+            self.misses += 1
+            logger.debug("Compiling template %s with %s", path, name)
+            dom = etree.ElementTree(etree.fromstring(content, base_url=path))
+            if xsd_file:
+                self._validate(dom, xsd_file)
+            entry = (stamp, compiler(dom))
+            self._store(path, name, entry)
+        else:
+            self.hits += 1
+        self._compiled[(path, name)] = entry
+        return entry[1]
+
+    @classmethod
+    def _stamp(cls, path, content, xsd_file):
+        # entries are only valid for the same template, schema and conpot version
+        xsd_mtime = os.stat(xsd_file).st_mtime_ns if xsd_file else None
+        return (
+            cls.FORMAT,
+            conpot.__version__,
+            os.stat(path).st_mtime_ns,
+            hashlib.sha256(content).hexdigest(),
+            xsd_file and os.path.abspath(xsd_file),
+            xsd_mtime,
+        )
+
+    def _validate(self, dom, xsd_file):
+        xsd = self._schemas.get(xsd_file)
+        if xsd is None:
+            xsd = self._schemas[xsd_file] = etree.XMLSchema(etree.parse(xsd_file))
+        if not xsd.validate(dom):
+            raise TemplateError(str(xsd.error_log))
+
+    @staticmethod
+    def _check_private(st):
+        # anyone else able to write the cache could make conpot unpickle arbitrary objects
+        if st.st_uid != os.getuid():
+            raise PermissionError("owned by uid {0}".format(st.st_uid))
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError("writable by group or others")
+
+    def _filename(self, path, name):
+        key = hashlib.sha1("{0}\0{1}".format(path, name).encode()).hexdigest()
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _load(self, path, name, stamp):
+        if not self.directory:
+            return None
+        try:
+            self._check_private(os.stat(self.directory))
+            with open(self._filename(path, name), "rb") as f:
+                self._check_private(os.fstat(f.fileno()))
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring cached template of %s: %s", path, e)
+            return None
+        if entry[0] != stamp:
+            return None
+        return entry
+
+    def _store(self, path, name, entry):
+        if not self.directory:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            # atomic, so concurrent starts never read a partial entry
+            os.replace(tmp, self._filename(path, name))
+        except Exception as e:
+            logger.warning("Could not cache template %s: %s", path, e)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,122 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Event relay between worker processes and the process running the loggers.
+
+With ``--workers`` every worker serves the protocols on its own sessions. Instead of logging, a worker
+forwards the events of its sessions over a Unix socket to the main process, which feeds them into its
+log queue, so all workers share the same loggers.
+"""
+
+import logging
+import pickle
+import struct
+import time
+
+from gevent.event import Event
+from gevent.queue import Empty
+
+logger = logging.getLogger(__name__)
+
+# events are sent as a 4 byte length followed by the pickled event
+HEADER = struct.Struct("!I")
+
+
+class EventForwarder(object):
+    """Runs in a worker, sends the events of its sessions to the main process."""
+
+    def __init__(self, session_manager, sock, session_timeout=30):
+        self.session_manager = session_manager
+        self.log_queue = session_manager.log_queue
+        self.sock = sock
+        self.session_timeout = session_timeout
+        self.forwarded = 0
+        self._last_session_sweep = time.monotonic()
+        self.enabled = True
+
+    def _process_sessions(self):
+        for session in self.session_manager.expire_sessions(self.session_timeout):
+            logger.info("Session timed out: %s", session.id)
+        self._last_session_sweep = time.monotonic()
+
+    def _send(self, event):
+        data = pickle.dumps(event, pickle.HIGHEST_PROTOCOL)
+        self.sock.sendall(HEADER.pack(len(data)) + data)
+        self.forwarded += 1
+
+    def start(self):
+        self.enabled = True
+        while self.enabled:
+            try:
+                event = self.log_queue.get(timeout=2)
+            except Empty:
+                self._process_sessions()
+            else:
+                if time.monotonic() - self._last_session_sweep >= 2:
+                    self._process_sessions()
+                self._send(event)
+
+        # end the remaining sessions, the main process logs them before it stops
+        self.session_manager.expire_sessions(0)
+        while not self.log_queue.empty():
+            self._send(self.log_queue.get_nowait())
+        self.sock.close()
+        logger.info("Forwarded %d events", self.forwarded)
+
+    def stop(self):
+        self.enabled = False
+
+
+class EventReceiver(object):
+    """Runs in the main process, puts the events of one worker into the log queue."""
+
+    def __init__(self, sock, log_queue):
+        self.sock = sock
+        self.log_queue = log_queue
+        self.received = 0
+        self._closed = Event()
+
+    def start(self):
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = self.sock.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                offset = 0
+                while len(buffer) - offset >= HEADER.size:
+                    (size,) = HEADER.unpack_from(buffer, offset)
+                    end = offset + HEADER.size + size
+                    if len(buffer) < end:
+                        break
+                    self.log_queue.put(pickle.loads(buffer[offset + HEADER.size : end]))
+                    self.received += 1
+                    offset = end
+                del buffer[:offset]
+        except OSError:
+            # closed by stop
+            pass
+        finally:
+            self._closed.set()
+
+    def stop(self, timeout=10):
+        # the worker closes its end after forwarding its last events
+        if not self._closed.wait(timeout):
+            logger.warning("Worker did not finish forwarding its events")
+        self.sock.close()
@@ -20,6 +20,7 @@ from conpot.protocols.IEC104.DeviceDataController import addr_in_hex, inro_respo
 from conpot.protocols.IEC104.i_frames_check import *
 import conpot.core as conpot_core
 from .frames import *
+from conpot.core.metrics import track_latency
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +30,11 @@ class IEC104(object):
         self.sock = sock
         self.address = address
         self.session_id = session_id
-        self.T_1 = conpot_core.get_databus().get_value("T_1")
+        databus = conpot_core.get_databus()
+        self.T_1 = databus.handle("T_1").get_value()
         self.timeout_t1 = gevent.Timeout(self.T_1, gevent.Timeout)
-        self.T_2 = conpot_core.get_databus().get_value("T_2")
-        self.w = conpot_core.get_databus().get_value("w")
+        self.T_2 = databus.handle("T_2").get_value()
+        self.w = databus.handle("w").get_value()
         self.device_data_controller = device_data_controller
         self.ssn = 0
         self.rsn = 0
@@ -44,6 +46,7 @@ class IEC104(object):
         self.send_buffer = list()
 
     # === u_frame
+    @track_latency("IEC104")
     def handle_u_frame(self, frame):
         container = u_frame(frame)
         try:
@@ -144,6 +147,7 @@ class IEC104(object):
             logger.warning("InvalidFieldValue: %s. (%s)", ex, self.session_id)
 
     # === s_frame
+    @track_latency("IEC104")
     def handle_s_frame(self, frame):
         container = s_frame(frame)
         try:
@@ -187,6 +191,7 @@ class IEC104(object):
             logger.warning("InvalidFieldValue: %s. (%s)", ex, self.session_id)
 
     # === i_frame
+    @track_latency("IEC104")
     def handle_i_frame(self, frame):
         container = i_frame(frame)
 
@@ -778,7 +783,7 @@ class frame_object_with_timer:
     def __init__(self, frame):
         self.frame = frame
         self.name = frame.name
-        self.T_1 = conpot_core.get_databus().get_value("T_1")
+        self.T_1 = conpot_core.get_databus().handle("T_1").get_value()
         self.__timeout_t1 = gevent.Timeout(self.T_1, gevent.Timeout)
 
     def restart_t1(self):
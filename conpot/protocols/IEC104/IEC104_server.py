@@ -23,6 +23,9 @@ from gevent.server import StreamServer
 import gevent
 from .errors import Timeout_t3
 from conpot.core.protocol_wrapper import conpot_protocol
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
+from conpot.utils.networking import stream_listener
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +34,15 @@ logger = logging.getLogger(__name__)
 class IEC104Server(object):
     def __init__(self, template, template_directory, args):
         self.timeout = conpot_core.get_databus().get_value("T_0")
+        self.t3 = conpot_core.get_databus().handle("T_3")
         self.device_data_controller = DeviceDataController(template)
         self.server_active = True
         self.server = None
         logger.info("IEC 104 Server up")
         self.template = template
 
+    @rate_limited("IEC104")
+    @track_connections("IEC104")
     def handle(self, sock, address):
         sock.settimeout(self.timeout)
         session = conpot_core.get_session(
@@ -56,9 +62,7 @@ class IEC104Server(object):
         iec104_handler = IEC104(self.device_data_controller, sock, address, session.id)
         try:
             while True:
-                timeout_t3 = gevent.Timeout(
-                    conpot_core.get_databus().get_value("T_3"), Timeout_t3
-                )
+                timeout_t3 = gevent.Timeout(self.t3.get_value(), Timeout_t3)
                 timeout_t3.start()
                 try:
                     try:
@@ -143,7 +147,7 @@ class IEC104Server(object):
 
     def start(self, host, port):
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
+        self.server = StreamServer(stream_listener(connection), self.handle)
         logger.info("IEC 60870-5-104 protocol server started on: %s", connection)
         self.server.serve_forever()
 
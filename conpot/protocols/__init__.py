@@ -14,34 +14,53 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
-from .IEC104.IEC104_server import IEC104Server
-from .bacnet.bacnet_server import BacnetServer
-from .enip.enip_server import EnipServer
-from .ftp.ftp_server import FTPServer
-from .guardian_ast.guardian_ast_server import GuardianASTServer
-from .http.web_server import HTTPServer
-from .ipmi.ipmi_server import IpmiServer
-from .kamstrup_management.kamstrup_management_server import KamstrupManagementServer
-from .kamstrup_meter.kamstrup_server import KamstrupServer
-from .modbus.modbus_server import ModbusServer
-from .s7comm.s7_server import S7Server
-from .snmp.snmp_server import SNMPServer
-from .tftp.tftp_server import TftpServer
+import importlib
+from collections.abc import Mapping
+
+
+class ProtocolRegistry(Mapping):
+    """
+    Maps protocol names to server classes, given as dotted paths.
+
+    A server module is only imported when its class is looked up, so protocols which are not enabled by the
+    template never load their dependencies.
+    """
+
+    def __init__(self, paths):
+        self.paths = dict(paths)
+        self._classes = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._classes[name]
+        except KeyError:
+            module_name, class_name = self.paths[name].rsplit(".", 1)
+            server_class = getattr(importlib.import_module(module_name), class_name)
+            self._classes[name] = server_class
+            return server_class
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
 
 
 # Defines protocol directory names inside template directories
-name_mapping = {
-    "bacnet": BacnetServer,
-    "enip": EnipServer,
-    "ftp": FTPServer,
-    "guardian_ast": GuardianASTServer,
-    "http": HTTPServer,
-    "IEC104": IEC104Server,
-    "ipmi": IpmiServer,
-    "kamstrup_management": KamstrupManagementServer,
-    "kamstrup_meter": KamstrupServer,
-    "modbus": ModbusServer,
-    "s7comm": S7Server,
-    "snmp": SNMPServer,
-    "tftp": TftpServer,
-}
+name_mapping = ProtocolRegistry(
+    {
+        "bacnet": "conpot.protocols.bacnet.bacnet_server.BacnetServer",
+        "enip": "conpot.protocols.enip.enip_server.EnipServer",
+        "ftp": "conpot.protocols.ftp.ftp_server.FTPServer",
+        "guardian_ast": "conpot.protocols.guardian_ast.guardian_ast_server.GuardianASTServer",
+        "http": "conpot.protocols.http.web_server.HTTPServer",
+        "IEC104": "conpot.protocols.IEC104.IEC104_server.IEC104Server",
+        "ipmi": "conpot.protocols.ipmi.ipmi_server.IpmiServer",
+        "kamstrup_management": "conpot.protocols.kamstrup_management.kamstrup_management_server.KamstrupManagementServer",
+        "kamstrup_meter": "conpot.protocols.kamstrup_meter.kamstrup_server.KamstrupServer",
+        "modbus": "conpot.protocols.modbus.modbus_server.ModbusServer",
+        "s7comm": "conpot.protocols.s7comm.s7_server.S7Server",
+        "snmp": "conpot.protocols.snmp.snmp_server.SNMPServer",
+        "tftp": "conpot.protocols.tftp.tftp_server.TftpServer",
+    }
+)
@@ -28,8 +28,10 @@ from bacpypes.errors import DecodingError
 import conpot.core as conpot_core
 from conpot.protocols.bacnet.bacnet_app import BACnetApp
 from conpot.core.protocol_wrapper import conpot_protocol
-from conpot.utils.networking import get_interface_ip
+from conpot.utils.networking import datagram_listener, get_interface_ip
 import logging
+from conpot.core.metrics import track_latency
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,8 @@ class BacnetServer(object):
         self.server = None  # Initialize later
         logger.info("Conpot Bacnet initialized using the %s template.", template)
 
+    @rate_limited("bacnet")
+    @track_latency("bacnet")
     def handle(self, data, address):
         session = conpot_core.get_session(
             "bacnet",
@@ -90,7 +94,7 @@ class BacnetServer(object):
 
     def start(self, host, port):
         connection = (host, port)
-        self.server = DatagramServer(connection, self.handle)
+        self.server = DatagramServer(datagram_listener(connection), self.handle)
         # start to init the socket
         self.server.start()
         self.server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
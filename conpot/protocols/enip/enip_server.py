@@ -30,6 +30,9 @@ from cpppo.server.enip import parser
 from cpppo.server.enip import device
 from conpot.core.protocol_wrapper import conpot_protocol
 import conpot.core as conpot_core
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
+from conpot.utils.networking import datagram_listener
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +126,8 @@ class EnipServer(object):
         stats["port"] = peer[1]
         return stats, connkey
 
+    @rate_limited("enip")
+    @track_connections("enip")
     def handle(self, conn, address, enip_process=None, delay=None, **kwds):
         """
         Handle an incoming connection
@@ -417,6 +422,12 @@ class EnipServer(object):
                                 brx = cpppo.timer()
                                 msg, frm = network.recvfrom(conn, timeout=wait)
                                 now = cpppo.timer()
+                                # handle() got the whole socket, datagrams are rate limited one by one
+                                if msg and not conpot_core.get_rate_limiter().allow(
+                                    "enip", frm[0]
+                                ):
+                                    msg = None
+                                    continue
                                 if not msg:
                                     if (
                                         kwds["server"]["control"]["done"]
@@ -615,11 +626,21 @@ class EnipServer(object):
         logger.debug(
             "ENIP server started on: %s:%d, mode: %s" % (host, port, self.config.mode)
         )
+        if udp_mode:
+            # cpppo binds its UDP socket without SO_REUSEPORT, serve it like server_main does
+            udp_sock = datagram_listener((host, port))
+            while not self.control["done"]:
+                self.control["disable"] = False
+                self.handle(udp_sock, None, **kwargs)
+            udp_sock.close()
+            return
         while not self.control["done"]:
+            # cpppo sets SO_REUSEPORT on the TCP listener it binds when reuse is set
             network.server_main(
                 address=(host, port),
                 target=self.handle,
                 kwargs=kwargs,
+                reuse=True,
                 udp=udp_mode,
                 tcp=tcp_mode,
             )
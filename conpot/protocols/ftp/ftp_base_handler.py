@@ -28,6 +28,8 @@ import os
 from conpot.protocols.ftp.ftp_utils import FTPPrivilegeException
 from conpot.utils.networking import sanitize_file_name
 from gevent import socket
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -210,6 +212,8 @@ class FTPHandlerBase(socketserver.BaseRequestHandler):
                 del self._sock
 
     @classmethod
+    @rate_limited("ftp")
+    @track_connections("ftp")
     def stream_server_handle(cls, sock, address):
         """Translate this class for use in a StreamServer"""
         request = cls.false_request()
@@ -12,6 +12,7 @@ from datetime import datetime
 import gevent
 from gevent import socket
 from conpot.core.filesystem import FilesystemError, FSOperationNotPermitted
+from conpot.core.metrics import track_latency
 from conpot.protocols.ftp.ftp_utils import FTPPrivilegeException, get_data_from_iter
 
 logger = logging.getLogger(__name__)
@@ -888,6 +889,7 @@ class FTPCommandChannel(FTPHandlerBase):
                 raise
 
     # - main command processor
+    @track_latency("ftp")
     def process_ftp_command(self):
         """
         Handle an incoming handle request - pick and item from the input_q, reads the contents of the message and
@@ -27,6 +27,7 @@ from conpot.protocols.ftp.ftp_utils import ftp_commands, FTPException
 from conpot.protocols.ftp.ftp_handler import FTPCommandChannel
 from conpot.core.protocol_wrapper import conpot_protocol
 import conpot.core as conpot_core
+from conpot.utils.networking import stream_listener
 
 logger = logging.getLogger(__name__)
 
@@ -307,7 +308,9 @@ class FTPServer(object):
     def start(self, host, port):
         self.handler.host, self.handler.port = host, port
         connection = (self.handler.host, self.handler.port)
-        self.server = StreamServer(connection, self.handler.stream_server_handle)
+        self.server = StreamServer(
+            stream_listener(connection), self.handler.stream_server_handle
+        )
         logger.info("FTP server started on: {}".format(connection))
         self.server.serve_forever()
 
@@ -26,7 +26,9 @@ import logging
 import random
 import conpot.core as conpot_core
 from conpot.core.protocol_wrapper import conpot_protocol
-from conpot.utils.networking import str_to_bytes
+from conpot.utils.networking import str_to_bytes, stream_listener
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,8 @@ class GuardianASTServer(object):
         self.fill_offset_time = datetime.datetime.utcnow()
         logger.info("Conpot GuardianAST initialized")
 
+    @rate_limited("guardian_ast")
+    @track_connections("guardian_ast")
     def handle(self, sock, addr):
         session = conpot_core.get_session(
             "guardian_ast",
@@ -60,50 +64,50 @@ class GuardianASTServer(object):
         fill_start = self.fill_offset_time - datetime.timedelta(minutes=313)
         fill_stop = self.fill_offset_time - datetime.timedelta(minutes=303)
         # Default Product names, change based off country needs
-        product1 = self.databus.get_value("product1").ljust(22)
-        product1 = self.databus.get_value("product1").ljust(22)
-        product2 = self.databus.get_value("product2").ljust(22)
-        product3 = self.databus.get_value("product3").ljust(22)
-        product4 = self.databus.get_value("product4").ljust(22)
+        product1 = self.databus.handle("product1").get_value().ljust(22)
+        product1 = self.databus.handle("product1").get_value().ljust(22)
+        product2 = self.databus.handle("product2").get_value().ljust(22)
+        product3 = self.databus.handle("product3").get_value().ljust(22)
+        product4 = self.databus.handle("product4").get_value().ljust(22)
 
         # Create random Numbers for the volumes
         #
         # this will crate an initial Volume and then the second value based
         # off the orig value.
-        vol1 = self.databus.get_value("vol1")
+        vol1 = self.databus.handle("vol1").get_value()
         vol1tc = random.randint(vol1, vol1 + 200)
-        vol2 = self.databus.get_value("vol2")
+        vol2 = self.databus.handle("vol2").get_value()
         vol2tc = random.randint(vol2, vol2 + 200)
-        vol3 = self.databus.get_value("vol3")
+        vol3 = self.databus.handle("vol3").get_value()
         vol3tc = random.randint(vol3, vol3 + 200)
-        vol4 = self.databus.get_value("vol4")
+        vol4 = self.databus.handle("vol4").get_value()
         vol4tc = random.randint(vol4, vol4 + 200)
 
         # unfilled space ULLAGE
-        ullage1 = str(self.databus.get_value("ullage1"))
-        ullage2 = str(self.databus.get_value("ullage2"))
-        ullage3 = str(self.databus.get_value("ullage3"))
-        ullage4 = str(self.databus.get_value("ullage3"))
+        ullage1 = str(self.databus.handle("ullage1").get_value())
+        ullage2 = str(self.databus.handle("ullage2").get_value())
+        ullage3 = str(self.databus.handle("ullage3").get_value())
+        ullage4 = str(self.databus.handle("ullage3").get_value())
 
         # Height of tank
-        height1 = str(self.databus.get_value("height1")).ljust(5, "0")
-        height2 = str(self.databus.get_value("height2")).ljust(5, "0")
-        height3 = str(self.databus.get_value("height3")).ljust(5, "0")
-        height4 = str(self.databus.get_value("height4")).ljust(5, "0")
+        height1 = str(self.databus.handle("height1").get_value()).ljust(5, "0")
+        height2 = str(self.databus.handle("height2").get_value()).ljust(5, "0")
+        height3 = str(self.databus.handle("height3").get_value()).ljust(5, "0")
+        height4 = str(self.databus.handle("height4").get_value()).ljust(5, "0")
 
         # Water in tank, this is a variable that needs to be low
-        h2o1 = str(self.databus.get_value("h2o1")).ljust(4, "0")
-        h2o2 = str(self.databus.get_value("h2o2")).ljust(4, "0")
-        h2o3 = str(self.databus.get_value("h2o3")).ljust(4, "0")
-        h2o4 = str(self.databus.get_value("h2o4")).ljust(4, "0")
+        h2o1 = str(self.databus.handle("h2o1").get_value()).ljust(4, "0")
+        h2o2 = str(self.databus.handle("h2o2").get_value()).ljust(4, "0")
+        h2o3 = str(self.databus.handle("h2o3").get_value()).ljust(4, "0")
+        h2o4 = str(self.databus.handle("h2o4").get_value()).ljust(4, "0")
 
         # Temperature of the tank, this will need to be between 50 - 60
-        temp1 = str(self.databus.get_value("temp1")).ljust(5, "0")
-        temp2 = str(self.databus.get_value("temp2")).ljust(5, "0")
-        temp3 = str(self.databus.get_value("temp3")).ljust(5, "0")
-        temp4 = str(self.databus.get_value("temp4")).ljust(5, "0")
+        temp1 = str(self.databus.handle("temp1").get_value()).ljust(5, "0")
+        temp2 = str(self.databus.handle("temp2").get_value()).ljust(5, "0")
+        temp3 = str(self.databus.handle("temp3").get_value()).ljust(5, "0")
+        temp4 = str(self.databus.handle("temp4").get_value()).ljust(5, "0")
 
-        station = self.databus.get_value("station_name")
+        station = self.databus.handle("station_name").get_value()
 
         # This function is to set-up up the message to be sent upon a successful I20100 command being sent
         # The final message is sent with a current date/time stamp inside of the main loop.
@@ -511,7 +515,7 @@ class GuardianASTServer(object):
 
     def start(self, host, port):
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
+        self.server = StreamServer(stream_listener(connection), self.handle)
         logger.info("GuardianAST server started on: {0}".format(connection))
         self.server.serve_forever()
 
@@ -29,7 +29,8 @@ import http.server
 import http.client
 from lxml import etree
 import conpot.core as conpot_core
-from conpot.utils.networking import str_to_bytes
+from conpot.core.metrics import track_connections, track_latency
+from conpot.utils.networking import set_reuse_port, str_to_bytes
 import gevent
 
 
@@ -161,6 +162,14 @@ class HTTPServer(http.server.BaseHTTPRequestHandler):
 
         return trailers
 
+    @track_connections("http")
+    def handle(self):
+        super().handle()
+
+    @track_latency("http")
+    def handle_one_request(self):
+        super().handle_one_request()
+
     def send_response(self, code, message=None):
         """Send the response header and log the response code.
         This function is overloaded to change the behaviour when
@@ -1143,6 +1152,14 @@ class SubHTTPServer(ThreadedHTTPServer):
                 else:
                     self.global_headers.append((header.attrib["name"], header.text))
 
+    def server_bind(self):
+        set_reuse_port(self.socket)
+        http.server.HTTPServer.server_bind(self)
+
+    def verify_request(self, request, client_address):
+        # connections over the rate limit are closed by socketserver before a handler is created
+        return conpot_core.get_rate_limiter().allow("http", client_address[0])
+
     def config_sanitize_tarpit(self, value):
 
         # checks tarpit value for being either a single int or float,
@@ -28,9 +28,11 @@ import collections
 from lxml import etree
 from conpot.protocols.ipmi.fakebmc import FakeBmc
 from conpot.protocols.ipmi.fakesession import FakeSession
-from conpot.utils.networking import chr_py3
+from conpot.utils.networking import chr_py3, set_reuse_port
 import conpot.core as conpot_core
 import logging as logger
+from conpot.core.metrics import track_latency
+from conpot.core.rate_limiter import rate_limited
 
 
 class IpmiServer(object):
@@ -92,6 +94,8 @@ class IpmiServer(object):
         csum &= 0xFF
         return csum
 
+    @rate_limited("ipmi")
+    @track_latency("ipmi")
     def handle(self, data, address):
         # make sure self.session exists
         if not address[0] in self.sessions.keys() or not hasattr(self, "session"):
@@ -521,6 +525,7 @@ class IpmiServer(object):
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        set_reuse_port(self.sock)
         self.sock.setblocking(True)
         self.sock.bind(connection)
         self.server = DatagramServer(self.sock, self.handle)
@@ -18,6 +18,7 @@
 import logging
 
 from . import commands
+from conpot.core.metrics import track_latency
 
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ class CommandResponder(object):
 
         self.help_command = commands.HelpCommand(self.commands)
 
+    @track_latency("kamstrup_management_protocol")
     def respond(self, request):
         stripped_request = request.strip()
 
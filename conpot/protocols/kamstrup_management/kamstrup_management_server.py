@@ -21,7 +21,9 @@ from gevent.server import StreamServer
 import conpot.core as conpot_core
 from .command_responder import CommandResponder
 from conpot.core.protocol_wrapper import conpot_protocol
-from conpot.utils.networking import str_to_bytes
+from conpot.utils.networking import str_to_bytes, stream_listener
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,8 @@ class KamstrupManagementServer(object):
         logger.info("Kamstrup management protocol server initialized.")
         self.server = None
 
+    @rate_limited("kamstrup_management_protocol")
+    @track_connections("kamstrup_management_protocol")
     def handle(self, sock, address):
         session = conpot_core.get_session(
             "kamstrup_management_protocol",
@@ -95,7 +99,7 @@ class KamstrupManagementServer(object):
         self.host = host
         self.port = port
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
+        self.server = StreamServer(stream_listener(connection), self.handle)
         logger.info("Kamstrup management protocol server started on: %s", connection)
         self.server.serve_forever()
 
@@ -21,6 +21,7 @@ import copy
 from lxml import etree
 
 from .register import KamstrupRegister
+from conpot.core.metrics import track_latency
 
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class CommandResponder(object):
             assert name not in self.registers
             self.registers[name] = kamstrup_register
 
+    @track_latency("kamstrup_protocol")
     def respond(self, request):
         if request.communication_address != self.communication_address:
             logger.warning(
@@ -15,17 +15,18 @@
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
-import binascii
 import logging
 import random
 import socket
 from gevent.server import StreamServer
 import gevent
 import conpot.core as conpot_core
-from conpot.utils.networking import chr_py3
+from conpot.utils.networking import chr_py3, stream_listener
 from .request_parser import KamstrupRequestParser
 from .command_responder import CommandResponder
 from conpot.core.protocol_wrapper import conpot_protocol
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,8 @@ class KamstrupServer(object):
         logger.info("Stopped pretending reboot")
         self.server_active = True
 
+    @rate_limited("kamstrup_protocol")
+    @track_connections("kamstrup_protocol")
     def handle(self, sock, address):
         session = conpot_core.get_session(
             "kamstrup_protocol",
@@ -87,17 +90,13 @@ class KamstrupServer(object):
                         session.add_event({"type": "CONNECTION_LOST"})
                         break
                     else:
-                        logdata = {
-                            "request": binascii.hexlify(
-                                bytearray(request.message_bytes)
-                            )
-                        }
+                        logdata = {"request": bytes(request.message_bytes)}
                         response = self.command_responder.respond(request)
                         # real Kamstrup meters has delay in this interval
                         gevent.sleep(random.uniform(0.24, 0.34))
                         if response:
                             serialized_response = response.serialize()
-                            logdata["response"] = binascii.hexlify(serialized_response)
+                            logdata["response"] = serialized_response
                             logger.info(
                                 "Kamstrup traffic from %s: %s (%s)",
                                 address[0],
@@ -120,7 +119,7 @@ class KamstrupServer(object):
         self.host = host
         self.port = port
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
+        self.server = StreamServer(stream_listener(connection), self.handle)
         logger.info("Kamstrup protocol server started on: %s", connection)
         self.server.serve_forever()
 
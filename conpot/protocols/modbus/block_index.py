@@ -0,0 +1,82 @@
+import logging
+from bisect import bisect_left, bisect_right
+
+from modbus_tk import defines
+from modbus_tk.modbus import ModbusError, OverlapModbusBlockError
+
+logger = logging.getLogger(__name__)
+
+
+class BlockIndex(object):
+    """
+    The blocks of one type of a slave, sorted by their starting address.
+
+    Replaces the per type block lists of modbus_tk.modbus.Slave. Blocks do not overlap, so the block holding an
+    address is the one with the greatest starting address not above it, found by bisecting the starting
+    addresses. Iterating yields the blocks in address order.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._blocks = []
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def add(self, block):
+        """Insert a block, raise OverlapModbusBlockError if it overlaps a block of the index."""
+        start = block.starting_address
+        i = bisect_left(self._starts, start)
+        # only the neighbours of the insert position can overlap the block
+        for neighbour in self._blocks[max(0, i - 1) : i + 1]:
+            if neighbour.is_in(start, block.size):
+                raise OverlapModbusBlockError(
+                    "Overlap block at %d size %d"
+                    % (neighbour.starting_address, neighbour.size)
+                )
+        self._starts.insert(i, start)
+        self._blocks.insert(i, block)
+
+    def remove(self, block):
+        i = bisect_left(self._starts, block.starting_address)
+        if i == len(self._blocks) or self._blocks[i] is not block:
+            raise ValueError("block at %d is not indexed" % block.starting_address)
+        del self._starts[i]
+        del self._blocks[i]
+
+    def get(self, starting_address):
+        """Return the block starting at the address, None if there is none."""
+        i = bisect_left(self._starts, starting_address)
+        if i < len(self._starts) and self._starts[i] == starting_address:
+            return self._blocks[i]
+        return None
+
+    def find(self, address, length):
+        """
+        Return the block holding the addresses address to address + length and the offset of address in it.
+        Raise ModbusError(ILLEGAL_DATA_ADDRESS) if the range is not held by a single block.
+        """
+        i = bisect_right(self._starts, address) - 1
+        if i >= 0:
+            block = self._blocks[i]
+            offset = address - block.starting_address
+            if offset + length <= block.size:
+                return block, offset
+            if offset < block.size:
+                logger.debug(
+                    "Modbus range %d to %d exceeds the block at %d size %d",
+                    address,
+                    address + length - 1,
+                    block.starting_address,
+                    block.size,
+                )
+                raise ModbusError(defines.ILLEGAL_DATA_ADDRESS)
+        logger.debug(
+            "Modbus range %d to %d starts outside of the blocks",
+            address,
+            address + length - 1,
+        )
+        raise ModbusError(defines.ILLEGAL_DATA_ADDRESS)
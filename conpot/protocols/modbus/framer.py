@@ -0,0 +1,160 @@
+import struct
+
+# transaction id, protocol id, length of the unit id and the PDU
+MBAP_HEADER = struct.Struct(">HHH")
+# the length field counts the unit id and a PDU of at most 253 bytes
+MAX_MBAP_LENGTH = 254
+RECV_SIZE = 4096
+
+# an RTU frame is the slave id, a PDU of at most 253 bytes and the CRC
+MIN_RTU_LENGTH = 4
+MAX_RTU_LENGTH = 256
+# length of the RTU requests by function code, slave id and CRC included
+RTU_REQUEST_LENGTHS = {
+    0x01: 8,
+    0x02: 8,
+    0x03: 8,
+    0x04: 8,
+    0x05: 8,
+    0x06: 8,
+    0x07: 4,
+    0x08: 8,
+    0x0B: 4,
+    0x0C: 4,
+    0x11: 4,
+    0x16: 10,
+    0x18: 6,
+    0x2B: 7,
+}
+# offset of the byte count of the RTU requests carrying data, which follows it
+RTU_BYTE_COUNT_OFFSETS = {0x0F: 6, 0x10: 6, 0x17: 10}
+
+
+def _crc16_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC16_TABLE = _crc16_table()
+CRC = struct.Struct("<H")
+
+
+def crc16(data):
+    """Modbus CRC16 of data, the RTU frame carries it least significant byte first."""
+    crc = 0xFFFF
+    table = CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def check_datagram(data):
+    """Raise FramingError unless a Modbus/UDP datagram holds exactly one ADU."""
+    if len(data) <= MBAP_HEADER.size:
+        raise FramingError("Datagram of {0} bytes".format(len(data)))
+    _, _, length = MBAP_HEADER.unpack_from(data)
+    if not 0 < length <= MAX_MBAP_LENGTH or MBAP_HEADER.size + length != len(data):
+        raise FramingError(
+            "Invalid MBAP length {0} of a {1} byte datagram".format(length, len(data))
+        )
+
+
+class FramingError(Exception):
+    pass
+
+
+class TcpFramer(object):
+    """
+    Splits the byte stream of a Modbus/TCP connection into ADUs by the length field of their MBAP header.
+
+    Data is read in chunks into a buffer, a read returns every complete ADU it made available, so several
+    requests sent in one segment are answered in order and a request split over several segments waits for
+    its remainder.
+    """
+
+    def __init__(self, recv_size=RECV_SIZE):
+        self.buffer = bytearray()
+        self._chunk = memoryview(bytearray(recv_size))
+
+    def read(self, sock):
+        """Receive a chunk from the socket into the buffer, return the number of bytes received."""
+        received = sock.recv_into(self._chunk)
+        self.buffer += self._chunk[:received]
+        return received
+
+    def frames(self):
+        """Remove the complete ADUs from the buffer and return them."""
+        buffer = self.buffer
+        frames = []
+        offset = 0
+        while len(buffer) - offset >= MBAP_HEADER.size:
+            _, _, length = MBAP_HEADER.unpack_from(buffer, offset)
+            if not 0 < length <= MAX_MBAP_LENGTH:
+                raise FramingError("Invalid MBAP length {0}".format(length))
+            end = offset + MBAP_HEADER.size + length
+            if end > len(buffer):
+                break
+            frames.append(bytes(buffer[offset:end]))
+            offset = end
+        del buffer[:offset]
+        return frames
+
+
+class RtuFramer(TcpFramer):
+    """
+    Splits the byte stream of a Modbus RTU over TCP connection into frames.
+
+    RTU frames carry no length, it follows from the function code and the byte count of requests carrying data.
+    The frame of an unknown function code is taken to be all data received, as a serial device delimits frames
+    by silence on the line. Frames with an invalid CRC raise FramingError.
+    """
+
+    def frames(self):
+        """Remove the complete frames from the buffer and return them."""
+        buffer = self.buffer
+        frames = []
+        offset = 0
+        while len(buffer) - offset >= MIN_RTU_LENGTH:
+            function_code = buffer[offset + 1]
+            if function_code in RTU_REQUEST_LENGTHS:
+                length = RTU_REQUEST_LENGTHS[function_code]
+            elif function_code in RTU_BYTE_COUNT_OFFSETS:
+                count_offset = offset + RTU_BYTE_COUNT_OFFSETS[function_code]
+                if count_offset >= len(buffer):
+                    break
+                length = count_offset - offset + 1 + buffer[count_offset] + CRC.size
+            else:
+                length = len(buffer) - offset
+            if length > MAX_RTU_LENGTH:
+                raise FramingError("RTU frame of {0} bytes".format(length))
+            end = offset + length
+            if end > len(buffer):
+                break
+            frame = bytes(buffer[offset:end])
+            (crc,) = CRC.unpack_from(frame, length - CRC.size)
+            if crc != crc16(memoryview(frame)[: -CRC.size]):
+                raise FramingError("Invalid CRC of an RTU frame")
+            frames.append(frame)
+            offset = end
+        del buffer[:offset]
+        return frames
+
+
+class RtuQuery(object):
+    """Query of a Modbus RTU frame, splitting off slave id and CRC checked by the framer."""
+
+    def __init__(self):
+        self._slave_id = 0
+
+    def parse_request(self, request):
+        self._slave_id = request[0]
+        return self._slave_id, request[1 : -CRC.size]
+
+    def build_response(self, response_pdu):
+        response = bytes((self._slave_id,)) + response_pdu
+        return response + CRC.pack(crc16(response))
@@ -1,18 +1,33 @@
+import struct
+import sys
+from array import array
+
 from modbus_tk.hooks import call_hooks
 import conpot.core as conpot_core
+from .register_bank import RegisterBank, pack_bits, unpack_bits
 
 
 class ModbusBlockDatabusMediator(object):
     """This class represents the values for a range of addresses"""
 
-    def __init__(self, databus_key, starting_address):
+    def __init__(self, databus_key, starting_address, block_type=None):
         """
         Constructor: defines the address range and creates the array of values
         """
         self.starting_address = starting_address
         # self._data = [0]*size
         self.databus_key = databus_key
-        self.size = len(conpot_core.get_databus().get_value(self.databus_key))
+        self._value = conpot_core.get_databus().handle(self.databus_key)
+        values = self._value.get_value()
+        if block_type is not None and isinstance(values, list):
+            # keep the values of the template in a compact register bank
+            try:
+                values = RegisterBank.for_block(block_type, values)
+            except (OverflowError, TypeError):
+                pass
+            else:
+                conpot_core.get_databus().set_value(self.databus_key, values)
+        self.size = len(values)
 
     def is_in(self, starting_address, size):
         """
@@ -27,10 +42,37 @@ class ModbusBlockDatabusMediator(object):
 
     def __getitem__(self, r):
         """"""
-        return conpot_core.get_databus().get_value(self.databus_key).__getitem__(r)
+        return self._value.get_value().__getitem__(r)
 
     def __setitem__(self, r, v):
         """"""
         call_hooks("modbus.ModbusBlock.setitem", (self, r, v))
-        obj = conpot_core.get_databus().get_value(self.databus_key)
+        obj = self._value.get_value()
         return obj.__setitem__(r, v)
+
+    def read_registers(self, offset, count):
+        """Registers offset to offset + count as big endian bytes."""
+        values = self._value.get_value()
+        if isinstance(values, RegisterBank):
+            return values.pack_registers(offset, count)
+        return struct.pack(">%dH" % count, *values[offset : offset + count])
+
+    def read_bits(self, offset, count):
+        """Bits offset to offset + count packed into bytes."""
+        values = self._value.get_value()
+        if isinstance(values, RegisterBank):
+            return values.pack_bits(offset, count)
+        return pack_bits(
+            [1 if value else 0 for value in values[offset : offset + count]]
+        )
+
+    def write_registers(self, offset, data):
+        """Write big endian register values, starting at offset."""
+        values = array("H", data)
+        if sys.byteorder == "little":
+            values.byteswap()
+        self[offset : offset + len(values)] = values
+
+    def write_bits(self, offset, count, data):
+        """Write count bits packed into bytes, starting at offset."""
+        self[offset : offset + count] = unpack_bits(data, count)
@@ -1,13 +1,11 @@
 # modified by Sooky Peter <xsooky00@stud.fit.vutbr.cz>
 # Brno University of Technology, Faculty of Information Technology
-import struct
+import functools
 import socket
 import time
 import logging
 import sys
-import codecs
-from lxml import etree
-from gevent.server import StreamServer
+from gevent.server import DatagramServer, StreamServer
 
 import modbus_tk.modbus_tcp as modbus_tcp
 from modbus_tk import modbus
@@ -16,10 +14,77 @@ from modbus_tk import modbus
 import modbus_tk.defines as mdef
 from conpot.core.protocol_wrapper import conpot_protocol
 from conpot.protocols.modbus import slave_db
+from conpot.protocols.modbus.framer import (
+    FramingError,
+    RtuFramer,
+    RtuQuery,
+    TcpFramer,
+    check_datagram,
+)
 import conpot.core as conpot_core
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
+from conpot.utils.networking import (
+    datagram_listener,
+    get_interface_ip,
+    stream_listener,
+)
 
 logger = logging.getLogger(__name__)
 
+# local address each peer reaches a wildcard bound Modbus/UDP socket on, bounded as peers are spoofable
+_interface_ip = functools.lru_cache(maxsize=1024)(get_interface_ip)
+
+# object ids of the device identification objects of the template,
+# further extended objects are given by <Object id="...">
+DEVICE_ID_OBJECTS = {
+    "VendorName": 0x00,
+    "ProductCode": 0x01,
+    "MajorMinorRevision": 0x02,
+    "VendorUrl": 0x03,
+    "ProductName": 0x04,
+    "ModelName": 0x05,
+    "UserApplicationName": 0x06,
+}
+
+
+def compile_template(dom):
+    """Settings of a modbus template as plain Python objects."""
+    device_info = None
+    info_root = dom.xpath("//modbus/device_info")
+    if info_root:
+        device_info = {}
+        for element in info_root[0].iterchildren("*"):
+            if element.tag == "Object":
+                object_id = int(element.attrib["id"], 0)
+            else:
+                object_id = DEVICE_ID_OBJECTS[element.tag]
+            device_info[object_id] = element.text or ""
+    slaves = []
+    for s in dom.xpath("//modbus/slaves/*"):
+        blocks = [
+            (
+                b.attrib["name"],
+                b.xpath("./type/text()")[0],
+                b.xpath("./starting_address/text()")[0],
+                b.xpath("./size/text()")[0],
+            )
+            for b in s.xpath("./blocks/*")
+        ]
+        slaves.append((s.attrib["id"], blocks))
+    # transport name -> port of the listeners next to Modbus/TCP, None is the Modbus/TCP port
+    transports = {
+        t.tag: int(t.attrib["port"]) if "port" in t.attrib else None
+        for t in dom.xpath("//modbus/transports/*")
+    }
+    return {
+        "mode": dom.xpath("//modbus/mode/text()")[0],
+        "delay": dom.xpath("//modbus/delay/text()")[0],
+        "device_info": device_info,
+        "slaves": slaves,
+        "transports": transports,
+    }
+
 
 @conpot_protocol
 class ModbusServer(modbus.Server):
@@ -30,24 +95,29 @@ class ModbusServer(modbus.Server):
         self.host = None
         self.port = None
         self.server = None
+        self.udp_server = None
+        # bound Modbus/UDP address, the host is None for a wildcard bind
+        self.udp_address = None
+        self.rtu_server = None
 
-        databank = slave_db.SlaveBase(template)
+        settings = conpot_core.get_template_cache().compile(template, compile_template)
+        databank = slave_db.SlaveBase(settings["device_info"])
 
         # Constructor: initializes the server settings
         modbus.Server.__init__(self, databank if databank else modbus.Databank())
 
         # retrieve mode of connection and turnaround delay from the template
-        self._get_mode_and_delay(template)
+        self._get_mode_and_delay(settings)
 
         # not sure how this class remember slave configuration across
         # instance creation, i guess there are some
         # well hidden away class variables somewhere.
         self.remove_all_slaves()
-        self._configure_slaves(template)
+        self._configure_slaves(settings)
+        self.transports = settings.get("transports", {})
 
-    def _get_mode_and_delay(self, template):
-        dom = etree.parse(template)
-        self.mode = dom.xpath("//modbus/mode/text()")[0].lower()
+    def _get_mode_and_delay(self, settings):
+        self.mode = settings["mode"].lower()
         if self.mode not in ["tcp", "serial"]:
             logger.error(
                 "Conpot modbus initialization failed due to incorrect"
@@ -55,7 +125,7 @@ class ModbusServer(modbus.Server):
             )
             sys.exit(3)
         try:
-            self.delay = int(dom.xpath("//modbus/delay/text()")[0])
+            self.delay = int(settings["delay"])
         except ValueError:
             logger.error(
                 "Conpot modbus initialization failed due to incorrect"
@@ -63,19 +133,16 @@ class ModbusServer(modbus.Server):
             )
             sys.exit(3)
 
-    def _configure_slaves(self, template):
-        dom = etree.parse(template)
-        slaves = dom.xpath("//modbus/slaves/*")
+    def _configure_slaves(self, settings):
         try:
-            for s in slaves:
-                slave_id = int(s.attrib["id"])
+            for slave_id, blocks in settings["slaves"]:
+                slave_id = int(slave_id)
                 slave = self.add_slave(slave_id)
                 logger.debug("Added slave with id %s.", slave_id)
-                for b in s.xpath("./blocks/*"):
-                    name = b.attrib["name"]
-                    request_type = eval("mdef." + b.xpath("./type/text()")[0])
-                    start_addr = int(b.xpath("./starting_address/text()")[0])
-                    size = int(b.xpath("./size/text()")[0])
+                for name, request_type, start_addr, size in blocks:
+                    request_type = eval("mdef." + request_type)
+                    start_addr = int(start_addr)
+                    size = int(size)
                     slave.add_block(name, request_type, start_addr, size)
                     logger.debug(
                         "Added block %s to slave %s. " "(type=%s, start=%s, size=%s)",
@@ -90,7 +157,17 @@ class ModbusServer(modbus.Server):
         except Exception as e:
             logger.error(e)
 
+    @rate_limited("modbus")
+    @track_connections("modbus")
     def handle(self, sock, address):
+        self._handle_stream(sock, address, TcpFramer(), modbus_tcp.TcpQuery)
+
+    @rate_limited("modbus")
+    @track_connections("modbus")
+    def handle_rtu(self, sock, address):
+        self._handle_stream(sock, address, RtuFramer(), RtuQuery)
+
+    def _handle_stream(self, sock, address, framer, query_class):
         sock.settimeout(self.timeout)
 
         session = conpot_core.get_session(
@@ -109,55 +186,57 @@ class ModbusServer(modbus.Server):
 
         try:
             while True:
-                request = None
+                received = 0
                 try:
-                    request = sock.recv(7)
+                    received = framer.read(sock)
                 except Exception as e:
                     logger.error(
-                        "Exception occurred in ModbusServer.handle() "
+                        "Exception occurred in ModbusServer._handle_stream() "
                         "at sock.recv(): %s",
                         str(e),
                     )
 
-                if not request:
+                if not received:
                     logger.info("Modbus client disconnected. (%s)", session.id)
                     session.add_event({"type": "CONNECTION_LOST"})
                     break
-                if request.strip().lower() == "quit.":
+                if framer.buffer.strip().lower() == b"quit.":
                     logger.info("Modbus client quit. (%s)", session.id)
                     session.add_event({"type": "CONNECTION_QUIT"})
                     break
-                if len(request) < 7:
+                try:
+                    requests = framer.frames()
+                except FramingError as e:
                     logger.info(
-                        "Modbus client provided data {} but invalid.".format(session.id)
+                        "Modbus client provided invalid data: %s. (%s)", e, session.id
                     )
                     session.add_event({"type": "CONNECTION_TERMINATED"})
                     break
-                _, _, length = struct.unpack(">HHH", request[:6])
-                while len(request) < (length + 6):
-                    try:
-                        new_byte = sock.recv(1)
-                        request += new_byte
-                    except Exception:
-                        break
-                query = modbus_tcp.TcpQuery()
-
-                # logdata is a dictionary containing request, slave_id,
-                # function_code and response
-                response, logdata = self._databank.handle_request(
-                    query, request, self.mode
-                )
-                logdata["request"] = codecs.encode(request, "hex")
-                session.add_event(logdata)
-
-                logger.info(
-                    "Modbus traffic from %s: %s (%s)", address[0], logdata, session.id
-                )
-
-                if response:
-                    sock.sendall(response)
-                    logger.info("Modbus response sent to %s", address[0])
-                else:
+
+                # pipelined requests are answered in order with a single send
+                responses = []
+                terminate = False
+                for request in requests:
+                    query = query_class()
+
+                    # logdata is a dictionary containing request, slave_id,
+                    # function_code and response
+                    response, logdata = self._databank.handle_request(
+                        query, request, self.mode
+                    )
+                    logdata["request"] = request
+                    session.add_event(logdata)
+
+                    logger.info(
+                        "Modbus traffic from %s: %s (%s)",
+                        address[0],
+                        logdata,
+                        session.id,
+                    )
+
+                    if response:
+                        responses.append(response)
+                        continue
                     # TODO:
                     # response could be None under several different cases
 
@@ -169,31 +248,93 @@ class ModbusServer(modbus.Server):
                         logger.info(
                             "Modbus connection terminated with client %s.", address[0]
                         )
-                        session.add_event({"type": "CONNECTION_TERMINATED"})
-                        sock.shutdown(socket.SHUT_RDWR)
-                        sock.close()
-                        break
                     # Invalid addressing
                     else:
                         logger.info(
                             "Modbus client ignored due to invalid addressing." " (%s)",
                             session.id,
                         )
-                        session.add_event({"type": "CONNECTION_TERMINATED"})
-                        sock.shutdown(socket.SHUT_RDWR)
-                        sock.close()
-                        break
+                    session.add_event({"type": "CONNECTION_TERMINATED"})
+                    terminate = True
+                    break
+
+                if responses:
+                    sock.sendall(b"".join(responses))
+                    logger.info(
+                        "Modbus %d response(s) sent to %s", len(responses), address[0]
+                    )
+                if terminate:
+                    sock.shutdown(socket.SHUT_RDWR)
+                    sock.close()
+                    break
         except socket.timeout:
             logger.debug("Socket timeout, remote: %s. (%s)", address[0], session.id)
             session.add_event({"type": "CONNECTION_LOST"})
 
+    @rate_limited("modbus")
+    def handle_datagram(self, data, address):
+        try:
+            check_datagram(data)
+        except FramingError as e:
+            logger.info("Modbus/UDP datagram from %s ignored: %s", address[0], e)
+            return
+        session = conpot_core.get_session(
+            "modbus",
+            address[0],
+            address[1],
+            self.udp_address[0] or _interface_ip(address[0]),
+            self.udp_address[1],
+        )
+        # the datagram server calls this without spawning a greenlet, nothing here may block
+        response, logdata = self._databank.handle_request(
+            modbus_tcp.TcpQuery(), data, self.mode
+        )
+        logdata["request"] = data
+        session.add_event(logdata)
+        logger.info(
+            "Modbus/UDP traffic from %s: %s (%s)", address[0], logdata, session.id
+        )
+        # no response to broadcasts and invalid addressing
+        if response:
+            self.udp_server.sendto(response, address)
+
     def start(self, host, port):
         self.host = host
         self.port = port
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
-        logger.info("Modbus server started on: %s", connection)
+        self.server = StreamServer(stream_listener(connection), self.handle)
+        self.server.start()
+        logger.info("Modbus server started on: %s", (host, self.server.server_port))
+        if "udp" in self.transports:
+            udp_port = self.transports["udp"]
+            if udp_port is None:
+                udp_port = self.server.server_port
+            self.udp_server = DatagramServer(
+                datagram_listener((host, udp_port)), self.handle_datagram, spawn=None
+            )
+            udp_host = self.udp_server.address[0]
+            if udp_host == "0.0.0.0":
+                # datagrams reach a wildcard bind on any address, looked up per peer
+                udp_host = None
+            self.udp_address = (udp_host, self.udp_server.server_port)
+            self.udp_server.start()
+            logger.info(
+                "Modbus/UDP server started on: %s", (host, self.udp_server.server_port)
+            )
+        if "rtu_over_tcp" in self.transports:
+            self.rtu_server = StreamServer(
+                stream_listener((host, self.transports["rtu_over_tcp"])),
+                self.handle_rtu,
+            )
+            self.rtu_server.start()
+            logger.info(
+                "Modbus RTU over TCP server started on: %s",
+                (host, self.rtu_server.server_port),
+            )
         self.server.serve_forever()
 
     def stop(self):
+        for server in (self.udp_server, self.rtu_server):
+            if server is not None:
+                server.stop()
         self.server.stop()
@@ -0,0 +1,87 @@
+import sys
+from array import array
+
+from modbus_tk import defines
+
+# maps the value of every byte to "0" or "1", used to pack bits with int()
+_BIT_DIGITS = b"0" + b"1" * 255
+
+
+def pack_bits(values):
+    """
+    Pack a bytes-like object of bit values into Modbus coil bytes, least significant bit first.
+    Every non zero value is a set bit.
+    """
+    if not values:
+        return b""
+    digits = bytes(values).translate(_BIT_DIGITS)[::-1]
+    return int(digits, 2).to_bytes((len(values) + 7) // 8, "little")
+
+
+def unpack_bits(data, count):
+    """Unpack count bits from Modbus coil bytes, least significant bit first."""
+    bits = int.from_bytes(data, "little")
+    return [(bits >> i) & 1 for i in range(count)]
+
+
+class RegisterBank(object):
+    """
+    Compact storage of the values of a Modbus block, held in the databus.
+
+    Registers are stored as unsigned 16 bit values in an ``array('H')``, coils and discrete inputs as one
+    byte per bit in an ``array('B')``. Slices are read and written in a single operation and ``memoryview``
+    exposes the underlying buffer.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, typecode, values=()):
+        self._values = array(typecode, values)
+
+    @classmethod
+    def for_block(cls, block_type, values):
+        if block_type in (defines.COILS, defines.DISCRETE_INPUTS):
+            return cls("B", (1 if value else 0 for value in values))
+        return cls("H", values)
+
+    @property
+    def typecode(self):
+        return self._values.typecode
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, r):
+        return self._values[r]
+
+    def __setitem__(self, r, v):
+        if isinstance(r, slice):
+            if not isinstance(v, array) or v.typecode != self.typecode:
+                v = array(self.typecode, v)
+            if len(v) != len(range(*r.indices(len(self._values)))):
+                raise ValueError("Slice assignment would resize the register bank")
+        self._values[r] = v
+
+    def __eq__(self, other):
+        if isinstance(other, RegisterBank):
+            return self._values == other._values
+        return list(self._values) == list(other)
+
+    def __repr__(self):
+        return "RegisterBank({0!r}, {1!r})".format(self.typecode, self._values.tolist())
+
+    def memoryview(self):
+        return memoryview(self._values)
+
+    def pack_registers(self, offset, count):
+        """Registers offset to offset + count as big endian bytes."""
+        values = self._values[offset : offset + count]
+        if sys.byteorder == "little":
+            values.byteswap()
+        return values.tobytes()
+
+    def pack_bits(self, offset, count):
+        return pack_bits(self.memoryview()[offset : offset + count])
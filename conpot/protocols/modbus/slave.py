@@ -8,22 +8,104 @@ from modbus_tk.modbus import (
     InvalidArgumentError,
     DuplicatedKeyError,
     InvalidModbusBlockError,
-    OverlapModbusBlockError,
+    MissingKeyError,
 )
 from modbus_tk import defines, utils
+from modbus_tk.hooks import call_hooks
 from conpot.utils.networking import str_to_bytes
+from .block_index import BlockIndex
 from .modbus_block_databus_mediator import ModbusBlockDatabusMediator
 
 logger = logging.getLogger(__name__)
 
 
-class MBSlave(Slave):
+# MEI type of the read device identification function
+MEI_READ_DEVICE_ID = 0x0E
+# read device id codes of stream access, and the object ids each of them reads
+DEVICE_ID_CATEGORIES = {
+    0x01: range(0x00, 0x03),  # basic
+    0x02: range(0x00, 0x80),  # basic and regular
+    0x03: range(0x00, 0x100),  # basic, regular and extended
+}
+# read device id code of individual access
+DEVICE_ID_INDIVIDUAL = 0x04
+# objects of a response fit a 253 byte PDU after function code and the 6 byte header
+MAX_DEVICE_ID_OBJECTS_LENGTH = 253 - 1 - 6
+
+# repeated function code, byte count, slave id and run status (0xFF on, 0x00 off)
+REPORT_SLAVE_ID = struct.pack(">BBBB", 0x11, 1, 1, 0xFF)
+
+
+def compile_device_identification(device_info):
+    """
+    Responses to read device identification requests, keyed by read device id code and object id.
 
+    A stream starts at the key (code, None). Objects that do not fit the PDU follow in further responses, keyed by
+    the next object id the previous response announced.
+    """
+    objects = [
+        (object_id, str_to_bytes(device_info[object_id]))
+        for object_id in sorted(device_info)
+    ]
+    if any(object_id >= 0x80 for object_id, _ in objects):
+        conformity = 0x03
+    elif any(object_id >= 0x03 for object_id, _ in objects):
+        conformity = 0x02
+    else:
+        conformity = 0x01
+    # individual access is supported as well
+    conformity |= 0x80
+
+    def pack(code, selected, more_follows=0x00, next_object_id=0x00):
+        response = bytearray(
+            struct.pack(
+                ">BBBBBB",
+                MEI_READ_DEVICE_ID,
+                code,
+                conformity,
+                more_follows,
+                next_object_id,
+                len(selected),
+            )
+        )
+        for object_id, value in selected:
+            response += struct.pack(">BB", object_id, len(value))
+            response += value
+        return bytes(response)
+
+    responses = {}
+    for code, category in DEVICE_ID_CATEGORIES.items():
+        streamed = [item for item in objects if item[0] in category]
+        # the stream restarts at its first object, unless a request continues it
+        start, key = 0, None
+        while start < len(streamed):
+            end = start + 1
+            length = 2 + len(streamed[start][1])
+            while end < len(streamed):
+                length += 2 + len(streamed[end][1])
+                if length > MAX_DEVICE_ID_OBJECTS_LENGTH:
+                    break
+                end += 1
+            if end < len(streamed):
+                next_object_id = streamed[end][0]
+                responses[(code, key)] = pack(
+                    code, streamed[start:end], 0xFF, next_object_id
+                )
+                key = next_object_id
+            else:
+                responses[(code, key)] = pack(code, streamed[start:end])
+            start = end
+    for item in objects:
+        responses[(DEVICE_ID_INDIVIDUAL, item[0])] = pack(DEVICE_ID_INDIVIDUAL, [item])
+    return responses
+
+
+class MBSlave(Slave):
     """
     Customized Modbus slave representation extending modbus_tk.modbus.Slave
     """
 
-    def __init__(self, slave_id, dom):
+    def __init__(self, slave_id, device_info=None):
         Slave.__init__(self, slave_id)
         self._fn_code_map = {
             defines.READ_COILS: self._read_coils,
@@ -37,45 +119,119 @@ class MBSlave(Slave):
             defines.DEVICE_INFO: self._device_info,
             defines.REPORT_SLAVE_ID: self._report_slave_id,
         }
-        self.dom = dom
+        # the blocks of every type, indexed by address
+        self._memory = {block_type: BlockIndex() for block_type in self._memory}
+        # object id -> value of the device identification objects
+        self.device_info = device_info
+        # the identification responses are sent as compiled here
+        self._device_identification = (
+            compile_device_identification(device_info) if device_info else None
+        )
         logger.debug("Modbus slave (ID: %d) created" % self._id)
 
     def _report_slave_id(self, request_pdu):
         logger.debug("Requested to report slave ID (0x11)")
-        response = struct.pack(">B", 0x11)  # function code
-        response += struct.pack(">B", 1)  # byte count
-        response += struct.pack(">B", 1)  # slave id
-        response += struct.pack(">B", 0xFF)  # run status, OxFF on, 0x00 off
-        return response
+        return REPORT_SLAVE_ID
 
     def _device_info(self, request_pdu):
-        info_root = self.dom.xpath("//modbus/device_info")[0]
-        vendor_name = info_root.xpath("./VendorName/text()")[0]
-        product_code = info_root.xpath("./ProductCode/text()")[0]
-        major_minor_revision = info_root.xpath("./MajorMinorRevision/text()")[0]
-
-        (req_device_id, _) = struct.unpack(">BB", request_pdu[2:4])
-        device_info = {0: vendor_name, 1: product_code, 2: major_minor_revision}
-
-        # MEI type
-        response = struct.pack(">B", 0x0E)
-        # requested device id
-        response += struct.pack(">B", req_device_id)
-        # conformity level
-        response += struct.pack(">B", 0x01)
-        # followup data 0x00 is False
-        response += struct.pack(">B", 0x00)
-        # No next object id
-        response += struct.pack(">B", 0x00)
-        # Number of objects
-        response += struct.pack(">B", len(device_info))
-        for i in range(len(device_info)):
-            # Object id
-            response += struct.pack(">B", i)
-            # Object length
-            response += struct.pack(">B", len(device_info[i]))
-            response += str_to_bytes(device_info[i])
-        return response
+        if not self._device_identification:
+            raise ModbusError(defines.ILLEGAL_FUNCTION)
+
+        mei_type, code, object_id = struct.unpack(">BBB", request_pdu[1:4])
+        if mei_type != MEI_READ_DEVICE_ID:
+            raise ModbusError(defines.ILLEGAL_FUNCTION)
+        if code == DEVICE_ID_INDIVIDUAL:
+            response = self._device_identification.get((code, object_id))
+            if response is None:
+                raise ModbusError(defines.ILLEGAL_DATA_ADDRESS)
+            return response
+        if code not in DEVICE_ID_CATEGORIES:
+            raise ModbusError(defines.ILLEGAL_DATA_VALUE)
+        # an object id that does not continue a stream restarts it
+        response = self._device_identification.get((code, object_id))
+        return response or self._device_identification[(code, None)]
+
+    # The following override the per value implementations of modbus_tk.modbus.Slave,
+    # the block packs and unpacks all values of a request in one go.
+
+    def _read_registers(self, block_type, request_pdu):
+        """read the value of holding and input registers"""
+        starting_address, quantity_of_x = struct.unpack(">HH", request_pdu[1:5])
+
+        if (quantity_of_x <= 0) or (quantity_of_x > 125):
+            # maximum allowed size is 125 registers in one reading
+            raise ModbusError(defines.ILLEGAL_DATA_VALUE)
+
+        block, offset = self._get_block_and_offset(
+            block_type, starting_address, quantity_of_x
+        )
+        return struct.pack(">B", 2 * quantity_of_x) + block.read_registers(
+            offset, quantity_of_x
+        )
+
+    def _read_digital(self, block_type, request_pdu):
+        """read the value of coils and discrete inputs"""
+        starting_address, quantity_of_x = struct.unpack(">HH", request_pdu[1:5])
+
+        if (quantity_of_x <= 0) or (quantity_of_x > 2000):
+            # maximum allowed size is 2000 bits in one reading
+            raise ModbusError(defines.ILLEGAL_DATA_VALUE)
+
+        block, offset = self._get_block_and_offset(
+            block_type, starting_address, quantity_of_x
+        )
+        data = block.read_bits(offset, quantity_of_x)
+        return struct.pack(">B", len(data)) + data
+
+    def _write_multiple_registers(self, request_pdu):
+        """execute modbus function 16"""
+        call_hooks(
+            "modbus.Slave.handle_write_multiple_registers_request", (self, request_pdu)
+        )
+        starting_address, quantity_of_x, byte_count = struct.unpack(
+            ">HHB", request_pdu[1:6]
+        )
+        data = request_pdu[6 : 6 + byte_count]
+
+        if (
+            (quantity_of_x <= 0)
+            or (quantity_of_x > 123)
+            or (byte_count != (quantity_of_x * 2))
+            or (len(data) != byte_count)
+        ):
+            # maximum allowed size is 123 registers in one writing
+            raise ModbusError(defines.ILLEGAL_DATA_VALUE)
+
+        block, offset = self._get_block_and_offset(
+            defines.HOLDING_REGISTERS, starting_address, quantity_of_x
+        )
+        block.write_registers(offset, data)
+        return struct.pack(">HH", starting_address, quantity_of_x)
+
+    def _write_multiple_coils(self, request_pdu):
+        """execute modbus function 15"""
+        call_hooks(
+            "modbus.Slave.handle_write_multiple_coils_request", (self, request_pdu)
+        )
+        starting_address, quantity_of_x, byte_count = struct.unpack(
+            ">HHB", request_pdu[1:6]
+        )
+        data = request_pdu[6 : 6 + byte_count]
+
+        if (
+            (quantity_of_x <= 0)
+            or (quantity_of_x > 1968)
+            or (byte_count != (quantity_of_x + 7) // 8)
+            or (len(data) != byte_count)
+        ):
+            # maximum allowed size is 1968 coils
+            raise ModbusError(defines.ILLEGAL_DATA_VALUE)
+
+        block, offset = self._get_block_and_offset(
+            defines.COILS, starting_address, quantity_of_x
+        )
+        block.write_bits(offset, quantity_of_x, data)
+        return struct.pack(">HH", starting_address, quantity_of_x)
 
     def handle_request(self, request_pdu, broadcast=False):
         """
@@ -146,24 +302,27 @@ class MBSlave(Slave):
             if block_type not in self._memory:
                 raise InvalidModbusBlockError("Invalid block type %d" % block_type)
 
-            # check that the new block doesn't overlap an existing block
-            # it means that only 1 block per type must correspond to a given address
-            # for example: it must not have 2 holding registers at address 100
-            index = 0
-            for i in range(len(self._memory[block_type])):
-                block = self._memory[block_type][i]
-                if block.is_in(starting_address, size):
-                    raise OverlapModbusBlockError(
-                        "Overlap block at %d size %d"
-                        % (block.starting_address, block.size)
-                    )
-                if block.starting_address > starting_address:
-                    index = i
-                    break
-
-            # if the block is ok: register it
-            self._blocks[block_name] = (block_type, starting_address)
-            # add it in the 'per type' shortcut
-            self._memory[block_type].insert(
-                index, ModbusBlockDatabusMediator(block_name, starting_address)
+            # only 1 block per type must correspond to a given address, the index
+            # raises if the new block overlaps one of its neighbours
+            self._memory[block_type].add(
+                ModbusBlockDatabusMediator(block_name, starting_address, block_type)
             )
+            self._blocks[block_name] = (block_type, starting_address)
+
+    def remove_all_blocks(self):
+        """Remove all the blocks"""
+        with self._data_lock:  # thread-safe
+            self._blocks.clear()
+            for block_type in self._memory:
+                self._memory[block_type] = BlockIndex()
+
+    def _get_block(self, block_name):
+        """Find a block by its name and raise an exception if not found"""
+        if block_name not in self._blocks:
+            raise MissingKeyError("block {0} not found".format(block_name))
+        block_type, starting_address = self._blocks[block_name]
+        return self._memory[block_type].get(starting_address)
+
+    def _get_block_and_offset(self, block_type, address, length):
+        """returns the block and offset corresponding to the given address"""
+        return self._memory[block_type].find(address, length)
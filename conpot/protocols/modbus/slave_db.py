@@ -1,8 +1,6 @@
 # modified by Sooky Peter <xsooky00@stud.fit.vutbr.cz>
 # Brno University of Technology, Faculty of Information Technology
 import struct
-from lxml import etree
-import codecs
 from modbus_tk.modbus import (
     Databank,
     DuplicatedKeyError,
@@ -13,6 +11,7 @@ from modbus_tk import defines
 
 from conpot.protocols.modbus.slave import MBSlave
 import logging
+from conpot.core.metrics import track_latency
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +22,9 @@ class SlaveBase(Databank):
     Database keeping track of the slaves.
     """
 
-    def __init__(self, template):
+    def __init__(self, device_info=None):
         Databank.__init__(self)
-        self.dom = etree.parse(template)
+        self.device_info = device_info
 
     def add_slave(self, slave_id, unsigned=True, memory=None):
         """
@@ -34,11 +33,12 @@ class SlaveBase(Databank):
         if (slave_id < 0) or (slave_id > 255):
             raise Exception("Invalid slave id %d" % slave_id)
         if slave_id not in self._slaves:
-            self._slaves[slave_id] = MBSlave(slave_id, self.dom)
+            self._slaves[slave_id] = MBSlave(slave_id, self.device_info)
             return self._slaves[slave_id]
         else:
             raise DuplicatedKeyError("Slave %d already exists" % slave_id)
 
+    @track_latency("modbus")
     def handle_request(self, query, request, mode):
         """
         Handles a request. Return value is a tuple where element 0
@@ -86,10 +86,10 @@ class SlaveBase(Databank):
                     return (
                         None,
                         {
-                            "request": request_pdu.hex(),
+                            "request": request_pdu,
                             "slave_id": slave_id,
                             "function_code": func_code,
-                            "response": "",
+                            "response": b"",
                         },
                     )
                 elif 0 < slave_id <= 247:  # normal request handling
@@ -121,9 +121,9 @@ class SlaveBase(Databank):
         return (
             response,
             {
-                "request": codecs.encode(request_pdu, "hex"),
+                "request": request_pdu,
                 "slave_id": slave_id,
                 "function_code": function_code,
-                "response": codecs.encode(response_pdu, "hex"),
+                "response": response_pdu,
             },
         )
@@ -18,13 +18,13 @@
 import logging
 from gevent import select
 from gevent import socket as _socket
-import codecs
 import gevent
 from gevent.socket import socket
 from gevent.ssl import wrap_socket
 from gevent.server import StreamServer
 import abc
 import conpot.core as conpot_core
+from conpot.utils.networking import stream_listener
 
 
 logger = logging.getLogger(__name__)
@@ -71,10 +71,13 @@ class Proxy(object):
         connection = (host, port)
         if self.keyfile and self.certfile:
             server = StreamServer(
-                connection, self.handle, keyfile=self.keyfile, certfile=self.certfile
+                stream_listener(connection),
+                self.handle,
+                keyfile=self.keyfile,
+                certfile=self.certfile,
             )
         else:
-            server = StreamServer(connection, self.handle)
+            server = StreamServer(stream_listener(connection), self.handle)
         self.port = server.server_port
         logger.info(
             "%s proxy server started, listening on %s, proxy for: (%s, %s) using %s decoder.",
@@ -183,11 +186,9 @@ class Proxy(object):
         sock.close()
 
     def handle_in_data(self, data, sock, session):
-        # convert the data from bytes to hex string
-        hex_data = codecs.encode(data, "hex_codec")
-        session.add_event({"raw_request": hex_data, "raw_response": ""})
+        session.add_event({"raw_request": data, "raw_response": b""})
         logger.debug(
-            "Received %s bytes from outside to proxied service: %s", len(data), hex_data
+            "Received %s bytes from outside to proxied service: %s", len(data), data
         )
         if self.decoder:
             # TODO: data could be chunked, proxy needs to handle this
@@ -197,9 +198,8 @@ class Proxy(object):
         sock.send(data)
 
     def handle_out_data(self, data, sock, session):
-        hex_data = codecs.encode(data, "hex_codec")
-        session.add_event({"raw_request": "", "raw_response": hex_data})
-        logger.debug("Received %s bytes from proxied service: %s", len(data), hex_data)
+        session.add_event({"raw_request": b"", "raw_response": data})
+        logger.debug("Received %s bytes from proxied service: %s", len(data), data)
         if self.decoder:
             # TODO: data could be chunked, proxy needs to handle this
             decoded = self.decoder.decode_out(data)
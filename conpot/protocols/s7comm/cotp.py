@@ -2,10 +2,10 @@
 # by the amazing plcscan work by the ScadaStrangeLove group.
 # https://code.google.com/p/plcscan/source/browse/trunk/s7.py
 
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
 import struct
 from conpot.protocols.s7comm.exceptions import ParseException
-from conpot.utils.networking import str_to_bytes
+from conpot.protocols.s7comm.tpkt import pack_payload
 
 
 class COTP(object):
@@ -28,24 +28,37 @@ class COTP(object):
             #           n bytes     TPDU PAYLOAD
             #           x bytes     TRAILER (optional!), most probably containing S7.
 
+    def __len__(self):
+        header_size = 3 if self.tpdu_type == 0xF0 else 2
+        return header_size + len(self.payload) + len(self.trailer)
+
     def pack(self):
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return buffer
+
+    def pack_into(self, buffer, offset=0):
         if self.tpdu_type == 0xF0:
-            return (
-                pack("!BBB", self.packet_length, self.tpdu_type, self.opt_field)
-                + str_to_bytes(self.payload)
-                + str_to_bytes(self.trailer)
+            struct.pack_into(
+                "!BBB",
+                buffer,
+                offset,
+                self.packet_length,
+                self.tpdu_type,
+                self.opt_field,
             )
+            offset += 3
         else:
-            return (
-                pack("!BB", self.packet_length, self.tpdu_type)
-                + str_to_bytes(self.payload)
-                + str_to_bytes(self.trailer)
-            )
+            struct.pack_into("!BB", buffer, offset, self.packet_length, self.tpdu_type)
+            offset += 2
+        offset = pack_payload(self.payload, buffer, offset)
+        return pack_payload(self.trailer, buffer, offset)
 
     def parse(self, packet):
-
+        # payload and trailer are views of the packet, they are not copied
+        packet = memoryview(packet)
         try:
-            header = unpack("!BBB", packet[:3])
+            header = unpack_from("!BBB", packet)
         except struct.error:
             raise ParseException("s7comm", "malformed packet header structure")
 
@@ -90,8 +103,9 @@ class COTPConnectionPacket:
     def dissect(self, packet):
 
         # dissect fixed header
+        packet = memoryview(packet)
         try:
-            fixed_header = unpack("!HHB", packet[:5])
+            fixed_header = unpack_from("!HHB", packet)
         except struct.error:
             raise ParseException("s7comm", "malformed fixed header structure")
 
@@ -8,8 +8,11 @@ from struct import pack, unpack
 import struct
 import conpot.core as conpot_core
 from conpot.protocols.s7comm.exceptions import AssembleException, ParseException
+from conpot.core.loggers.helpers import PAYLOAD_TYPES
+from conpot.protocols.s7comm.tpkt import pack_payload
 from conpot.utils.networking import str_to_bytes
 import logging
+from conpot.core.metrics import track_latency
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,18 @@ logger = logging.getLogger(__name__)
 class S7(object):
     ssl_lists = {}
 
+    HEADER = struct.Struct("!BBHHHH")
+    # type 2 and 3 feature an additional RESULT INFORMATION header
+    RESULT_HEADER = struct.Struct("!BBHHHHH")
+
+    # maps valid pdu codes to name
+    pdu_mapping = {
+        0x01: "request_pdu",
+        0x02: "known_but_unindentified_pdu",
+        0x03: "response_pdu",
+        0x07: "system_status_list",
+    }
+
     def __init__(
         self,
         pdu_type=0,
@@ -32,38 +47,14 @@ class S7(object):
         self.reserved = reserved
         self.request_id = request_id
         # sometimes "parameters" happen to be of type int, and not a byte string
-        self.param_length = (
-            len(parameters) if isinstance(parameters, bytes) else len(str(parameters))
+        self.param_length = len(
+            parameters if isinstance(parameters, PAYLOAD_TYPES) else str(parameters)
         )
         self.data_length = len(data)
         self.result_info = result_info
         self.parameters = parameters
         self.data = data
 
-        # param codes (http://www.bj-ig.de/147.html):
-        # maps request types to methods
-        self.param_mapping = {
-            0x00: ("diagnostics", self.request_diagnostics),
-            0x04: ("read", self.request_not_implemented),
-            0x05: ("write", self.request_not_implemented),
-            0x1A: ("request_download", self.request_not_implemented),
-            0x1B: ("download_block", self.request_not_implemented),
-            0x1C: ("end_download", self.request_not_implemented),
-            0x1D: ("start_upload", self.request_not_implemented),
-            0x1E: ("upload", self.request_not_implemented),
-            0x1F: ("end_upload", self.request_not_implemented),
-            0x28: ("insert_block", self.request_not_implemented),
-            0x29: ("plc_stop", self.plc_stop_signal),
-        }
-
-        # maps valid pdu codes to name
-        self.pdu_mapping = {
-            0x01: set("request_pdu"),
-            0x02: set("known_but_unindentified_pdu"),
-            0x03: set("response_pdu"),
-            0x07: set("system_status_list"),
-        }
-
         self.data_bus = conpot_core.get_databus()
 
     def __len__(self):
@@ -72,54 +63,59 @@ class S7(object):
         else:
             return 10 + int(self.param_length) + int(self.data_length)
 
+    @track_latency("s7comm")
     def handle(self, current_client=None):
         if self.param in self.param_mapping:
             if self.param == 0x29:
-                return self.param_mapping[self.param][1](current_client)
+                return self.param_mapping[self.param][1](self, current_client)
             # direct execution to the correct method based on the param
-            return self.param_mapping[self.param][1]()
+            return self.param_mapping[self.param][1](self)
 
     def request_not_implemented(self):
         raise ParseException("s7comm", "request not implemented in honeypot yet.")
 
     def pack(self):
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return buffer
+
+    def pack_into(self, buffer, offset=0):
         if self.pdu_type not in self.pdu_mapping:
             raise AssembleException("s7comm", "invalid or unsupported pdu type")
         elif self.pdu_type in (2, 3):
-            # type 2 and 3 feature an additional RESULT INFORMATION header
-            return (
-                pack(
-                    "!BBHHHHH",
-                    self.magic,
-                    self.pdu_type,
-                    self.reserved,
-                    self.request_id,
-                    self.param_length,
-                    self.data_length,
-                    self.result_info,
-                )
-                + str_to_bytes(self.parameters)
-                + str_to_bytes(self.data)
+            self.RESULT_HEADER.pack_into(
+                buffer,
+                offset,
+                self.magic,
+                self.pdu_type,
+                self.reserved,
+                self.request_id,
+                self.param_length,
+                self.data_length,
+                self.result_info,
             )
+            offset += self.RESULT_HEADER.size
         else:
-            return (
-                pack(
-                    "!BBHHHH",
-                    self.magic,
-                    self.pdu_type,
-                    self.reserved,
-                    self.request_id,
-                    self.param_length,
-                    self.data_length,
-                )
-                + str_to_bytes(self.parameters)
-                + str_to_bytes(self.data)
+            self.HEADER.pack_into(
+                buffer,
+                offset,
+                self.magic,
+                self.pdu_type,
+                self.reserved,
+                self.request_id,
+                self.param_length,
+                self.data_length,
             )
+            offset += self.HEADER.size
+        offset = pack_payload(self.parameters, buffer, offset)
+        return pack_payload(self.data, buffer, offset)
 
     def parse(self, packet):
+        # parameters and data are views of the packet, they are not copied
+        packet = memoryview(packet)
         # dissect fixed header
         try:
-            fixed_header = unpack("!BBHHHH", packet[:10])
+            fixed_header = self.HEADER.unpack_from(packet)
         except struct.error:
             raise ParseException("s7comm", "malformed fixed packet header structure")
 
@@ -146,21 +142,14 @@ class S7(object):
         else:
             header_offset = 0
 
-        self.parameters = packet[
-            10 + header_offset : 10 + header_offset + self.param_length
-        ]
-        self.data = packet[
-            10
-            + header_offset
-            + self.param_length : 10
-            + header_offset
-            + self.param_length
-            + self.data_length
-        ]
+        param_offset = self.HEADER.size + header_offset
+        data_offset = param_offset + self.param_length
+        self.parameters = packet[param_offset:data_offset]
+        self.data = packet[data_offset : data_offset + self.data_length]
 
         try:
-            self.param = unpack("!B", self.parameters[:1])[0]
-        except:
+            self.param = self.parameters[0]
+        except IndexError:
             raise ParseException("s7comm", "invalid packet")
 
         return self
@@ -207,9 +196,8 @@ class S7(object):
                 pass
 
             # map request ssl to method
-            if hasattr(self, "request_ssl_{0}".format(data_ssl_id)):
-                m = getattr(self, "request_ssl_{0}".format(data_ssl_id))
-                _, params, data = m(data_ssl_index)
+            if data_ssl_id in self.ssl_mapping:
+                _, params, data = self.ssl_mapping[data_ssl_id](self, data_ssl_index)
                 return params, data
 
             chunk = chunk[4 + data_next_bytes :]
@@ -233,7 +221,9 @@ class S7(object):
                 28,  # 1  WORD   ( Length of payload after element count )
                 0x01,  # 1  WORD   ( 1 element follows )
                 data_ssl_index,  # 1  WORD   ( Data Index )
-                str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0001"])),
+                str_to_bytes(
+                    self.data_bus.handle(current_ssl["W#16#0001"]).get_value()
+                ),
                 # 10 WORDS  ( MLFB of component: 20 bytes => 19 chars + 1 blank (0x20) )
                 0x0,  # 1  WORD   ( RESERVED )
                 0x0,  # 1  WORD   ( Output state of component )
@@ -257,7 +247,9 @@ class S7(object):
                 28,  # 1  WORD   ( Length of payload after element count )
                 0x01,  # 1  WORD   ( 1 element follows )
                 data_ssl_index,  # 1  WORD   ( Data Index )
-                str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0006"])),
+                str_to_bytes(
+                    self.data_bus.handle(current_ssl["W#16#0006"]).get_value()
+                ),
                 # 10 WORDS  ( MLFB of component: 20 bytes => 19 chars + 1 blank (0x20) )
                 0x0,  # 1  WORD   ( RESERVED )
                 "V3",  # 1  WORD   ( 'V' and first digit of version number )
@@ -331,7 +323,7 @@ class S7(object):
             "!H24s8s",
             0x01,  # 1  WORD   ( Data Index )
             str_to_bytes(
-                self.data_bus.get_value(current_ssl["W#16#0001"])
+                self.data_bus.handle(current_ssl["W#16#0001"]).get_value()
             ),  # TODO: PADDING
             # 'System Name             ', # 12 WORDS  ( Name of automation system, padded with (0x00) )
             str_to_bytes(""),
@@ -341,7 +333,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H24s8s",
             0x02,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0002"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#0002"]).get_value()),
             # 12 WORDS  ( Name of component, padded with (0x00) )
             str_to_bytes(""),
         )  # 4  WORDS  ( RESERVED )
@@ -350,7 +342,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H32s",
             0x03,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0003"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#0003"]).get_value()),
         )
         # 16 WORDS  ( Name of plant, padded with (0x00) )
 
@@ -359,7 +351,7 @@ class S7(object):
             "!H26s6s",
             0x04,  # 1  WORD   ( Data Index )
             str_to_bytes(
-                self.data_bus.get_value(current_ssl["W#16#0004"])
+                self.data_bus.handle(current_ssl["W#16#0004"]).get_value()
             ),  # 13 WORDS  ( CONSTANT )
             str_to_bytes(""),
         )  # 3  WORDS  ( RESERVED )
@@ -368,7 +360,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H24s8s",
             0x05,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0005"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#0005"]).get_value()),
             # 12 WORDS  ( Unique Serial Number )
             str_to_bytes(""),
         )  # 4  WORDS  ( RESERVED )
@@ -377,7 +369,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H32s",
             0x07,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#0007"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#0007"]).get_value()),
         )
         # 16 WORDS  ( CPU type name, padded wit (0x00) )
 
@@ -385,7 +377,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H20s6s2s4s",
             0x0A,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#000A"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#000A"]).get_value()),
             # 10 WORDS  ( OEM-Copyright Text, padded with (0x00) )
             str_to_bytes(
                 ""
@@ -398,7 +390,7 @@ class S7(object):
         ssl_resp_data += pack(
             "!H32s",
             0x0B,  # 1  WORD   ( Data Index )
-            str_to_bytes(self.data_bus.get_value(current_ssl["W#16#000B"])),
+            str_to_bytes(self.data_bus.handle(current_ssl["W#16#000B"]).get_value()),
         )
         # 16 WORDS  ( Location String, padded with (0x00) )
 
@@ -424,3 +416,22 @@ class S7(object):
         )  # sequence ( = sequence + 1 )
 
         return "", ssl_resp_params, ssl_resp_packet
+
+    # param codes (http://www.bj-ig.de/147.html):
+    # maps request types to methods
+    param_mapping = {
+        0x00: ("diagnostics", request_diagnostics),
+        0x04: ("read", request_not_implemented),
+        0x05: ("write", request_not_implemented),
+        0x1A: ("request_download", request_not_implemented),
+        0x1B: ("download_block", request_not_implemented),
+        0x1C: ("end_download", request_not_implemented),
+        0x1D: ("start_upload", request_not_implemented),
+        0x1E: ("upload", request_not_implemented),
+        0x1F: ("end_upload", request_not_implemented),
+        0x28: ("insert_block", request_not_implemented),
+        0x29: ("plc_stop", plc_stop_signal),
+    }
+
+    # maps SSL/SZL ids to methods
+    ssl_mapping = {0x11: request_ssl_17, 0x1C: request_ssl_28}
@@ -18,9 +18,8 @@
 import time
 
 from gevent.server import StreamServer
-import codecs
 import socket
-from struct import unpack
+from conpot.protocols.s7comm.exceptions import ParseException
 from conpot.protocols.s7comm.tpkt import TPKT
 from conpot.protocols.s7comm.cotp import COTP as COTP_BASE_packet
 from conpot.protocols.s7comm.cotp import COTP_ConnectionRequest
@@ -31,13 +30,34 @@ from conpot.core.protocol_wrapper import conpot_protocol
 from lxml import etree
 
 import logging
+from conpot.core.metrics import track_connections
+from conpot.core.rate_limiter import rate_limited
+from conpot.utils.networking import stream_listener
 
 logger = logging.getLogger(__name__)
 
 
-def cleanse_byte_string(packet):
-    new_packet = packet.decode("latin-1").replace("b", "")
-    return new_packet.encode("latin-1")
+def recv_tpkt(sock):
+    """
+    Receive a TPKT frame into a bytearray of its length, the frame is empty once the connection is closed.
+    Raise ParseException if the length of the frame is invalid.
+    """
+    header = sock.recv(TPKT.HEADER.size, socket.MSG_WAITALL)
+    if len(header) < TPKT.HEADER.size:
+        return bytearray()
+    _, _, length = TPKT.HEADER.unpack(header)
+    if length <= TPKT.HEADER.size:
+        raise ParseException("s7comm", "invalid TPKT length {0}".format(length))
+    frame = bytearray(length)
+    view = memoryview(frame)
+    view[: TPKT.HEADER.size] = header
+    received = TPKT.HEADER.size
+    while received < length:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return bytearray()
+        received += count
+    return frame
 
 
 @conpot_protocol
@@ -67,6 +87,8 @@ class S7Server(object):
         logger.debug("Conpot debug info: S7 SSL/SZL: {0}".format(self.ssl_lists))
         logger.info("Conpot S7Comm initialized")
 
+    @rate_limited("s7comm")
+    @track_connections("s7comm")
     def handle(self, sock, address):
         sock.settimeout(self.timeout)
         session = conpot_core.get_session(
@@ -87,20 +109,17 @@ class S7Server(object):
         try:
             while True:
 
-                data = sock.recv(4, socket.MSG_WAITALL)
-                if len(data) == 0:
-                    session.add_event({"type": "CONNECTION_LOST"})
-                    break
-
-                _, _, length = unpack("!BBH", data[:4])
-                # check for length
-                if length <= 4:
+                try:
+                    data = recv_tpkt(sock)
+                except ParseException:
                     logger.info("S7 error: Invalid length")
                     session.add_event({"error": "S7 error: Invalid length"})
                     break
-                data += sock.recv(length - 4, socket.MSG_WAITALL)
+                if len(data) == 0:
+                    session.add_event({"type": "CONNECTION_LOST"})
+                    break
 
-                tpkt_packet = TPKT().parse(cleanse_byte_string(data))
+                tpkt_packet = TPKT().parse(data)
                 cotp_base_packet = COTP_BASE_packet().parse(tpkt_packet.payload)
                 if cotp_base_packet.tpdu_type == 0xE0:
 
@@ -131,20 +150,19 @@ class S7Server(object):
                     ).assemble()
 
                     # encapsulate and transmit
-                    cotp_resp_base_packet = COTP_BASE_packet(
-                        0xD0, 0, cotp_cc_response
+                    tpkt_resp_packet = TPKT(
+                        3, COTP_BASE_packet(0xD0, 0, cotp_cc_response)
                     ).pack()
-                    tpkt_resp_packet = TPKT(3, cotp_resp_base_packet).pack()
                     sock.send(tpkt_resp_packet)
 
                     session.add_event(
                         {
-                            "request": codecs.encode(data, "hex"),
-                            "response": codecs.encode(tpkt_resp_packet, "hex"),
+                            "request": bytes(data),
+                            "response": bytes(tpkt_resp_packet),
                         }
                     )
 
-                    data = sock.recv(1024)
+                    data = recv_tpkt(sock)
 
                     # another round of parsing payloads
                     tpkt_packet = TPKT().parse(data)
@@ -181,28 +199,25 @@ class S7Server(object):
                                 # create S7 response packet
                                 s7_resp_negotiate_packet = S7(
                                     3, 0, S7_packet.request_id, 0, S7_packet.parameters
-                                ).pack()
-                                # wrap s7 the packet in cotp
-                                cotp_resp_negotiate_packet = COTP_BASE_packet(
-                                    0xF0, 0x80, s7_resp_negotiate_packet
-                                ).pack()
-                                # wrap the cotp packet
+                                )
+                                # wrap the s7 packet in cotp and tpkt, packed into one buffer
                                 tpkt_resp_packet = TPKT(
-                                    3, cotp_resp_negotiate_packet
+                                    3,
+                                    COTP_BASE_packet(
+                                        0xF0, 0x80, s7_resp_negotiate_packet
+                                    ),
                                 ).pack()
                                 sock.send(tpkt_resp_packet)
 
                                 session.add_event(
                                     {
-                                        "request": codecs.encode(data, "hex"),
-                                        "response": codecs.encode(
-                                            tpkt_resp_packet, "hex"
-                                        ),
+                                        "request": bytes(data),
+                                        "response": bytes(tpkt_resp_packet),
                                     }
                                 )
 
                                 # handshake done, give some more data.
-                                data = sock.recv(1024)
+                                data = recv_tpkt(sock)
 
                                 while data:
                                     tpkt_packet = TPKT().parse(data)
@@ -236,25 +251,23 @@ class S7Server(object):
                                             0,
                                             response_param,
                                             response_data,
-                                        ).pack()
-                                        cotp_resp_ssl_packet = COTP_BASE_packet(
-                                            0xF0, 0x80, s7_resp_ssl_packet
-                                        ).pack()
+                                        )
                                         tpkt_resp_packet = TPKT(
-                                            3, cotp_resp_ssl_packet
+                                            3,
+                                            COTP_BASE_packet(
+                                                0xF0, 0x80, s7_resp_ssl_packet
+                                            ),
                                         ).pack()
                                         sock.send(tpkt_resp_packet)
 
                                         session.add_event(
                                             {
-                                                "request": codecs.encode(data, "hex"),
-                                                "response": codecs.encode(
-                                                    tpkt_resp_packet, "hex"
-                                                ),
+                                                "request": bytes(data),
+                                                "response": bytes(tpkt_resp_packet),
                                             }
                                         )
 
-                                    data = sock.recv(1024)
+                                    data = recv_tpkt(sock)
                     else:
                         logger.info(
                             "Received unknown COTP TPDU after handshake: {0}".format(
@@ -305,7 +318,7 @@ class S7Server(object):
         self.host = host
         self.port = port
         connection = (host, port)
-        self.server = StreamServer(connection, self.handle)
+        self.server = StreamServer(stream_listener(connection), self.handle)
         logger.info("S7Comm server started on: {0}".format(connection))
         self.server.serve_forever()
 
@@ -1,9 +1,27 @@
-from struct import pack, unpack
 import struct
+from conpot.core.loggers.helpers import PAYLOAD_TYPES
 from conpot.protocols.s7comm.exceptions import ParseException
 from conpot.utils.networking import str_to_bytes
 
 
+def as_bytes(value):
+    """Bytes-like values are used as they are, anything else is encoded."""
+    return value if isinstance(value, PAYLOAD_TYPES) else str_to_bytes(value)
+
+
+def pack_payload(payload, buffer, offset):
+    """
+    Write a payload into buffer at offset and return the offset following it.
+    Packets carried as payload write themselves, so nested packets are packed without intermediate copies.
+    """
+    if hasattr(payload, "pack_into"):
+        return payload.pack_into(buffer, offset)
+    payload = as_bytes(payload)
+    end = offset + len(payload)
+    buffer[offset:end] = payload
+    return end
+
+
 class TPKT:
     # References: rfc2126 section-4.3, rfc1006# section-6
     # Packet format:
@@ -12,22 +30,35 @@ class TPKT:
     # +----------------------------------------------....---------------+
     # <8 bits> <8 bits> <   16 bits    > <       variable length       >
 
+    HEADER = struct.Struct("!BBH")
+
     def __init__(self, version=3, payload=""):
         self.payload = payload
         self.version = version
         self.reserved = 0
         self.packet_length = len(payload) + 4
 
+    def __len__(self):
+        return self.HEADER.size + len(self.payload)
+
     def pack(self):
-        return pack(
-            "!BBH", self.version, self.reserved, self.packet_length
-        ) + str_to_bytes(self.payload)
+        buffer = bytearray(len(self))
+        self.pack_into(buffer)
+        return buffer
+
+    def pack_into(self, buffer, offset=0):
+        self.packet_length = len(self)
+        self.HEADER.pack_into(
+            buffer, offset, self.version, self.reserved, self.packet_length
+        )
+        return pack_payload(self.payload, buffer, offset + self.HEADER.size)
 
     def parse(self, packet):
-        # packet = cleanse_byte_string(packet)
+        # the payload is a view of the packet, it is not copied
+        packet = memoryview(packet)
         try:
             # try to extract the header by pattern to find malformed header data
-            header = unpack("!BBH", packet[:4])
+            header = self.HEADER.unpack_from(packet)
         except struct.error:
             raise ParseException("s7comm", "malformed packet header structure")
 
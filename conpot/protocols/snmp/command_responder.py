@@ -8,12 +8,16 @@ from pysnmp.entity import config
 from pysnmp.entity.rfc3413 import context
 from pysnmp.carrier.asynsock.dgram import udp
 from pysnmp.entity import engine
+from pysnmp.smi import builder
 from pysnmp.smi.compiler import addMibCompiler
 import gevent
 
 from conpot.protocols.snmp import conpot_cmdrsp
 from conpot.protocols.snmp.databus_mediator import DatabusMediator
 from gevent.server import DatagramServer
+from conpot.core.metrics import track_latency
+from conpot.core.rate_limiter import rate_limited
+from conpot.utils.networking import set_reuse_port
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,8 @@ class SNMPDispatcher(DatagramServer):
     def registerRecvCbFun(self, recvCbFun, recvId=None):
         self.recvCbFun = recvCbFun
 
+    @rate_limited("snmp")
+    @track_latency("snmp")
     def handle(self, msg, address):
         try:
             self.recvCbFun(self, self.transportDomain, address, msg)
@@ -46,7 +52,7 @@ class SNMPDispatcher(DatagramServer):
 
 
 class CommandResponder(object):
-    def __init__(self, host, port, raw_mibs, compiled_mibs):
+    def __init__(self, host, port, raw_mibs, compiled_mibs, mib_bundle=None):
 
         self.oid_mapping = {}
         self.databus_mediator = DatabusMediator(self.oid_mapping)
@@ -55,17 +61,24 @@ class CommandResponder(object):
         # Create SNMP engine
         self.snmpEngine = engine.SnmpEngine()
 
-        # Configure SNMP compiler
         mib_builder = self.snmpEngine.getMibBuilder()
-        addMibCompiler(mib_builder, destination=compiled_mibs)
-        mib_builder.getMibCompiler().addSources(FileReader(raw_mibs))
-        mib_builder.getMibCompiler().addSources(
-            FtpReader("ftp.cisco.com", "/pub/mibs/v2/@mib@", 80)
-        )
+        if mib_bundle:
+            # precompiled MIBs only, never compile or download at runtime
+            mib_builder.setMibSources(
+                builder.DirMibSource(mib_bundle), *mib_builder.getMibSources()
+            )
+        else:
+            # Configure SNMP compiler
+            addMibCompiler(mib_builder, destination=compiled_mibs)
+            mib_builder.getMibCompiler().addSources(FileReader(raw_mibs))
+            mib_builder.getMibCompiler().addSources(
+                FtpReader("ftp.cisco.com", "/pub/mibs/v2/@mib@", 80)
+            )
 
         # Transport setup
         udp_sock = gevent.socket.socket(gevent.socket.AF_INET, gevent.socket.SOCK_DGRAM)
         udp_sock.setsockopt(gevent.socket.SOL_SOCKET, gevent.socket.SO_BROADCAST, 1)
+        set_reuse_port(udp_sock)
         udp_sock.bind((host, port))
         self.server_port = udp_sock.getsockname()[1]
         # UDP over IPv4
@@ -163,11 +176,16 @@ class CommandResponder(object):
             snmpEngine.registerTransportDispatcher(SNMPDispatcher())
         snmpEngine.transportDispatcher.registerTransport(transportDomain, transport)
 
+    def load_mibs(self, *mibnames):
+        """Load the MIBs which are not loaded yet, in one pass."""
+        mib_builder = self.snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+        missing = [name for name in mibnames if name not in mib_builder.mibSymbols]
+        if missing:
+            mib_builder.loadModules(*missing)
+
     def register(self, mibname, symbolname, instance, value, profile_map_name):
         """Register OID"""
-        self.snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder.loadModules(
-            mibname
-        )
+        self.load_mibs(mibname)
         s = self._get_mibSymbol(mibname, symbolname)
 
         if s:
@@ -0,0 +1,199 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Precompiled MIB bundles of SNMP templates.
+
+A bundle is a directory ``snmp/mib_bundle`` next to the SNMP template holding the compiled pysnmp modules of every
+MIB the template uses, and of the MIBs these import, which are not part of pysnmp itself. When a template has a
+bundle the SNMP server loads its MIBs from it and never runs the MIB compiler, so it starts without network access.
+
+Bundles are built with::
+
+    python -m conpot.protocols.snmp.mib_bundle <template directory> [--source URL ...]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+import pysnmp
+from lxml import etree
+from pysmi.reader import FileReader, getReadersFromUrls
+from pysnmp.smi import builder
+from pysnmp.smi.compiler import addMibCompiler
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_DIRECTORY = "mib_bundle"
+MANIFEST = "manifest.json"
+# bump when the layout of bundles changes
+FORMAT = 1
+IMPORT_SYMBOLS = re.compile(r'mibBuilder\.importSymbols\(\s*"([^"]+)"')
+
+
+def template_mibs(template):
+    """Names of the MIBs used by a SNMP template."""
+    dom = etree.parse(template)
+    return [str(name) for name in dom.xpath("//snmp/mibs/*/@name")]
+
+
+def bundle_directory(template_directory):
+    return os.path.join(template_directory, "snmp", BUNDLE_DIRECTORY)
+
+
+def _pysnmp_version():
+    # compiled modules depend on the pysnmp API, which is stable within a minor version
+    return ".".join(pysnmp.__version__.split(".")[:2])
+
+
+def _digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _module_file(mib_builder, name):
+    """The file a MIB builder loads the module name from, None if it is not a plain file."""
+    for source in mib_builder.getMibSources():
+        path = os.path.join(source.fullPath(), name + ".py")
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _module_imports(path):
+    """Names of the modules a compiled MIB module imports symbols from."""
+    with open(path) as f:
+        return IMPORT_SYMBOLS.findall(f.read())
+
+
+def build_bundle(template_directory, sources=(), destination=None):
+    """
+    Compile the MIBs of a template into a bundle and return the names of the bundled modules.
+
+    :param template_directory: Template directory, containing snmp/snmp.xml and optionally snmp/mibs.
+    :param sources: URLs of additional MIB sources, e.g. http://mibs.snmplabs.com/asn1/@mib@
+    :param destination: Bundle directory, snmp/mib_bundle of the template by default.
+    """
+    destination = destination or bundle_directory(template_directory)
+    mibs = template_mibs(os.path.join(template_directory, "snmp", "snmp.xml"))
+    pysnmp_mibs = os.path.join(os.path.dirname(builder.__file__), "mibs") + os.sep
+
+    with tempfile.TemporaryDirectory() as compiled_mibs:
+        mib_builder = builder.MibBuilder()
+        addMibCompiler(mib_builder, destination=compiled_mibs)
+        raw_mibs = os.path.join(template_directory, "snmp", "mibs")
+        if os.path.isdir(raw_mibs):
+            mib_builder.getMibCompiler().addSources(FileReader(raw_mibs))
+        if sources:
+            mib_builder.getMibCompiler().addSources(*getReadersFromUrls(*sources))
+        mib_builder.loadModules(*mibs)
+
+        # files of the modules loaded from outside of pysnmp: the compiled MIBs and the modules they import
+        modules = {}
+        pending = mibs + [
+            os.path.splitext(filename)[0]
+            for filename in os.listdir(compiled_mibs)
+            if filename.endswith(".py")
+        ]
+        while pending:
+            name = pending.pop()
+            if name in modules:
+                continue
+            path = _module_file(mib_builder, name)
+            if path is None or os.path.abspath(path).startswith(pysnmp_mibs):
+                continue
+            modules[name] = path
+            pending.extend(_module_imports(path))
+
+        if os.path.isdir(destination):
+            shutil.rmtree(destination)
+        os.makedirs(destination)
+        manifest = {
+            "format": FORMAT,
+            "pysnmp": _pysnmp_version(),
+            "mibs": sorted(mibs),
+            "modules": {},
+        }
+        for name, path in sorted(modules.items()):
+            filename = os.path.basename(path)
+            shutil.copyfile(path, os.path.join(destination, filename))
+            manifest["modules"][filename] = _digest(path)
+    with open(os.path.join(destination, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return sorted(modules)
+
+
+def find_bundle(template_directory, mibs):
+    """
+    Return the bundle directory of a template if it can be used for the given MIBs, else None.
+    """
+    directory = bundle_directory(template_directory)
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logger.warning("Ignoring MIB bundle %s: %s", directory, e)
+        return None
+
+    if manifest.get("format") != FORMAT:
+        reason = "unsupported format"
+    elif manifest.get("pysnmp") != _pysnmp_version():
+        reason = "built for pysnmp {0}".format(manifest.get("pysnmp"))
+    elif not set(mibs) <= set(manifest.get("mibs", ())):
+        reason = "MIBs missing, rebuild it"
+    else:
+        return directory
+    logger.warning("Ignoring MIB bundle %s: %s", directory, reason)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compile the MIBs of a SNMP template into a bundle."
+    )
+    parser.add_argument("template_directory", help="Directory of the template.")
+    parser.add_argument(
+        "-s",
+        "--source",
+        action="append",
+        default=[],
+        help="Additional MIB source URL, may be given multiple times.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Bundle directory, snmp/mib_bundle of the template."
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    modules = build_bundle(args.template_directory, args.source, args.output)
+    logger.info(
+        "Bundled %d MIB modules: %s", len(modules), ", ".join(modules) or "none"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ from lxml import etree
 import conpot.core as conpot_core
 from conpot.core.protocol_wrapper import conpot_protocol
 from conpot.protocols.snmp.command_responder import CommandResponder
+from conpot.protocols.snmp import mib_bundle
 
 logger = logging.getLogger()
 
@@ -41,6 +42,9 @@ class SNMPServer(object):
 
         self.compiled_mibs = args.mibcache
         self.raw_mibs = os.path.join(template_directory, "snmp", "mibs")
+        self.mib_bundle = mib_bundle.find_bundle(
+            template_directory, self.dom.xpath("//snmp/mibs/*/@name")
+        )
 
     def xml_general_config(self, dom):
         snmp_config = dom.xpath("//snmp/config/*")
@@ -89,6 +93,7 @@ class SNMPServer(object):
 
     def xml_mib_config(self):
         mibs = self.dom.xpath("//snmp/mibs/*")
+        self.cmd_responder.load_mibs(*[mib.attrib["name"] for mib in mibs])
 
         # parse mibs and oid tables
         for mib in mibs:
@@ -179,7 +184,7 @@ class SNMPServer(object):
 
     def start(self, host, port):
         self.cmd_responder = CommandResponder(
-            host, port, self.raw_mibs, self.compiled_mibs
+            host, port, self.raw_mibs, self.compiled_mibs, self.mib_bundle
         )
         self.xml_general_config(self.dom)
         self.xml_mib_config()
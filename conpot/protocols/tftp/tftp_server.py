@@ -25,9 +25,11 @@ from conpot.protocols.tftp import tftp_handler
 from gevent.server import DatagramServer
 import conpot.core as conpot_core
 from conpot.core.protocol_wrapper import conpot_protocol
-from conpot.utils.networking import get_interface_ip
+from conpot.utils.networking import get_interface_ip, set_reuse_port
 from tftpy import TftpException, TftpTimeout
 import logging
+from conpot.core.metrics import track_latency
+from conpot.core.rate_limiter import rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +105,8 @@ class TftpServer(object):
                 "The TFTP root {} is not writable".format(self.vfs.getcwd() + self.root)
             )
 
+    @rate_limited("tftp")
+    @track_latency("tftp")
     def handle(self, buffer, client_addr):
         session = conpot_core.get_session(
             "tftp",
@@ -172,6 +176,7 @@ class TftpServer(object):
         self.listener = gevent.socket.socket(
             gevent.socket.AF_INET, gevent.socket.SOCK_DGRAM
         )
+        set_reuse_port(self.listener)
         self.listener.bind(conn)
         self.listener.settimeout(self.timeout)
         self.server = DatagramServer(self.listener, self.handle)
@@ -0,0 +1,18 @@
+"""Benchmarks of the protocol servers, see docs/source/development/benchmarks.rst"""
+
+import os
+import subprocess
+
+import conpot
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(conpot.__file__),
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,336 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Clients generating load on the protocol servers.
+
+Every driver performs one request and waits for its response per call of ``request``. TCP drivers keep their
+connection open across requests and reconnect after an error. The requests are prebuilt, so the drivers spend as
+little CPU as possible, and ``source`` binds the client socket to a local address, e.g. one of 127.0.0.0/8.
+"""
+
+import itertools
+import struct
+
+from gevent import socket
+
+TIMEOUT = 5
+
+
+class DriverError(Exception):
+    pass
+
+
+class Driver(object):
+    kind = socket.SOCK_STREAM
+
+    def __init__(self, address, source=None):
+        self.address = address
+        self.source = source
+        self.sock = None
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_INET, self.kind)
+        sock.settimeout(TIMEOUT)
+        if self.source:
+            sock.bind((self.source, 0))
+        if self.kind == socket.SOCK_STREAM:
+            sock.connect(self.address)
+        return sock
+
+    def connect(self):
+        """Called on a new connection, before the first request."""
+
+    def exchange(self):
+        raise NotImplementedError
+
+    def request(self):
+        if self.sock is None:
+            self.sock = self._connect()
+            try:
+                self.connect()
+            except Exception:
+                self.close()
+                raise
+        try:
+            self.exchange()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def recv_exactly(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise DriverError("connection closed")
+            data += chunk
+        return data
+
+    def recv_until(self, terminator):
+        data = b""
+        while not data.endswith(terminator):
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise DriverError("connection closed")
+            data += chunk
+        return data
+
+    def recv_datagram(self):
+        data, _ = self.sock.recvfrom(65535)
+        return data
+
+
+class ModbusDriver(Driver):
+    # read 128 coils of slave 1
+    REQUEST = struct.pack(">HHHBBHH", 1, 0, 6, 1, 1, 1, 128)
+
+    def exchange(self):
+        self.sock.sendall(self.REQUEST)
+        _, _, length = struct.unpack(">HHH", self.recv_exactly(6))
+        self.recv_exactly(length)
+
+
+class S7Driver(Driver):
+    def connect(self):
+        from conpot.tests.helpers import s7comm_client
+
+        self.client = client = s7comm_client.s7(*self.address, timeout=TIMEOUT)
+        # same handshake as s7.Connect, on the socket of the driver
+        client.src_ref = 10
+        client.s = self.sock
+        self.sock.send(
+            s7comm_client.TPKTPacket(
+                s7comm_client.COTPConnectionPacket(
+                    client.dst_ref,
+                    client.src_ref,
+                    client.dst_tsap,
+                    client.src_tsap,
+                    0x0A,
+                )
+            ).pack()
+        )
+        self.sock.recv(1024)
+        client.NegotiatePDU()
+
+    def exchange(self):
+        # module identification
+        self.client.ReadSZL(0x11)
+
+
+class HTTPDriver(Driver):
+    REQUEST = (
+        b"GET /index.html HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+    )
+
+    def request(self):
+        # one connection per request
+        self.sock = self._connect()
+        try:
+            self.sock.sendall(self.REQUEST)
+            if not self.sock.recv(65536).startswith(b"HTTP/1."):
+                raise DriverError("invalid response")
+            while self.sock.recv(65536):
+                pass
+        finally:
+            self.close()
+
+
+class SNMPDriver(Driver):
+    kind = socket.SOCK_DGRAM
+
+    def __init__(self, address, source=None):
+        super().__init__(address, source)
+        self.request_data = self._build_request()
+
+    @staticmethod
+    def _build_request():
+        from pyasn1.codec.ber import encoder
+        from pysnmp.proto import api
+
+        module = api.protoModules[api.protoVersion1]
+        pdu = module.GetRequestPDU()
+        module.apiPDU.setDefaults(pdu)
+        # sysDescr.0
+        module.apiPDU.setVarBinds(
+            pdu, (((1, 3, 6, 1, 2, 1, 1, 1, 0), module.Null("")),)
+        )
+        message = module.Message()
+        module.apiMessage.setDefaults(message)
+        module.apiMessage.setCommunity(message, "public")
+        module.apiMessage.setPDU(message, pdu)
+        return encoder.encode(message)
+
+    def exchange(self):
+        self.sock.sendto(self.request_data, self.address)
+        self.recv_datagram()
+
+
+class IEC104Driver(Driver):
+    STARTDT_ACT = b"\x68\x04\x07\x00\x00\x00"
+    TESTFR_ACT = b"\x68\x04\x43\x00\x00\x00"
+
+    def _read_until(self, control):
+        while True:
+            start, length = self.recv_exactly(2)
+            if start != 0x68:
+                raise DriverError("invalid start byte")
+            frame = self.recv_exactly(length)
+            if frame[0] == control:
+                return
+
+    def connect(self):
+        self.sock.sendall(self.STARTDT_ACT)
+        self._read_until(0x0B)
+
+    def exchange(self):
+        self.sock.sendall(self.TESTFR_ACT)
+        self._read_until(0x83)
+
+
+class EnipDriver(Driver):
+    # ListIdentity encapsulation header
+    REQUEST = struct.pack("<HHII8sI", 0x63, 0, 0, 0, b"\x00" * 8, 0)
+
+    def exchange(self):
+        self.sock.sendall(self.REQUEST)
+        _, length = struct.unpack("<HH", self.recv_exactly(24)[:4])
+        self.recv_exactly(length)
+
+
+class BacnetDriver(Driver):
+    kind = socket.SOCK_DGRAM
+
+    def __init__(self, address, source=None):
+        super().__init__(address, source)
+        self.request_data = self._build_request()
+
+    @staticmethod
+    def _build_request():
+        from bacpypes.apdu import APDU, ReadPropertyRequest
+        from bacpypes.pdu import PDU
+
+        # present value of analog input 14, answered to the sender unlike Who-Is which is answered by broadcast
+        request = ReadPropertyRequest(
+            objectIdentifier=("analogInput", 14), propertyIdentifier=85
+        )
+        request.apduMaxResp = 1024
+        request.apduInvokeID = 101
+        apdu = APDU()
+        request.encode(apdu)
+        pdu = PDU()
+        apdu.encode(pdu)
+        return bytes(pdu.pduData)
+
+    def exchange(self):
+        self.sock.sendto(self.request_data, self.address)
+        self.recv_datagram()
+
+
+class FTPDriver(Driver):
+    def connect(self):
+        # banner
+        self.recv_until(b"\r\n")
+
+    def exchange(self):
+        self.sock.sendall(b"NOOP\r\n")
+        self.recv_until(b"\r\n")
+
+
+class TFTPDriver(Driver):
+    kind = socket.SOCK_DGRAM
+    # read request of the file the benchmark server provides, it fits into one data packet
+    REQUEST = b"\x00\x01benchmark.txt\x00octet\x00"
+
+    def exchange(self):
+        self.sock.sendto(self.REQUEST, self.address)
+        data, address = self.sock.recvfrom(65535)
+        if data[:2] != b"\x00\x03":
+            raise DriverError("unexpected TFTP packet {0!r}".format(data[:4]))
+        # acknowledge the data packet to complete the transfer
+        self.sock.sendto(b"\x00\x04" + data[2:4], address)
+
+
+class KamstrupMeterDriver(Driver):
+    # get register 1033
+    REQUEST = bytes((0x80, 0x3F, 0x10, 0x01, 0x04, 0x09, 0x18, 0x6D, 0x0D))
+
+    def exchange(self):
+        self.sock.sendall(self.REQUEST)
+        self.recv_until(b"\x0d")
+
+
+class KamstrupManagementDriver(Driver):
+    def connect(self):
+        self.sock.recv(1024)
+
+    def exchange(self):
+        self.sock.sendall(b"H\r\n")
+        if not self.sock.recv(4096):
+            raise DriverError("connection closed")
+
+
+class IpmiDriver(Driver):
+    kind = socket.SOCK_DGRAM
+    # IPMI 1.5 Get Channel Authentication Capabilities, the first request of ipmitool
+    REQUEST = bytes.fromhex("0600ff07000000000000000000092018c88100388e04b5")
+    # IPMI 1.5 message with an authentication type the session did not negotiate, the server closes the session
+    CLOSE = REQUEST[:4] + b"\x02" + REQUEST[5:]
+    _sources = itertools.count(1)
+
+    def __init__(self, address, source=None):
+        # the server keeps one session per source address, every driver needs its own
+        if source is None:
+            n = next(self._sources)
+            source = "127.1.{0}.{1}".format(n // 254 % 254, n % 254 + 1)
+        super().__init__(address, source)
+
+    def exchange(self):
+        self.sock.sendto(self.REQUEST, self.address)
+        self.recv_datagram()
+        self.sock.sendto(self.CLOSE, self.address)
+
+
+class GuardianASTDriver(Driver):
+    def exchange(self):
+        # in-tank inventory report
+        self.sock.sendall(b"\x01I20100\r\n")
+        if not self.sock.recv(4096):
+            raise DriverError("connection closed")
+
+
+# protocol name, as in conpot.protocols.name_mapping -> driver class
+drivers = {
+    "bacnet": BacnetDriver,
+    "enip": EnipDriver,
+    "ftp": FTPDriver,
+    "guardian_ast": GuardianASTDriver,
+    "http": HTTPDriver,
+    "IEC104": IEC104Driver,
+    "ipmi": IpmiDriver,
+    "kamstrup_management": KamstrupManagementDriver,
+    "kamstrup_meter": KamstrupMeterDriver,
+    "modbus": ModbusDriver,
+    "s7comm": S7Driver,
+    "snmp": SNMPDriver,
+    "tftp": TFTPDriver,
+}
@@ -0,0 +1,293 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Load benchmark of the protocol servers.
+
+Every protocol server is started on loopback in a process of its own, see ``server.py``, and driven by a number
+of concurrent clients for a fixed time. Reported are the requests per second, the latency percentiles, the CPU
+time the server used and its resident memory::
+
+    python -m conpot.tests.benchmarks.load [protocol ...] [-c 16] [-d 10] [-o results.json] [-b baseline.json]
+
+The JSON results carry the commit they were measured on and can be passed as baseline to a later run.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse  # noqa: E402
+import datetime  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import platform  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+
+import gevent  # noqa: E402
+from gevent import socket  # noqa: E402
+
+from conpot.tests.benchmarks import git_commit  # noqa: E402
+from conpot.tests.benchmarks.drivers import drivers  # noqa: E402
+
+HOST = "127.0.0.1"
+STARTUP_TIMEOUT = 60
+PERCENTILES = (50, 90, 99)
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def free_port(kind):
+    sock = socket.socket(socket.AF_INET, kind)
+    try:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+class ServerProcess(object):
+    """A protocol server started by ``server.py``, with CPU and memory read from /proc."""
+
+    def __init__(self, name, port):
+        self.name = name
+        self.port = port
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "conpot.tests.benchmarks.server",
+                self.name,
+                str(self.port),
+            ],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        with gevent.Timeout(STARTUP_TIMEOUT, BenchmarkError("server did not start")):
+            line = self.process.stdout.readline()
+        if line.strip() != "ready":
+            self.stop()
+            raise BenchmarkError("server of {0} failed to start".format(self.name))
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+            self.process.stdout.close()
+
+    def cpu_seconds(self):
+        with open("/proc/{0}/stat".format(self.process.pid)) as f:
+            # the command name may contain spaces, the fields after it do not
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime, fields 14 and 15 of proc(5)
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def memory(self):
+        """Current and peak resident set size in kB."""
+        values = {}
+        with open("/proc/{0}/status".format(self.process.pid)) as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = int(value.split()[0])
+        return values["VmRSS"], values["VmHWM"]
+
+
+def percentile(ordered, p):
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _drive(driver, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            driver.request()
+        except Exception as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            # do not spin on a server refusing connections
+            gevent.sleep(0.01)
+        else:
+            latencies.append(time.perf_counter() - start)
+    driver.close()
+
+
+def run_load(address, driver_class, concurrency, duration):
+    """Drive a server with concurrent clients, return the latencies and errors by exception name."""
+    latencies = []
+    errors = {}
+    deadline = time.perf_counter() + duration
+    workers = [
+        gevent.spawn(_drive, driver_class(address), deadline, latencies, errors)
+        for _ in range(concurrency)
+    ]
+    gevent.joinall(workers)
+    return latencies, errors
+
+
+def benchmark(name, concurrency=16, duration=10.0, warmup=1.0):
+    """Benchmark the server of one protocol and return its results."""
+    driver_class = drivers[name]
+    port = free_port(driver_class.kind)
+    server = ServerProcess(name, port)
+    server.start()
+    try:
+        address = (HOST, port)
+        if warmup:
+            run_load(address, driver_class, concurrency, warmup)
+        cpu = server.cpu_seconds()
+        start = time.perf_counter()
+        latencies, errors = run_load(address, driver_class, concurrency, duration)
+        elapsed = time.perf_counter() - start
+        cpu = server.cpu_seconds() - cpu
+        rss, max_rss = server.memory()
+    finally:
+        server.stop()
+
+    latencies.sort()
+    latency_ms = {
+        "p{0}".format(p): percentile(latencies, p) * 1000 if latencies else None
+        for p in PERCENTILES
+    }
+    latency_ms["max"] = latencies[-1] * 1000 if latencies else None
+    return {
+        "concurrency": concurrency,
+        "duration": elapsed,
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": len(latencies) / elapsed,
+        "latency_ms": latency_ms,
+        "cpu_seconds": cpu,
+        "cpu_percent": cpu / elapsed * 100,
+        "rss_kb": rss,
+        "max_rss_kb": max_rss,
+    }
+
+
+def _change(value, base):
+    if not value or not base:
+        return ""
+    return "{0:+.1f}%".format((value - base) / base * 100)
+
+
+def report(results, baseline=None):
+    baseline = baseline or {}
+    header = "{0:<20} {1:>10} {2:>9} {3:>9} {4:>9} {5:>7} {6:>9} {7:>8}".format(
+        "protocol", "req/s", "p50 ms", "p99 ms", "max ms", "cpu %", "rss kB", "errors"
+    )
+    print(header)
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        print(
+            "{0:<20} {1:>10.1f} {2:>9.3f} {3:>9.3f} {4:>9.3f} {5:>7.1f} {6:>9d} {7:>8d}".format(
+                name,
+                result["requests_per_second"],
+                latency["p50"] or 0,
+                latency["p99"] or 0,
+                latency["max"] or 0,
+                result["cpu_percent"],
+                result["rss_kb"],
+                sum(result["errors"].values()),
+            )
+        )
+        base = baseline.get(name)
+        if base:
+            print(
+                "{0:<20} {1:>10} {2:>9} {3:>9} {4:>9} {5:>7} {6:>9}".format(
+                    "  vs baseline",
+                    _change(result["requests_per_second"], base["requests_per_second"]),
+                    _change(latency["p50"], base["latency_ms"]["p50"]),
+                    _change(latency["p99"], base["latency_ms"]["p99"]),
+                    _change(latency["max"], base["latency_ms"]["max"]),
+                    _change(result["cpu_percent"], base["cpu_percent"]),
+                    _change(result["rss_kb"], base["rss_kb"]),
+                )
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the conpot protocol servers on loopback."
+    )
+    parser.add_argument(
+        "protocols",
+        nargs="*",
+        metavar="protocol",
+        help="Protocols to benchmark, all by default: {0}".format(
+            ", ".join(sorted(drivers))
+        ),
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=16, help="Concurrent clients."
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=10, help="Seconds per protocol."
+    )
+    parser.add_argument(
+        "-w", "--warmup", type=float, default=1, help="Warm up seconds per protocol."
+    )
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "-b", "--baseline", help="Results of an earlier run to compare with."
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.protocols) - set(drivers)
+    if unknown:
+        parser.error("unknown protocols: {0}".format(", ".join(sorted(unknown))))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    for name in args.protocols or sorted(drivers):
+        try:
+            results[name] = benchmark(
+                name, args.concurrency, args.duration, args.warmup
+            )
+        except BenchmarkError as e:
+            print("{0}: {1}".format(name, e), file=sys.stderr)
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "timestamp": datetime.datetime.utcnow().isoformat(),
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
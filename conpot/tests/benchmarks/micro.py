@@ -0,0 +1,363 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Microbenchmarks of the functions parsing requests and building responses, fed with captured payloads::
+
+    python -m conpot.tests.benchmarks.micro [case ...] [--threshold 25] [--baseline FILE] [--save]
+
+The time per call of every case is compared with the baseline file, ``micro_baseline.json`` next to this module
+by default. The run fails when a case got slower than the baseline by more than the threshold percentage.
+``--save`` stores the results as the new baseline.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+
+from conpot import core
+from conpot.tests.benchmarks import git_commit
+
+package_directory = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+BASELINE = os.path.join(os.path.dirname(__file__), "micro_baseline.json")
+THRESHOLD = 25
+
+# S7 read SZL 0x0011 (module identification), TPKT / COTP DT / S7 userdata
+S7_READ_SZL = bytes.fromhex(
+    "0300002102f080320700000001000800080001120411440100ff09000400110001"
+)
+# Kamstrup meter get register 1054 (voltage p1) of communication address 0x3f
+KAMSTRUP_GET_REGISTER = bytes.fromhex("803f1001041e7abb0d")
+# IEC 104 general interrogation activation of common address 0x1e28
+IEC104_INTERROGATION = bytes.fromhex("680e0000000064010600281e00000014")
+# Modbus/TCP read 128 coils of slave 1, and 8 holding registers of slave 2
+MODBUS_READ_COILS = bytes.fromhex("000100000006010100010080")
+MODBUS_READ_HOLDING_REGISTERS = bytes.fromhex("00020000000602039c410008")
+
+# case name -> setup function returning the function to time
+cases = {}
+
+
+def case(name):
+    def register(setup):
+        cases[name] = setup
+        return setup
+
+    return register
+
+
+def initialize_template(name):
+    core.get_databus().initialize(
+        os.path.join(package_directory, "templates", name, "template.xml")
+    )
+    return os.path.join(package_directory, "templates", name)
+
+
+@case("s7comm.parse")
+def s7comm_parse():
+    from conpot.protocols.s7comm.cotp import COTP
+    from conpot.protocols.s7comm.s7 import S7
+    from conpot.protocols.s7comm.tpkt import TPKT
+
+    def parse():
+        tpkt = TPKT().parse(S7_READ_SZL)
+        cotp = COTP().parse(tpkt.payload)
+        return S7().parse(cotp.trailer)
+
+    return parse
+
+
+def _s7_request():
+    from conpot.protocols.s7comm.cotp import COTP
+    from conpot.protocols.s7comm.s7 import S7
+    from conpot.protocols.s7comm.s7_server import S7Server
+    from conpot.protocols.s7comm.tpkt import TPKT
+
+    template_directory = initialize_template("default")
+    # loads the system status lists of the template
+    S7Server(
+        os.path.join(template_directory, "s7comm", "s7comm.xml"),
+        template_directory,
+        None,
+    )
+    return S7().parse(COTP().parse(TPKT().parse(S7_READ_SZL).payload).trailer)
+
+
+@case("s7comm.handle")
+def s7comm_handle():
+    request = _s7_request()
+    return lambda: request.handle("127.0.0.1")
+
+
+@case("s7comm.pack")
+def s7comm_pack():
+    from conpot.protocols.s7comm.cotp import COTP
+    from conpot.protocols.s7comm.s7 import S7
+    from conpot.protocols.s7comm.tpkt import TPKT
+
+    request = _s7_request()
+    parameters, data = request.handle("127.0.0.1")
+
+    def pack():
+        s7 = S7(7, 0, request.request_id, 0, parameters, data)
+        return TPKT(3, COTP(0xF0, 0x80, s7)).pack()
+
+    return pack
+
+
+@case("kamstrup_meter.get_request")
+def kamstrup_get_request():
+    from conpot.protocols.kamstrup_meter.request_parser import KamstrupRequestParser
+    from conpot.utils.networking import chr_py3
+
+    def get_request():
+        parser = KamstrupRequestParser()
+        for x in KAMSTRUP_GET_REGISTER:
+            parser.add_byte(chr_py3(x))
+        return parser.get_request()
+
+    return get_request
+
+
+@case("kamstrup_meter.decode_in")
+def kamstrup_decode_in():
+    from conpot.protocols.kamstrup_meter.decoder_382 import Decoder382
+
+    request = [chr(x) for x in KAMSTRUP_GET_REGISTER]
+    return lambda: Decoder382().decode_in(request)
+
+
+@case("IEC104.parse")
+def iec104_parse():
+    from conpot.protocols.IEC104.frames import i_frame
+
+    return lambda: i_frame(IEC104_INTERROGATION)
+
+
+@case("IEC104.build")
+def iec104_build():
+    from conpot.protocols.IEC104.frames import asdu_head, asdu_infobj_100, i_frame
+
+    # activation confirmation of the general interrogation
+    return lambda: (i_frame() / asdu_head(COT=7) / asdu_infobj_100(QOI=20)).build()
+
+
+@case("IEC104.inro_response")
+def iec104_inro_response():
+    import natsort
+
+    from conpot.protocols.IEC104.DeviceDataController import (
+        DeviceDataController,
+        inro_response,
+    )
+
+    template_directory = initialize_template("IEC104")
+    controller = DeviceDataController(
+        os.path.join(template_directory, "IEC104", "IEC104.xml")
+    )
+    sorted_reg = natsort.natsorted(list(controller.get_registers().items()))
+
+    def respond():
+        # all responses to a general interrogation, as built by IEC104.handle_inro_command100
+        return [
+            frame.build()
+            for asdu_type in (1, 3, 5, 7, 9, 11, 13)
+            for frame in inro_response(sorted_reg, asdu_type)
+        ]
+
+    return respond
+
+
+def _modbus_request(request):
+    from modbus_tk import modbus_tcp
+
+    from conpot.protocols.modbus.modbus_server import ModbusServer
+
+    template_directory = initialize_template("default")
+    server = ModbusServer(
+        os.path.join(template_directory, "modbus", "modbus.xml"),
+        template_directory,
+        None,
+    )
+    databank = server._databank
+    return lambda: databank.handle_request(modbus_tcp.TcpQuery(), request, server.mode)
+
+
+@case("modbus.read_coils")
+def modbus_read_coils():
+    return _modbus_request(MODBUS_READ_COILS)
+
+
+@case("modbus.read_holding_registers")
+def modbus_read_holding_registers():
+    return _modbus_request(MODBUS_READ_HOLDING_REGISTERS)
+
+
+@case("modbus.many_blocks")
+def modbus_many_blocks():
+    from modbus_tk import defines
+
+    from conpot.protocols.modbus.slave import MBSlave
+
+    # a PLC map of 500 blocks of 8 holding registers, read from a block in the middle
+    databus = core.get_databus()
+    slave = MBSlave(1)
+    for i in range(500):
+        databus.set_value("benchmarkBlock%d" % i, [i] * 8)
+        slave.add_block("benchmarkBlock%d" % i, defines.HOLDING_REGISTERS, i * 10, 8)
+    request = bytes.fromhex("03") + (250 * 10).to_bytes(2, "big") + b"\x00\x08"
+    return lambda: slave.handle_request(request)
+
+
+@case("http.template")
+def http_template():
+    from conpot.protocols.http.command_responder import TemplateParser
+
+    template_directory = initialize_template("default")
+    with open(os.path.join(template_directory, "http", "htdocs", "index.html")) as f:
+        page = f.read()
+    return lambda: TemplateParser(page).payload
+
+
+def measure(function, repeat=7):
+    """Return the best time per call in microseconds and the number of calls per repetition."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6, number
+
+
+def run(names=None, repeat=7):
+    results = {}
+    for name in names or cases:
+        # the cases share the databus, set up every case right before it is timed
+        function = cases[name]()
+        usec, loops = measure(function, repeat)
+        results[name] = {"usec": usec, "loops": loops}
+    core.get_databus().reset()
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Return (name, baseline usec, usec, change in percent) of the cases slower than the threshold allows."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        change = (result["usec"] - base["usec"]) / base["usec"] * 100
+        if change > threshold:
+            regressions.append((name, base["usec"], result["usec"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Microbenchmarks of the conpot protocol parsers and encoders."
+    )
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        metavar="case",
+        help="Cases to run, all by default: {0}".format(", ".join(cases)),
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="Allowed slowdown in percent, {0} by default.".format(THRESHOLD),
+    )
+    parser.add_argument(
+        "-b", "--baseline", default=BASELINE, help="Baseline results to compare with."
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=7, help="Repetitions per case."
+    )
+    parser.add_argument(
+        "-s", "--save", action="store_true", help="Store the results as baseline."
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - set(cases)
+    if unknown:
+        parser.error("unknown cases: {0}".format(", ".join(sorted(unknown))))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        baseline = stored["results"]
+        if stored.get("python") != platform.python_version():
+            print(
+                "Baseline was measured with Python {0}".format(stored.get("python")),
+                file=sys.stderr,
+            )
+
+    results = run(args.cases, args.repeat)
+    print("{0:<32} {1:>12} {2:>12} {3:>8}".format("case", "usec", "baseline", "change"))
+    for name, result in results.items():
+        base = baseline.get(name)
+        print(
+            "{0:<32} {1:>12.2f} {2:>12} {3:>8}".format(
+                name,
+                result["usec"],
+                "{0:.2f}".format(base["usec"]) if base else "",
+                (
+                    "{0:+.1f}%".format(
+                        (result["usec"] - base["usec"]) / base["usec"] * 100
+                    )
+                    if base
+                    else ""
+                ),
+            )
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "timestamp": datetime.datetime.utcnow().isoformat(),
+                    "python": platform.python_version(),
+                    "results": baseline,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, base, usec, change in regressions:
+        print(
+            "{0} regressed by {1:.1f}%: {2:.2f} usec, baseline {3:.2f} usec".format(
+                name, change, usec, base
+            ),
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Protocol server under benchmark, running in its own process so its CPU time and memory are measured apart from
+the load generator::
+
+    python -m conpot.tests.benchmarks.server <protocol> <port>
+
+Prints ``ready`` once the server accepts requests and runs until it is terminated.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import sys  # noqa: E402
+
+import gevent  # noqa: E402
+
+from conpot import core  # noqa: E402
+from conpot.utils.greenlet import init_test_server_by_name  # noqa: E402
+
+
+def drain_log_queue():
+    # the log worker does not run here, drop the events instead of queueing them forever
+    for _ in core.get_sessionManager().log_queue:
+        pass
+
+
+def start_server(name, port=0, template=None):
+    """Start the server of a protocol like the tests do, with the files the drivers request."""
+    server, greenlet = init_test_server_by_name(name, port=port, template=template)
+    if name == "tftp":
+        vfs, _ = core.get_vfs("tftp")
+        vfs.writebytes("benchmark.txt", b"conpot benchmark\n")
+    return server, greenlet
+
+
+def main(argv=None):
+    name, port = (argv or sys.argv[1:])[:2]
+    start_server(name, int(port))
+    gevent.spawn(drain_log_queue)
+    print("ready", flush=True)
+    gevent.wait()
+
+
+if __name__ == "__main__":
+    main()
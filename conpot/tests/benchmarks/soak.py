@@ -0,0 +1,432 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Soak test of the protocol servers of a template under a churning population of attackers::
+
+    python -m conpot.tests.benchmarks.soak [--template default] [--duration 3600] [--sources 5000] [-o soak.json]
+
+The servers run in this process together with the session expiry of the log worker, like in a sensor. Attackers
+connect from addresses of 127.0.0.0/8, every attacker picks one of the enabled protocols and sends a few requests.
+A part of the population is replaced by new addresses all the time. At every interval the resident memory, the
+number of greenlets, the largest allocations and the sizes of the per source structures of the servers are
+sampled, the report shows how fast each of them grew per hour.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse  # noqa: E402
+import configparser  # noqa: E402
+import datetime  # noqa: E402
+import gc  # noqa: E402
+import ipaddress  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import platform  # noqa: E402
+import random  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+
+import gevent  # noqa: E402
+import greenlet  # noqa: E402
+from lxml import etree  # noqa: E402
+
+import conpot  # noqa: E402
+from conpot import core  # noqa: E402
+from conpot.core.attack_session import AttackSession  # noqa: E402
+from conpot.core.log_worker import LogWorker  # noqa: E402
+from conpot.tests.benchmarks import git_commit  # noqa: E402
+from conpot.tests.benchmarks.drivers import IpmiDriver, drivers  # noqa: E402
+from conpot.tests.benchmarks.load import HOST, free_port  # noqa: E402
+from conpot.tests.benchmarks.server import start_server  # noqa: E402
+
+package_directory = os.path.dirname(conpot.__file__)
+# attackers use 127.2.0.0 and up, 127.0.0.1 stays free for other traffic
+FIRST_SOURCE = int(ipaddress.IPv4Address("127.2.0.0"))
+SOURCE_SPACE = 2**22
+TOP_ALLOCATIONS = 10
+
+
+class IpmiScanDriver(IpmiDriver):
+    # scanners ask for the authentication capabilities and leave, the session stays open
+
+    def exchange(self):
+        self.sock.sendto(self.REQUEST, self.address)
+        self.recv_datagram()
+
+
+soak_drivers = dict(drivers, ipmi=IpmiScanDriver)
+
+# name -> function returning the size of a structure of the server of a protocol, servers by protocol name
+structures = {
+    "SessionManager._sessions": lambda servers: len(
+        core.get_sessionManager()._sessions
+    ),
+    "AttackSession events": lambda servers: AttackSession.total_events,
+    "AttackSession memory": lambda servers: AttackSession.total_memory,
+    "IpmiServer.sessions": lambda servers: len(servers["ipmi"].sessions),
+    "TftpServer.sessions": lambda servers: len(servers["tftp"].sessions),
+    "EnipServer.connections": lambda servers: len(servers["enip"].connections),
+    "SNMP evasion_table": lambda servers: sum(
+        len(sources)
+        for sources in servers[
+            "snmp"
+        ].cmd_responder.databus_mediator.evasion_table.values()
+    ),
+}
+
+
+def template_protocols(template):
+    """Names of the protocols enabled by a template which have a driver."""
+    directory = os.path.join(package_directory, "templates", template)
+    names = []
+    for name in sorted(soak_drivers):
+        path = os.path.join(directory, name, name + ".xml")
+        if not os.path.exists(path):
+            continue
+        if etree.parse(path).getroot().get("enabled", "False").lower() == "true":
+            names.append(name)
+    return names
+
+
+class Population(object):
+    """Source addresses of the attackers, a fraction ``churn`` of the picks replaces a member by a new address."""
+
+    def __init__(self, size, churn, rng):
+        self.churn = churn
+        self.rng = rng
+        self.seen = 0
+        self.members = [self._new() for _ in range(size)]
+
+    def _new(self):
+        address = str(ipaddress.IPv4Address(FIRST_SOURCE + self.seen % SOURCE_SPACE))
+        self.seen += 1
+        return address
+
+    def pick(self):
+        index = self.rng.randrange(len(self.members))
+        if self.rng.random() < self.churn:
+            self.members[index] = self._new()
+        return self.members[index]
+
+
+class Soak(object):
+    def __init__(
+        self,
+        template,
+        protocols,
+        sources=5000,
+        churn=0.1,
+        concurrency=32,
+        max_requests=5,
+        seed=None,
+    ):
+        self.template = template
+        self.protocols = protocols
+        self.concurrency = concurrency
+        self.max_requests = max_requests
+        self.rng = random.Random(seed)
+        self.population = Population(sources, churn, self.rng)
+        self.servers = {}
+        self.addresses = {}
+        self.greenlets = []
+        self.requests = 0
+        self.errors = {}
+        self.samples = []
+        self.snapshots = []
+        self.started = None
+
+    def start(self, config):
+        core.get_sessionManager().configure(config)
+        # expires the sessions like in a sensor, without loggers configured it only drops the events
+        self.log_worker = LogWorker(config, None, core.get_sessionManager(), None)
+        self.greenlets.append(gevent.spawn(self.log_worker.start))
+        for name in self.protocols:
+            port = free_port(soak_drivers[name].kind)
+            server, server_greenlet = start_server(name, port, self.template)
+            self.servers[name] = server
+            self.addresses[name] = (HOST, port)
+            self.greenlets.append(server_greenlet)
+
+    def stop(self):
+        self.log_worker.stop()
+        for server in self.servers.values():
+            server.stop()
+        gevent.killall(self.greenlets, timeout=5)
+
+    def attack(self, deadline):
+        while time.monotonic() < deadline:
+            name = self.rng.choice(self.protocols)
+            driver = soak_drivers[name](self.addresses[name], self.population.pick())
+            try:
+                for _ in range(self.rng.randint(1, self.max_requests)):
+                    driver.request()
+                    self.requests += 1
+            except Exception as e:
+                key = "{0} {1}".format(name, type(e).__name__)
+                self.errors[key] = self.errors.get(key, 0) + 1
+            finally:
+                driver.close()
+
+    def sample(self):
+        sizes = {}
+        for name, size in structures.items():
+            try:
+                sizes[name] = size(self.servers)
+            except (KeyError, AttributeError):
+                # the protocol does not run
+                continue
+        sample = {
+            "elapsed": time.monotonic() - self.started,
+            "rss_kb": rss_kb(),
+            "greenlets": sum(
+                isinstance(o, greenlet.greenlet) for o in gc.get_objects()
+            ),
+            "requests": self.requests,
+            "sources": self.population.seen,
+            "structures": sizes,
+        }
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            sample["top_allocations"] = [
+                {
+                    "location": str(stat.traceback),
+                    "size_kb": stat.size / 1024,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+            ]
+            # the first and the latest snapshot, to report the growth of allocations
+            self.snapshots = (self.snapshots or [snapshot])[:1] + [snapshot]
+        self.samples.append(sample)
+        return sample
+
+    def run(self, duration, interval):
+        self.started = time.monotonic()
+        deadline = self.started + duration
+        attackers = [
+            gevent.spawn(self.attack, deadline) for _ in range(self.concurrency)
+        ]
+        self.sample()
+        while time.monotonic() < deadline:
+            gevent.sleep(min(interval, max(0, deadline - time.monotonic())))
+            report_sample(self.sample())
+        gevent.joinall(attackers)
+
+    def allocation_growth(self):
+        if len(self.snapshots) < 2:
+            return []
+        first, last = self.snapshots[0], self.snapshots[-1]
+        return [
+            {
+                "location": str(stat.traceback),
+                "size_diff_kb": stat.size_diff / 1024,
+                "count_diff": stat.count_diff,
+            }
+            for stat in last.compare_to(first, "lineno")[:TOP_ALLOCATIONS]
+        ]
+
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return None
+
+
+def slope(points):
+    """Least squares slope of (x, y) points."""
+    if len(points) < 2:
+        return 0.0
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def growth(samples):
+    """Growth per hour and last value of every sampled metric."""
+    series = {}
+    for sample in samples:
+        hours = sample["elapsed"] / 3600
+        values = dict(sample["structures"])
+        values["rss_kb"] = sample["rss_kb"]
+        values["greenlets"] = sample["greenlets"]
+        for name, value in values.items():
+            series.setdefault(name, []).append((hours, value))
+    return {
+        name: {"per_hour": slope(points), "last": points[-1][1]}
+        for name, points in series.items()
+    }
+
+
+def report_sample(sample):
+    print(
+        "{0:>8.0f}s rss {1} kB, {2} greenlets, {3} requests from {4} sources, {5}".format(
+            sample["elapsed"],
+            sample["rss_kb"],
+            sample["greenlets"],
+            sample["requests"],
+            sample["sources"],
+            ", ".join(
+                "{0} {1}".format(name, size)
+                for name, size in sample["structures"].items()
+            ),
+        ),
+        flush=True,
+    )
+
+
+def report(soak, results):
+    print("{0:<28} {1:>14} {2:>12}".format("metric", "growth / hour", "last"))
+    for name, values in results["growth"].items():
+        print(
+            "{0:<28} {1:>14.1f} {2:>12}".format(
+                name, values["per_hour"], values["last"]
+            )
+        )
+    if results["allocation_growth"]:
+        print("Largest growth of allocations:")
+        for stat in results["allocation_growth"]:
+            print(
+                "{0:>+12.1f} kB {1:>+9d}  {2}".format(
+                    stat["size_diff_kb"], stat["count_diff"], stat["location"]
+                )
+            )
+    if soak.errors:
+        print(
+            "Errors: {0}".format(
+                ", ".join(
+                    "{0} {1}".format(name, count)
+                    for name, count in sorted(soak.errors.items())
+                )
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Soak test the conpot protocol servers of a template on loopback."
+    )
+    parser.add_argument(
+        "protocols",
+        nargs="*",
+        metavar="protocol",
+        help="Protocols to attack, all enabled by the template by default.",
+    )
+    parser.add_argument("-t", "--template", default="default", help="Template name.")
+    parser.add_argument(
+        "-f",
+        "--config",
+        default=os.path.join(package_directory, "testing.cfg"),
+        help="Configuration, for the [session] settings.",
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=3600, help="Duration in seconds."
+    )
+    parser.add_argument(
+        "-i", "--interval", type=float, default=60, help="Seconds between samples."
+    )
+    parser.add_argument(
+        "-s", "--sources", type=int, default=5000, help="Attacker population size."
+    )
+    parser.add_argument(
+        "--churn",
+        type=float,
+        default=0.1,
+        help="Fraction of attacks from a new source address.",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=32, help="Concurrent attackers."
+    )
+    parser.add_argument(
+        "-r",
+        "--requests",
+        type=int,
+        default=5,
+        help="Maximum number of requests per attack.",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        type=int,
+        default=1,
+        metavar="FRAMES",
+        help="Frames traced per allocation, 0 disables tracing.",
+    )
+    parser.add_argument("--seed", type=int, help="Seed of the attacker choices.")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    enabled = template_protocols(args.template)
+    protocols = args.protocols or enabled
+    unknown = set(protocols) - set(enabled)
+    if unknown:
+        parser.error(
+            "not enabled by template {0}: {1}".format(
+                args.template, ", ".join(sorted(unknown))
+            )
+        )
+    config = configparser.ConfigParser()
+    config.read(args.config)
+
+    if args.tracemalloc:
+        tracemalloc.start(args.tracemalloc)
+    soak = Soak(
+        args.template,
+        protocols,
+        sources=args.sources,
+        churn=args.churn,
+        concurrency=args.concurrency,
+        max_requests=args.requests,
+        seed=args.seed,
+    )
+    soak.start(config)
+    try:
+        soak.run(args.duration, args.interval)
+    finally:
+        soak.stop()
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "template": args.template,
+        "protocols": protocols,
+        "requests": soak.requests,
+        "errors": soak.errors,
+        "growth": growth(soak.samples),
+        "allocation_growth": soak.allocation_growth(),
+        "samples": soak.samples,
+    }
+    report(soak, results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
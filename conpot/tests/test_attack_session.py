@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 from freezegun import freeze_time
 
-from conpot.core.attack_session import AttackSession
+from conpot.core.attack_session import AttackSession, SessionSummary
 
 
 class LogQueueFake:
@@ -159,3 +159,119 @@ def test_dump_collects_events():
 
     # TODO should this even include public_ip if it's always None?
     assert dump["public_ip"] is None
+
+
+@freeze_time("2000-01-01")
+def test_add_event_same_millisecond_gets_next_key():
+    session = AttackSession(
+        protocol=None,
+        source_ip=None,
+        source_port=None,
+        destination_ip=None,
+        destination_port=None,
+        log_queue=LogQueueFake(),
+    )
+
+    for i in range(3):
+        session.add_event({"i": i})
+
+    assert list(session.dump()["data"].keys()) == [0, 1, 2]
+    assert session.event_count == 3
+
+
+def test_history_is_capped():
+    log_queue = LogQueueFake()
+    session = AttackSession(
+        protocol=None,
+        source_ip=None,
+        source_port=None,
+        destination_ip=None,
+        destination_port=None,
+        log_queue=log_queue,
+        max_events=2,
+    )
+
+    for i in range(5):
+        session.add_event({"i": i})
+
+    # every event is still logged, only the last two are retained
+    assert len(log_queue.events) == 5
+    assert list(session.dump()["data"].values()) == [{"i": 3}, {"i": 4}]
+    assert session.event_count == 5
+
+
+def test_memory_is_accounted():
+    total_before = AttackSession.total_memory
+    events_before = AttackSession.total_events
+    session = AttackSession(
+        protocol=None,
+        source_ip=None,
+        source_port=None,
+        destination_ip=None,
+        destination_port=None,
+        log_queue=LogQueueFake(),
+        max_events=2,
+    )
+
+    session.add_event({"foo": "bar"})
+    assert session.memory > 0
+    assert AttackSession.total_memory == total_before + session.memory
+    assert AttackSession.total_events == events_before + 1
+
+    session.clear()
+    assert session.memory == 0
+    assert session.dump()["data"] == {}
+    assert AttackSession.total_memory == total_before
+    assert AttackSession.total_events == events_before
+
+
+def test_summary_mode_logs_once_on_end():
+    log_queue = LogQueueFake()
+    with freeze_time("2000-01-01") as frozen_time:
+        session = AttackSession(
+            protocol="modbus",
+            source_ip="1.2.3.4",
+            source_port=11,
+            destination_ip="5.6.7.8",
+            destination_port=22,
+            log_queue=log_queue,
+            log_mode="summary",
+            transcript_size=1,
+        )
+
+        session.add_event({"type": "NEW_CONNECTION"})
+        frozen_time.tick(timedelta(seconds=1))
+        session.add_event(
+            {"request": b"\x00\x01", "response": b"\x00\x01\x02", "function_code": 3}
+        )
+        frozen_time.tick(timedelta(seconds=1))
+        session.add_event({"request": b"\x00", "response": b"", "function_code": 1})
+        assert log_queue.events == []
+
+        session.set_ended()
+
+    assert len(log_queue.events) == 1
+    logged = log_queue.events[0]
+    assert logged["data_type"] == "modbus"
+    assert logged["data"]["type"] == "SESSION_SUMMARY"
+    summary = logged["data"]["summary"]
+    assert summary["events"] == 3
+    assert summary["bytes_in"] == 3
+    assert summary["bytes_out"] == 3
+    assert summary["first_event"] == datetime(2000, 1, 1)
+    assert summary["last_event"] == datetime(2000, 1, 1, 0, 0, 2)
+    assert summary["function_codes"] == [1, 3]
+    assert summary["event_types"] == ["NEW_CONNECTION"]
+    assert summary["transcript"] == [{"offset": 0, "event": {"type": "NEW_CONNECTION"}}]
+
+    # nothing new happened, so ending again does not log another summary
+    session.set_ended()
+    assert len(log_queue.events) == 1
+
+
+def test_summary_counts_encoded_str_payloads():
+    summary = SessionSummary()
+    summary.add(0, datetime(2000, 1, 1), {"request": "GET /\u00e9", "response": b"ok"})
+
+    assert summary.bytes_in == 7
+    assert summary.bytes_out == 2
@@ -0,0 +1,126 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import configparser
+import os
+import random
+
+import pytest
+
+import conpot
+from conpot import core
+from conpot.tests.benchmarks import load, micro, soak
+from conpot.tests.benchmarks.drivers import drivers
+from conpot.tests.benchmarks.server import start_server
+from conpot.utils.greenlet import teardown_test_server
+
+
+@pytest.mark.parametrize("name", sorted(drivers))
+def test_driver_gets_responses(name):
+    driver_class = drivers[name]
+    port = load.free_port(driver_class.kind)
+    server, greenlet = start_server(name, port)
+    driver = driver_class((load.HOST, port))
+    try:
+        for _ in range(2):
+            driver.request()
+    finally:
+        driver.close()
+        teardown_test_server(server, greenlet)
+
+
+def test_benchmark_results():
+    result = load.benchmark("modbus", concurrency=2, duration=0.5, warmup=0)
+
+    assert result["requests"] > 0
+    assert result["errors"] == {}
+    latency = result["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p99"] <= latency["max"]
+    assert result["rss_kb"] > 0
+
+
+def test_percentile():
+    ordered = list(range(1, 101))
+
+    assert load.percentile(ordered, 50) == 50
+    assert load.percentile(ordered, 99) == 99
+    assert load.percentile([7], 99) == 7
+    assert load.percentile([], 50) is None
+
+
+@pytest.mark.parametrize("name", list(micro.cases))
+def test_micro_benchmark_cases(name):
+    function = micro.cases[name]()
+
+    assert function()
+    core.get_databus().reset()
+
+
+def test_micro_benchmark_regressions():
+    baseline = {"a": {"usec": 10.0}, "b": {"usec": 10.0}, "c": {"usec": 10.0}}
+    results = {
+        "a": {"usec": 12.0},
+        "b": {"usec": 13.0},
+        "c": {"usec": 5.0},
+        "d": {"usec": 100.0},
+    }
+
+    assert micro.compare(results, baseline, threshold=25) == [("b", 10.0, 13.0, 30.0)]
+
+
+def test_soak_population_churns():
+    population = soak.Population(10, churn=0.5, rng=random.Random(1))
+    for _ in range(100):
+        population.pick()
+
+    assert len(population.members) == 10
+    assert 30 < population.seen < 90
+    assert population.members[0].startswith("127.")
+
+
+def test_soak_growth():
+    samples = [
+        {
+            "elapsed": hours * 3600,
+            "rss_kb": 1000 + hours * 10,
+            "greenlets": 5,
+            "structures": {"sessions": 2 * hours},
+        }
+        for hours in range(4)
+    ]
+
+    growth = soak.growth(samples)
+    assert growth["sessions"] == {"per_hour": 2.0, "last": 6}
+    assert growth["rss_kb"]["per_hour"] == 10.0
+    assert growth["greenlets"]["per_hour"] == 0.0
+
+
+def test_soak_samples_structures():
+    config = configparser.ConfigParser()
+    config.read(os.path.join(os.path.dirname(conpot.__file__), "testing.cfg"))
+    run = soak.Soak("default", ["ipmi", "modbus"], sources=20, concurrency=2, seed=1)
+    run.start(config)
+    try:
+        run.run(duration=1, interval=10)
+    finally:
+        run.stop()
+
+    assert run.requests > 0
+    last = run.samples[-1]
+    assert last["structures"]["IpmiServer.sessions"] > 0
+    assert last["structures"]["SessionManager._sessions"] > 0
+    core.get_sessionManager().purge_sessions()
@@ -0,0 +1,157 @@
+import time
+
+import gevent
+import pytest
+
+from conpot.core.databus import CachedValue, Databus
+
+
+def test_versions_and_changed_since():
+    databus = Databus()
+    databus.set_value("a", 1)
+    databus.set_value("b", 2)
+    sequence = databus.sequence
+
+    assert databus.version("a") < databus.version("b") == sequence
+    assert databus.version("missing") == 0
+    assert databus.changed_since(sequence) == []
+
+    databus.set_value("a", 3)
+    databus.set_value("c", 4)
+
+    assert databus.changed_since(sequence) == ["c", "a"]
+    assert databus.changed_since(0) == ["c", "a", "b"]
+    assert databus.version("a") == sequence + 1
+
+
+def test_sequence_survives_reset():
+    databus = Databus()
+    databus.set_value("a", 1)
+    sequence = databus.sequence
+
+    databus.reset()
+    databus.set_value("a", 1)
+
+    assert databus.changed_since(sequence) == ["a"]
+
+
+def test_observer_notifications_are_coalesced():
+    databus = Databus()
+    notified = []
+    databus.observe_value("a", notified.append)
+    databus.observe_value("b", notified.append)
+
+    for value in range(100):
+        databus.set_value("a", value)
+    databus.set_value("b", 0)
+    databus.set_value("unobserved", 0)
+    gevent.sleep(0)
+
+    assert notified == ["a", "b"]
+
+    databus.set_value("a", 0)
+    gevent.sleep(0)
+
+    assert notified == ["a", "b", "a"]
+
+
+def test_failing_observer_does_not_stop_dispatch():
+    databus = Databus()
+    notified = []
+
+    def fail(key):
+        raise ValueError(key)
+
+    databus.observe_value("a", fail)
+    databus.observe_value("b", notified.append)
+    databus.set_value("a", 0)
+    databus.set_value("b", 0)
+    gevent.sleep(0)
+
+    assert notified == ["b"]
+
+
+class Provider(object):
+    def __init__(self):
+        self.value = 0
+
+    def get_value(self):
+        self.value += 1
+        return self.value
+
+
+def test_handles_resolve_static_values_providers_and_callables():
+    databus = Databus()
+    databus.set_value("static", [1, 2])
+    databus.set_value("provider", Provider())
+    databus.set_value("callable", lambda: "called")
+
+    assert databus.handle("static").get_value() == [1, 2]
+    assert databus.handle("provider").get_value() == 1
+    assert databus.handle("provider").get_value() == 2
+    assert databus.handle("callable").get_value() == "called"
+    assert databus.handle("static") is databus.handle("static")
+
+
+def test_handles_follow_writes_and_resets():
+    databus = Databus()
+    handle = databus.handle("key")
+
+    with pytest.raises(AssertionError):
+        handle.get_value()
+
+    databus.set_value("key", 1)
+    assert handle.get_value() == 1
+    databus.set_value("key", lambda: 2)
+    assert handle.get_value() == 2
+
+    databus.reset()
+    with pytest.raises(AssertionError):
+        handle.get_value()
+    databus.set_value("key", 3)
+    assert handle.get_value() == 3
+
+
+def test_cached_value_calls_provider_once_per_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    provider = Provider()
+    cached = CachedValue(provider, 1.0)
+
+    assert [cached.get_value() for _ in range(3)] == [1, 1, 1]
+    now[0] += 1
+    assert cached.get_value() == 2
+
+
+def test_cached_value_refresh_is_single_flight():
+    calls = []
+
+    def provider():
+        calls.append(None)
+        gevent.sleep(0.01)
+        return len(calls)
+
+    cached = CachedValue(provider, 10)
+    readers = [gevent.spawn(cached.get_value) for _ in range(5)]
+    gevent.joinall(readers)
+
+    assert [reader.value for reader in readers] == [1] * 5
+    assert len(calls) == 1
+
+
+def test_initialize_wraps_providers_with_ttl(tmp_path):
+    template = tmp_path / "template.xml"
+    template.write_text("""<core><databus><key_value_mappings>
+        <key name="cached">
+            <value type="function" ttl="1.5">conpot.emulators.misc.sysinfo.CpuLoad</value>
+        </key>
+        <key name="uncached">
+            <value type="function">conpot.emulators.misc.sysinfo.CpuLoad</value>
+        </key>
+        </key_value_mappings></databus></core>""")
+    databus = Databus()
+    databus.initialize(str(template))
+
+    assert isinstance(databus._data["cached"], CachedValue)
+    assert databus._data["cached"].ttl == 1.5
+    assert not isinstance(databus._data["uncached"], CachedValue)
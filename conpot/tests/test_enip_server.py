@@ -18,11 +18,16 @@
 from gevent import monkey
 
 monkey.patch_all()
+import configparser
+import struct
 import unittest
+from unittest import mock
 
 from cpppo.server.enip import client
 from gevent import socket
 
+from conpot.core.metrics import MetricsRegistry
+from conpot.core.rate_limiter import RateLimiter
 from conpot.protocols.enip.enip_server import EnipServer
 from conpot.utils.greenlet import spawn_test_server, teardown_test_server
 
@@ -137,6 +142,28 @@ class TestENIPServer(unittest.TestCase):
                 response["item"][0]["communications_service"]["service_name"],
             )
 
+    def test_udp_datagrams_are_rate_limited(self):
+        config = configparser.ConfigParser()
+        config.read_dict({"rate_limit": {"enabled": "True", "rate": "0.01"}})
+        limiter = RateLimiter(MetricsRegistry())
+        limiter.configure(config)
+        # ListIdentity encapsulation header without data
+        request = struct.pack("<HHII8sI", 0x63, 0, 0, 0, b"\x00" * 8, 0)
+
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(2.0)
+        address = (self.enip_server_udp.addr, self.enip_server_udp.port)
+        with mock.patch("conpot.core.rateLimiter", limiter):
+            s.sendto(request, address)
+            response, _ = s.recvfrom(4096)
+            self.assertEqual(struct.unpack_from("<H", response)[0], 0x63)
+            # the burst of one datagram is used up
+            s.sendto(request, address)
+            with self.assertRaises(socket.timeout):
+                s.recvfrom(4096)
+        s.close()
+        self.assertEqual(limiter.rejected("enip").value, 1)
+
     def test_list_identity_tcp(self):
         with client.connector(
             host=self.enip_server_tcp.addr,
@@ -0,0 +1,72 @@
+import gevent
+import gevent.event
+import pytest
+
+from conpot.core.log_worker import LogSink
+
+
+class SlowLogger:
+    def __init__(self):
+        self.events = []
+        self.release = gevent.event.Event()
+
+    def log(self, event):
+        self.release.wait()
+        self.events.append(event)
+
+
+def test_sink_delivers_events_in_order():
+    events = []
+    sink = LogSink("test", events.append)
+    for i in range(5):
+        sink.put(i)
+    sink.stop()
+    assert events == [0, 1, 2, 3, 4]
+    assert sink.delivered == 5
+    assert sink.dropped == 0
+
+
+def test_sink_drop_newest():
+    slow = SlowLogger()
+    sink = LogSink("test", slow.log, queue_size=2, overflow="drop-newest")
+    sink.put(0)
+    gevent.sleep(0)  # consumer picks up the first event and blocks
+    for i in range(1, 5):
+        sink.put(i)
+    slow.release.set()
+    sink.stop()
+    assert slow.events == [0, 1, 2]
+    assert sink.dropped == 2
+    assert sink.delivered == 3
+
+
+def test_sink_drop_oldest():
+    slow = SlowLogger()
+    sink = LogSink("test", slow.log, queue_size=2, overflow="drop-oldest")
+    sink.put(0)
+    gevent.sleep(0)
+    for i in range(1, 5):
+        sink.put(i)
+    slow.release.set()
+    sink.stop()
+    assert slow.events == [0, 3, 4]
+    assert sink.dropped == 2
+    assert sink.delivered == 3
+
+
+def test_sink_failure_is_counted():
+    def broken(event):
+        raise RuntimeError("sink is down")
+
+    closed = []
+    sink = LogSink("test", broken, close=lambda: closed.append(True))
+    sink.put(0)
+    sink.stop()
+    assert sink.failed == 1
+    assert sink.delivered == 0
+    assert closed == [True]
+
+
+def test_sink_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        LogSink("test", print, overflow="explode")
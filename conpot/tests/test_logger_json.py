@@ -18,12 +18,14 @@
 from os import path
 from datetime import datetime
 
+import os
 import unittest
 import tempfile
 import shutil
 import json
+import gzip
 
-from conpot.core.loggers.json_log import JsonLogger
+from conpot.core.loggers.json_log import JsonLogger, get_encoder
 
 
 class TestJsonLogger(unittest.TestCase):
@@ -57,6 +59,7 @@ class TestJsonLogger(unittest.TestCase):
                 "data": {"request": request, "response": response},
             }
         )
+        json_logger.close()
 
         with open(filename, "r") as logfile:
             e = json.load(logfile)
@@ -71,3 +74,57 @@ class TestJsonLogger(unittest.TestCase):
             self.assertEqual(e["request"], request)
             self.assertEqual(e["response"], response)
             self.assertEqual(e["event_type"], None)
+
+    def _event(self, request="ping"):
+        return {
+            "timestamp": datetime.now(),
+            "id": 1337,
+            "remote": ("127.0.0.1", 2048),
+            "local": ("0.0.0.0", 502),
+            "data_type": "unittest",
+            "data": {"request": request, "response": "pong"},
+        }
+
+    def test_log_is_buffered(self):
+        filename = path.join(self.logging_dir, "test.json")
+        json_logger = JsonLogger(filename, "default", None, flush_interval=60000)
+        json_logger.log(self._event())
+        self.assertEqual(os.path.getsize(filename), 0)
+        json_logger.flush()
+        self.assertGreater(os.path.getsize(filename), 0)
+        json_logger.close()
+
+    def test_rotate_and_compress(self):
+        filename = path.join(self.logging_dir, "test.json")
+        json_logger = JsonLogger(
+            filename, "default", None, buffer_size=1, rotate_size=1, compress=True
+        )
+        json_logger.log(self._event("first"))
+        json_logger.log(self._event("second"))
+        json_logger.close()
+
+        rotated = sorted(f for f in os.listdir(self.logging_dir) if f.endswith(".gz"))
+        self.assertEqual(len(rotated), 2)
+        requests = []
+        for name in rotated:
+            with gzip.open(path.join(self.logging_dir, name), "rt") as logfile:
+                requests.extend(json.loads(line)["request"] for line in logfile)
+        self.assertEqual(requests, ["first", "second"])
+        self.assertEqual(os.path.getsize(filename), 0)
+
+    def test_payloads_are_hex_encoded(self):
+        filename = path.join(self.logging_dir, "test.json")
+        json_logger = JsonLogger(filename, "default", None)
+        json_logger.log(self._event(b"\x00\x01\xff"))
+        json_logger.close()
+
+        with open(filename, "r") as logfile:
+            self.assertEqual(json.load(logfile)["request"], "0001ff")
+
+    def test_encoders(self):
+        data = {"id": 1, "request": b"\x00"}
+        self.assertEqual(
+            json.loads(get_encoder("json")(data)), json.loads(get_encoder("auto")(data))
+        )
+        with self.assertRaises(ValueError):
+            get_encoder("yaml")
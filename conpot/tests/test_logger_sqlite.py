@@ -0,0 +1,84 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from os import path
+
+import unittest
+import tempfile
+import shutil
+import sqlite3
+
+import gevent
+
+from conpot.core.loggers.sqlite_log import SQLiteLogger
+
+
+class TestSQLiteLogger(unittest.TestCase):
+    def setUp(self):
+        self.logging_dir = tempfile.mkdtemp()
+        self.db_path = path.join(self.logging_dir, "logs", "conpot.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.logging_dir)
+
+    def _event(self, i):
+        return {
+            "id": "session-{}".format(i),
+            "remote": ("127.0.0.1", 2048),
+            "data_type": "unittest",
+            "data": {"request": "ping {}".format(i), "response": "pong"},
+        }
+
+    def _count(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def test_close_flushes_pending_events(self):
+        sqlite_logger = SQLiteLogger(self.db_path, batch_size=1000)
+        for i in range(10):
+            sqlite_logger.log(self._event(i))
+        sqlite_logger.close()
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT session, protocol, request, response FROM events ORDER BY id"
+            ).fetchall()
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[3], ("session-3", "unittest", "ping 3", "pong"))
+        self.assertEqual(journal_mode, "wal")
+
+    def test_flush_on_batch_size(self):
+        sqlite_logger = SQLiteLogger(self.db_path, batch_size=5, flush_interval=60000)
+        for i in range(7):
+            sqlite_logger.log(self._event(i))
+        sqlite_logger._pool.join()
+        self.assertEqual(self._count(), 5)
+        sqlite_logger.close()
+        self.assertEqual(self._count(), 7)
+
+    def test_flush_on_interval(self):
+        sqlite_logger = SQLiteLogger(self.db_path, batch_size=1000, flush_interval=10)
+        sqlite_logger.log(self._event(0))
+        gevent.sleep(0.1)
+        sqlite_logger._pool.join()
+        self.assertEqual(self._count(), 1)
+        sqlite_logger.close()
+
+    def test_invalid_synchronous_level(self):
+        with self.assertRaises(ValueError):
+            SQLiteLogger(self.db_path, synchronous="sometimes")
@@ -0,0 +1,105 @@
+import pytest
+from gevent import socket
+
+from conpot.core.metrics import (
+    MetricsRegistry,
+    MetricsServer,
+    track_connections,
+    track_latency,
+)
+from conpot.core import get_metrics
+from conpot.core.session_manager import SessionManager
+from conpot.utils.greenlet import spawn_startable_greenlet, teardown_test_server
+
+
+def test_render_counters_and_gauges():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "A counter", protocol="modbus").inc(3)
+    registry.gauge("test_open", "A gauge").set(2)
+    registry.callback("test_size", "A callback", lambda: 7, sink="json")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE test_total counter" in lines
+    assert 'test_total{protocol="modbus"} 3' in lines
+    assert "test_open 2" in lines
+    assert 'test_size{sink="json"} 7' in lines
+
+
+def test_same_labels_return_same_metric():
+    registry = MetricsRegistry()
+
+    counter = registry.counter("test_total", "A counter", protocol="modbus")
+
+    assert registry.counter("test_total", "A counter", protocol="modbus") is counter
+    assert registry.counter("test_total", "A counter", protocol="s7") is not counter
+    assert registry.protocol("modbus") is registry.protocol("modbus")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "A histogram", buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'test_seconds_bucket{le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{le="1"} 3' in lines
+    assert 'test_seconds_bucket{le="+Inf"} 4' in lines
+    assert "test_seconds_count 4" in lines
+
+
+def test_track_connections_and_latency():
+    metrics = get_metrics().protocol("test_decorators")
+
+    @track_connections("test_decorators")
+    def handle():
+        assert metrics.active_connections.value == 1
+
+    @track_latency("test_decorators")
+    def respond():
+        raise ValueError()
+
+    handle()
+    with pytest.raises(ValueError):
+        respond()
+
+    assert metrics.connections.value == 1
+    assert metrics.active_connections.value == 0
+    assert metrics.latency.count == 1
+
+
+def test_sessions_record_request_metrics():
+    manager = SessionManager()
+    session = manager.get_session("modbus", "1.2.3.4", 1000)
+
+    session.add_event({"request": b"\x00\x01", "response": b"\x00\x01\x02"})
+
+    metrics = manager.metrics.protocol("modbus")
+    assert metrics.requests.value == 1
+    assert metrics.bytes_in.value == 2
+    assert metrics.bytes_out.value == 3
+    assert "conpot_sessions 1" in manager.metrics.render().splitlines()
+
+
+def test_metrics_server():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "A counter").inc()
+    server = MetricsServer(registry)
+    greenlet = spawn_startable_greenlet(server, "127.0.0.1", 0)
+    while server.server is None or not server.server.started:
+        greenlet.join(0.01)
+
+    client = socket.create_connection(("127.0.0.1", server.server.server_port))
+    client.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+    response = b""
+    chunk = client.recv(4096)
+    while chunk:
+        response += chunk
+        chunk = client.recv(4096)
+    client.close()
+    teardown_test_server(server, greenlet)
+
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b"test_total 1" in response
@@ -0,0 +1,104 @@
+import struct
+
+import pytest
+
+from conpot.protocols.modbus.framer import (
+    FramingError,
+    RtuFramer,
+    RtuQuery,
+    TcpFramer,
+    check_datagram,
+    crc16,
+)
+
+READ_COILS = bytes.fromhex("000100000006010100010080")
+READ_HOLDING_REGISTERS = bytes.fromhex("00020000000602039c410008")
+
+
+class Socket(object):
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+
+    def recv_into(self, buffer):
+        chunk = self.chunks.pop(0)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def test_pipelined_requests():
+    framer = TcpFramer()
+    assert framer.read(Socket(READ_COILS + READ_HOLDING_REGISTERS)) == 24
+    assert framer.frames() == [READ_COILS, READ_HOLDING_REGISTERS]
+    assert framer.buffer == b""
+
+
+def test_split_request():
+    framer = TcpFramer()
+    sock = Socket(READ_COILS[:4], READ_COILS[4:9], READ_COILS[9:] + READ_COILS[:2])
+    framer.read(sock)
+    assert framer.frames() == []
+    framer.read(sock)
+    assert framer.frames() == []
+    framer.read(sock)
+    assert framer.frames() == [READ_COILS]
+    assert framer.buffer == READ_COILS[:2]
+
+
+@pytest.mark.parametrize("length", [b"\x00\x00", b"\x00\xff", b"\xff\xff"])
+def test_invalid_length(length):
+    framer = TcpFramer()
+    framer.read(Socket(b"\x00\x01\x00\x00" + length + b"\x01"))
+    with pytest.raises(FramingError):
+        framer.frames()
+
+
+# read 10 holding registers of slave 1, and write 2 of them
+RTU_READ_HOLDING_REGISTERS = bytes.fromhex("01030000000ac5cd")
+RTU_WRITE_MULTIPLE_REGISTERS = bytes.fromhex("011000010002040001000a")
+
+
+def test_crc16():
+    assert crc16(RTU_READ_HOLDING_REGISTERS[:-2]) == 0xCDC5
+    assert crc16(b"") == 0xFFFF
+
+
+def test_rtu_frames():
+    write = RTU_WRITE_MULTIPLE_REGISTERS
+    write += struct.pack("<H", crc16(write))
+    framer = RtuFramer()
+    sock = Socket(RTU_READ_HOLDING_REGISTERS + write[:5], write[5:9], write[9:])
+    framer.read(sock)
+    assert framer.frames() == [RTU_READ_HOLDING_REGISTERS]
+    framer.read(sock)
+    assert framer.frames() == []
+    framer.read(sock)
+    assert framer.frames() == [write]
+    assert framer.buffer == b""
+
+    # an unknown function code takes all data received
+    unknown = b"\x01\x64\x00"
+    unknown += struct.pack("<H", crc16(unknown))
+    framer.read(Socket(unknown))
+    assert framer.frames() == [unknown]
+
+    framer.read(Socket(RTU_READ_HOLDING_REGISTERS[:-1] + b"\x00"))
+    with pytest.raises(FramingError):
+        framer.frames()
+
+
+def test_rtu_query():
+    query = RtuQuery()
+    assert query.parse_request(RTU_READ_HOLDING_REGISTERS) == (
+        1,
+        b"\x03\x00\x00\x00\x0a",
+    )
+    response = query.build_response(b"\x03\x02\x00\x01")
+    assert response[:-2] == b"\x01\x03\x02\x00\x01"
+    assert struct.unpack("<H", response[-2:])[0] == crc16(response[:-2])
+
+
+def test_check_datagram():
+    check_datagram(READ_COILS)
+    for data in (READ_COILS[:6], READ_COILS + b"\x00", READ_COILS[:-1]):
+        with pytest.raises(FramingError):
+            check_datagram(data)
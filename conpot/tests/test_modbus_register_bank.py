@@ -0,0 +1,101 @@
+import struct
+
+import pytest
+from modbus_tk import defines
+from modbus_tk.exceptions import ModbusError
+
+import conpot.core as conpot_core
+from conpot.protocols.modbus.register_bank import RegisterBank, pack_bits, unpack_bits
+from conpot.protocols.modbus.slave import MBSlave
+
+
+@pytest.fixture
+def databus():
+    databus = conpot_core.get_databus()
+    yield databus
+    databus.reset()
+
+
+def test_pack_and_unpack_bits():
+    bits = [1, 0, 0, 1, 0, 0, 1, 1, 1]
+    assert pack_bits(bits) == b"\xc9\x01"
+    assert unpack_bits(b"\xc9\x01", 9) == bits
+    assert pack_bits([]) == b""
+
+
+def test_register_bank():
+    bank = RegisterBank.for_block(defines.HOLDING_REGISTERS, [1, 2, 0x1234])
+    assert bank.typecode == "H"
+    assert bank == [1, 2, 0x1234]
+    assert bank.pack_registers(1, 2) == b"\x00\x02\x12\x34"
+
+    bank[0:2] = [7, 8]
+    assert bank == [7, 8, 0x1234]
+    with pytest.raises(ValueError):
+        bank[0:2] = [1]
+    with pytest.raises(OverflowError):
+        bank[0] = 0x10000
+
+    coils = RegisterBank.for_block(defines.COILS, [True, 0, 5])
+    assert coils.typecode == "B"
+    assert list(coils) == [1, 0, 1]
+    assert coils.pack_bits(0, 3) == b"\x05"
+
+
+def test_slave_reads_and_writes_registers(databus):
+    databus.set_value("testRegisters", [0] * 8)
+    slave = MBSlave(1, None)
+    slave.add_block("testRegisters", defines.HOLDING_REGISTERS, 40001, 8)
+    assert isinstance(databus.get_value("testRegisters"), RegisterBank)
+
+    request = struct.pack(
+        ">BHHB3H", defines.WRITE_MULTIPLE_REGISTERS, 40002, 3, 6, 1, 2, 0xFFFF
+    )
+    assert slave.handle_request(request) == struct.pack(
+        ">BHH", defines.WRITE_MULTIPLE_REGISTERS, 40002, 3
+    )
+    assert databus.get_value("testRegisters") == [0, 1, 2, 0xFFFF, 0, 0, 0, 0]
+
+    request = struct.pack(">BHH", defines.READ_HOLDING_REGISTERS, 40001, 5)
+    assert slave.handle_request(request) == struct.pack(
+        ">BB5H", defines.READ_HOLDING_REGISTERS, 10, 0, 1, 2, 0xFFFF, 0
+    )
+
+
+def test_slave_reads_and_writes_coils(databus):
+    databus.set_value("testCoils", [0] * 16)
+    slave = MBSlave(1, None)
+    slave.add_block("testCoils", defines.COILS, 1, 16)
+
+    request = struct.pack(">BHHBB", defines.WRITE_MULTIPLE_COILS, 2, 5, 1, 0x1D)
+    slave.handle_request(request)
+    assert databus.get_value("testCoils") == [0, 1, 0, 1, 1, 1] + [0] * 10
+
+    request = struct.pack(">BHH", defines.READ_COILS, 1, 10)
+    assert slave.handle_request(request) == struct.pack(
+        ">BBBB", defines.READ_COILS, 2, 0x3A, 0x00
+    )
+
+
+def test_slave_accepts_plain_lists(databus):
+    # lists set after the block is created keep working
+    databus.set_value("testRegisters", [0] * 4)
+    slave = MBSlave(1, None)
+    slave.add_block("testRegisters", defines.HOLDING_REGISTERS, 40001, 4)
+    databus.set_value("testRegisters", [1, 2, 3, 4])
+
+    request = struct.pack(">BHH", defines.READ_HOLDING_REGISTERS, 40002, 2)
+    assert slave.handle_request(request) == struct.pack(
+        ">BB2H", defines.READ_HOLDING_REGISTERS, 4, 2, 3
+    )
+
+
+def test_slave_rejects_short_writes(databus):
+    databus.set_value("testRegisters", [0] * 4)
+    slave = MBSlave(1, None)
+    slave.add_block("testRegisters", defines.HOLDING_REGISTERS, 40001, 4)
+
+    request = struct.pack(">BHHBH", defines.WRITE_MULTIPLE_REGISTERS, 40001, 2, 4, 1)
+    with pytest.raises(ModbusError):
+        slave._write_multiple_registers(request)
+    assert databus.get_value("testRegisters") == [0] * 4
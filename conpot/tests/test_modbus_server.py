@@ -19,6 +19,10 @@ from gevent import monkey
 
 monkey.patch_all()
 
+import gevent
+import os
+import struct
+import tempfile
 import unittest
 import modbus_tk.defines as cst
 import modbus_tk.modbus_tcp as modbus_tcp
@@ -27,9 +31,15 @@ from datetime import datetime
 from modbus_tk.exceptions import ModbusError
 from gevent import socket
 
+import conpot
 import conpot.core as conpot_core
 from conpot.protocols.modbus import modbus_server
-from conpot.utils.greenlet import spawn_test_server, teardown_test_server
+from conpot.protocols.modbus.framer import crc16
+from conpot.utils.greenlet import (
+    spawn_startable_greenlet,
+    spawn_test_server,
+    teardown_test_server,
+)
 
 
 class TestModbusServer(unittest.TestCase):
@@ -160,15 +170,15 @@ class TestModbusServer(unittest.TestCase):
         self.assertEqual("127.0.0.1", modbus_log_item["remote"][0])
         self.assertEqual("modbus", modbus_log_item["data_type"])
 
-        req = (
+        req = bytes.fromhex(
             "000100000006%s0100010080" % ("01" if self.target_slave_id == 1 else "ff")
-        ).encode()
-        # testing the actual modbus data
+        )
+        # testing the actual modbus data, payloads are logged as raw bytes
         modbus_expected_payload = {
             "function_code": 1,
             "slave_id": self.target_slave_id,
             "request": req,
-            "response": b"0110ffffffffffffffffffffffffffffffff",
+            "response": bytes.fromhex("0110ffffffffffffffffffffffffffffffff"),
         }
 
         self.assertDictEqual(modbus_expected_payload, modbus_log_item["data"])
@@ -192,3 +202,132 @@ class TestModbusServer(unittest.TestCase):
         data = s.recv(1024)
         s.close()
         self.assertTrue(b"SIMATIC" in data and b"Siemens" in data)
+
+    def test_pipelined_requests(self):
+        """
+        Objective: Test if requests sent in one segment, or split over several, are all answered in order.
+        """
+        self.databus.set_value(
+            "memoryModbusSlave%dBlockA" % self.target_slave_id, [1] * 128
+        )
+        report_slave_id = b"\x00\x01\x00\x00\x00\x02\x01\x11"
+        read_coil = b"\x00\x02\x00\x00\x00\x06\x01\x01\x00\x01\x00\x01"
+        expected = (
+            b"\x00\x01\x00\x00\x00\x06\x01\x11\x11\x01\x01\xff"
+            b"\x00\x02\x00\x00\x00\x04\x01\x01\x01\x01"
+        )
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(1.0)
+        s.connect((self.host, self.port))
+        s.sendall(report_slave_id + read_coil[:3])
+        gevent.sleep(0.1)
+        s.sendall(read_coil[3:])
+        data = b""
+        while len(data) < len(expected):
+            chunk = s.recv(1024)
+            if not chunk:
+                break
+            data += chunk
+        s.close()
+        self.assertEqual(data, expected)
+
+
+class TestModbusTransports(unittest.TestCase):
+    def setUp(self):
+        conpot_core.get_sessionManager().purge_sessions()
+
+        template_directory = os.path.join(
+            os.path.dirname(conpot.__file__), "templates", "default"
+        )
+        with open(os.path.join(template_directory, "modbus", "modbus.xml")) as f:
+            template = f.read().replace(
+                "<slaves>",
+                '<transports><udp/><rtu_over_tcp port="0"/></transports><slaves>',
+            )
+        self.template_file = tempfile.NamedTemporaryFile(suffix=".xml", delete=False)
+        self.template_file.write(template.encode())
+        self.template_file.close()
+
+        self.databus = conpot_core.get_databus()
+        self.databus.initialize(os.path.join(template_directory, "template.xml"))
+        self.template_directory = template_directory
+        self.modbus = modbus_server.ModbusServer(
+            self.template_file.name, template_directory, None
+        )
+        self.greenlet = spawn_startable_greenlet(self.modbus, "127.0.0.1", 0)
+        self.greenlet.scheduled_once.wait()
+        self.databus.set_value("memoryModbusSlave1BlockA", [1] * 128)
+
+    def tearDown(self):
+        teardown_test_server(self.modbus, self.greenlet)
+        os.unlink(self.template_file.name)
+
+    def test_udp(self):
+        """
+        Objective: Test if Modbus/UDP requests are answered next to Modbus/TCP, on the same port number.
+        """
+        self.assertEqual(
+            self.modbus.udp_server.server_port, self.modbus.server.server_port
+        )
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(1.0)
+        address = ("127.0.0.1", self.modbus.udp_server.server_port)
+        s.sendto(b"\x00\x07\x00\x00\x00\x06\x01\x01\x00\x01\x00\x08", address)
+        data, _ = s.recvfrom(1024)
+        self.assertEqual(data, b"\x00\x07\x00\x00\x00\x04\x01\x01\x01\xff")
+        session = conpot_core.get_sessionManager()._find_sessions("modbus", "127.0.0.1")
+        self.assertEqual(session.destination_ip, "127.0.0.1")
+        self.assertEqual(session.destination_port, address[1])
+
+        # datagrams not holding exactly one ADU are ignored
+        s.sendto(b"\x00\x08\x00\x00\x00\x06\x01\x01\x00\x01", address)
+        with self.assertRaises(socket.timeout):
+            s.recvfrom(1024)
+        s.close()
+
+    def test_udp_wildcard_bind(self):
+        """
+        Objective: Test if Modbus/UDP sessions of a wildcard bind carry the address the datagram was sent to.
+        """
+        modbus = modbus_server.ModbusServer(
+            self.template_file.name, self.template_directory, None
+        )
+        greenlet = spawn_startable_greenlet(modbus, "0.0.0.0", 0)
+        greenlet.scheduled_once.wait()
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.settimeout(1.0)
+            address = ("127.0.0.1", modbus.udp_server.server_port)
+            s.sendto(b"\x00\x07\x00\x00\x00\x06\x01\x01\x00\x01\x00\x08", address)
+            s.recvfrom(1024)
+            s.close()
+        finally:
+            teardown_test_server(modbus, greenlet)
+        session = conpot_core.get_sessionManager()._find_sessions("modbus", "127.0.0.1")
+        self.assertEqual(session.destination_ip, "127.0.0.1")
+        self.assertEqual(session.destination_port, address[1])
+
+    def test_rtu_over_tcp(self):
+        """
+        Objective: Test if RTU framed requests are answered on the RTU over TCP port.
+        """
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(1.0)
+        s.connect(("127.0.0.1", self.modbus.rtu_server.server_port))
+        # report slave id and read 8 coils of slave 1, in one segment
+        s.sendall(bytes.fromhex("0111c02c") + bytes.fromhex("0101000100086c0c"))
+        expected = bytes.fromhex("0111110101ff") + bytes.fromhex("010101ff")
+        expected = [expected[:6], expected[6:]]
+        expected = b"".join(e + struct.pack("<H", crc16(e)) for e in expected)
+        data = b""
+        while len(data) < len(expected):
+            chunk = s.recv(1024)
+            if not chunk:
+                break
+            data += chunk
+        self.assertEqual(data, expected)
+
+        # an invalid CRC closes the connection
+        s.sendall(bytes.fromhex("010100010008 0000"))
+        self.assertEqual(s.recv(1024), b"")
+        s.close()
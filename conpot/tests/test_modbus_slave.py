@@ -0,0 +1,103 @@
+import struct
+
+import pytest
+from modbus_tk import defines
+from modbus_tk.exceptions import ModbusError
+from modbus_tk.modbus import OverlapModbusBlockError
+
+import conpot.core as conpot_core
+from conpot.protocols.modbus.slave import MBSlave, compile_device_identification
+
+DEVICE_INFO = {0: "Siemens", 1: "SIMATIC", 2: "S7-200", 4: "CPU 224", 0x80: "X" * 3}
+
+
+def read_device_id(slave, code, object_id=0):
+    return slave.handle_request(struct.pack(">BBBB", 0x2B, 0x0E, code, object_id))
+
+
+def test_device_identification_categories():
+    slave = MBSlave(1, DEVICE_INFO)
+
+    basic = read_device_id(slave, 1)
+    assert basic[:7] == b"\x2b\x0e\x01\x83\x00\x00\x03"
+    assert basic[7:] == b"\x00\x07Siemens\x01\x07SIMATIC\x02\x06S7-200"
+    regular = read_device_id(slave, 2)
+    assert regular[6] == 4 and regular.endswith(b"\x04\x07CPU 224")
+    extended = read_device_id(slave, 3)
+    assert extended[6] == 5 and extended.endswith(b"\x80\x03XXX")
+    # a stream restarts at its first object
+    assert read_device_id(slave, 1, 2) == basic
+
+
+def test_device_identification_individual_object():
+    slave = MBSlave(1, DEVICE_INFO)
+
+    assert read_device_id(slave, 4, 4) == b"\x2b\x0e\x04\x83\x00\x00\x01\x04\x07CPU 224"
+    assert read_device_id(slave, 4, 3) == struct.pack(
+        ">BB", 0x2B + 0x80, defines.ILLEGAL_DATA_ADDRESS
+    )
+    assert read_device_id(slave, 5) == struct.pack(
+        ">BB", 0x2B + 0x80, defines.ILLEGAL_DATA_VALUE
+    )
+    assert MBSlave(1, None).handle_request(b"\x2b\x0e\x01\x00") == struct.pack(
+        ">BB", 0x2B + 0x80, defines.ILLEGAL_FUNCTION
+    )
+
+
+def test_device_identification_more_follows():
+    device_info = {object_id: "x" * 100 for object_id in range(0x80, 0x85)}
+    device_info.update({0: "a", 1: "b", 2: "c"})
+    responses = compile_device_identification(device_info)
+
+    first = responses[(3, None)]
+    assert first[3:6] == b"\xff\x82\x05"
+    second = responses[(3, 0x82)]
+    assert second[3:6] == b"\xff\x84\x02"
+    third = responses[(3, 0x84)]
+    assert third[3:6] == b"\x00\x00\x01"
+    assert max(len(first), len(second), len(third)) <= 252
+
+
+def test_report_slave_id():
+    assert MBSlave(1).handle_request(b"\x11") == b"\x11\x11\x01\x01\xff"
+
+
+@pytest.fixture
+def databus():
+    databus = conpot_core.get_databus()
+    yield databus
+    databus.reset()
+
+
+def test_block_index(databus):
+    slave = MBSlave(1)
+    # added out of order, with a gap between 30 and 40
+    for start in (40, 10, 20, 0, 50):
+        databus.set_value("block%d" % start, list(range(start, start + 10)))
+        slave.add_block("block%d" % start, defines.HOLDING_REGISTERS, start, 10)
+    index = slave._memory[defines.HOLDING_REGISTERS]
+    assert [block.starting_address for block in index] == [0, 10, 20, 40, 50]
+
+    for start in (5, 45, 59):
+        databus.set_value("overlap", [0] * 10)
+        with pytest.raises(OverlapModbusBlockError):
+            slave.add_block("overlap", defines.HOLDING_REGISTERS, start, 10)
+
+    block, offset = index.find(25, 5)
+    assert (block.starting_address, offset) == (20, 5)
+    assert slave.get_values("block40", 42, 2) == (42, 43)
+
+    request = struct.pack(">BHH", defines.READ_HOLDING_REGISTERS, 12, 3)
+    assert slave.handle_request(request)[2:] == struct.pack(">3H", 12, 13, 14)
+    # ranges across two blocks, into the gap, inside the gap, across the end and past the last block
+    for address, count in ((18, 4), (28, 4), (32, 1), (58, 4), (60, 1)):
+        request = struct.pack(">BHH", defines.READ_HOLDING_REGISTERS, address, count)
+        assert slave.handle_request(request) == struct.pack(
+            ">BB", defines.READ_HOLDING_REGISTERS + 0x80, defines.ILLEGAL_DATA_ADDRESS
+        )
+
+    slave.remove_block("block20")
+    with pytest.raises(ModbusError):
+        index.find(25, 1)
+    slave.remove_all_blocks()
+    assert len(slave._memory[defines.HOLDING_REGISTERS]) == 0
@@ -15,6 +15,9 @@
 # Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import subprocess
+import sys
+
 import pytest
 
 from conpot import protocols
@@ -41,3 +44,14 @@ def test_protocols_serve_forever(name):
 
     server.stop()
     greenlet.join(0.2)
+
+
+def test_server_modules_are_imported_on_lookup():
+    code = (
+        "import sys; from conpot import protocols; "
+        "assert 'conpot.protocols.snmp.snmp_server' not in sys.modules; "
+        "protocols.name_mapping['modbus']; "
+        "assert 'conpot.protocols.modbus.modbus_server' in sys.modules; "
+        "assert 'conpot.protocols.snmp.snmp_server' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,110 @@
+import configparser
+
+import pytest
+
+from conpot.core import rate_limiter
+from conpot.core.metrics import MetricsRegistry
+from conpot.core.rate_limiter import RateLimiter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    return clock
+
+
+def make_limiter(**options):
+    config = configparser.ConfigParser()
+    config.read_dict({"rate_limit": dict(enabled="True", **options)})
+    limiter = RateLimiter(MetricsRegistry())
+    limiter.configure(config)
+    return limiter
+
+
+def test_disabled_limiter_allows_everything():
+    limiter = RateLimiter(MetricsRegistry())
+
+    assert all(limiter.allow("modbus", "1.2.3.4") for _ in range(1000))
+
+
+def test_per_source_burst_and_refill(clock):
+    limiter = make_limiter(rate="1", burst="3")
+
+    assert [limiter.allow("modbus", "1.2.3.4") for _ in range(4)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    # other sources have their own bucket
+    assert limiter.allow("modbus", "4.3.2.1")
+
+    clock.now += 1
+    assert limiter.allow("modbus", "1.2.3.4")
+    assert not limiter.allow("modbus", "1.2.3.4")
+    assert limiter.rejected("modbus").value == 2
+
+
+def test_protocol_override(clock):
+    limiter = make_limiter(rate="1", modbus_rate="0")
+
+    assert all(limiter.allow("modbus", "1.2.3.4") for _ in range(10))
+    assert limiter.allow("s7comm", "1.2.3.4")
+    assert not limiter.allow("s7comm", "1.2.3.4")
+
+
+def test_global_limit(clock):
+    limiter = make_limiter(global_rate="2")
+
+    assert limiter.allow("modbus", "1.1.1.1")
+    assert limiter.allow("snmp", "2.2.2.2")
+    assert not limiter.allow("modbus", "3.3.3.3")
+
+    clock.now += 0.5
+    assert limiter.allow("modbus", "3.3.3.3")
+
+
+def test_source_table_is_bounded(clock):
+    limiter = make_limiter(rate="1", max_sources="2")
+
+    for source in ("1.1.1.1", "2.2.2.2", "3.3.3.3"):
+        assert limiter.allow("modbus", source)
+
+    assert len(limiter._protocol("modbus")) == 2
+    # the oldest source was forgotten and starts with a full bucket
+    assert limiter.allow("modbus", "1.1.1.1")
+    assert not limiter.allow("modbus", "3.3.3.3")
+
+
+def test_rate_limited_closes_rejected_connections(clock, monkeypatch):
+    limiter = make_limiter(rate="1")
+    monkeypatch.setattr("conpot.core.rateLimiter", limiter)
+
+    class Socket(object):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    handled = []
+
+    @rate_limiter.rate_limited("modbus")
+    def handle(sock, address):
+        handled.append(sock)
+
+    first, second = Socket(), Socket()
+    handle(first, ("1.2.3.4", 1000))
+    handle(second, ("1.2.3.4", 1001))
+
+    assert handled == [first]
+    assert not first.closed
+    assert second.closed
@@ -19,7 +19,11 @@ from gevent import monkey
 
 monkey.patch_all()
 import unittest
-from conpot.protocols.s7comm.s7_server import S7Server
+from gevent import socket
+from conpot.protocols.s7comm.cotp import COTP
+from conpot.protocols.s7comm.s7 import S7
+from conpot.protocols.s7comm.s7_server import S7Server, recv_tpkt
+from conpot.protocols.s7comm.tpkt import TPKT
 from conpot.tests.helpers import s7comm_client
 from conpot.utils.greenlet import spawn_test_server, teardown_test_server
 
@@ -85,3 +89,39 @@ class TestS7Server(unittest.TestCase):
             except AssertionError:
                 print((sec, item, val))
                 raise
+
+    def test_frame_with_0x62_bytes(self):
+        """
+        Objective: Test if frames are parsed and packed unaltered, including the byte 0x62 ("b").
+        """
+        # read SZL 0x0011 with request id 0x6262, TPKT / COTP DT / S7 userdata
+        frame = bytes.fromhex(
+            "0300002102f080320700006262000800080001120411440100ff09000400110001"
+        )
+        tpkt = TPKT().parse(frame)
+        cotp = COTP().parse(tpkt.payload)
+        s7 = S7().parse(cotp.trailer)
+        self.assertIsInstance(s7.parameters, memoryview)
+        self.assertEqual(s7.request_id, 0x6262)
+        self.assertEqual(s7.param, 0x00)
+
+        packed = TPKT(
+            3, COTP(0xF0, 0x80, S7(7, 0, 0x6262, 0, s7.parameters, s7.data))
+        ).pack()
+        self.assertEqual(packed, frame)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(1.0)
+        sock.connect((self.server_host, self.server_port))
+        # COTP connection request, then an S7 setup communication with request id 0x6262
+        sock.sendall(bytes.fromhex("0300001611e00000000100c0010ac1020100c2020102"))
+        self.assertEqual(recv_tpkt(sock)[5], 0xD0)
+        sock.sendall(
+            bytes.fromhex("0300001902f08032010000626200080000f0000001000101e0")
+        )
+        response = S7().parse(
+            COTP().parse(TPKT().parse(recv_tpkt(sock)).payload).trailer
+        )
+        sock.close()
+        self.assertEqual(response.request_id, 0x6262)
+        self.assertEqual(response.pdu_type, 3)
@@ -0,0 +1,110 @@
+from configparser import ConfigParser
+from datetime import timedelta
+
+import pytest
+
+from conpot.core.attack_session import AttackSession
+from conpot.core.session_manager import SessionManager
+
+
+def test_get_session_returns_same_session_per_protocol_and_ip():
+    manager = SessionManager()
+
+    session = manager.get_session("modbus", "1.2.3.4", 1000)
+
+    assert manager.get_session("modbus", "1.2.3.4", 1001) is session
+    assert manager.get_session("s7comm", "1.2.3.4", 1000) is not session
+    assert manager.get_session("modbus", "4.3.2.1", 1000) is not session
+    assert len(manager) == 3
+
+
+def test_expire_sessions_evicts_idle_sessions():
+    manager = SessionManager()
+    session = manager.get_session("modbus", "1.2.3.4", 1000)
+    now = session.last_activity
+
+    assert manager.expire_sessions(30, now=now + timedelta(seconds=29)) == []
+    assert manager.expire_sessions(30, now=now + timedelta(seconds=30)) == [session]
+    assert session._ended
+    assert len(manager) == 0
+    assert manager.get_session("modbus", "1.2.3.4", 1000) is not session
+
+
+def test_expire_sessions_keeps_active_sessions():
+    manager = SessionManager()
+    idle = manager.get_session("modbus", "1.2.3.4", 1000)
+    active = manager.get_session("modbus", "4.3.2.1", 1000)
+    start = idle.last_activity
+
+    active.last_activity = start + timedelta(seconds=20)
+    assert manager.expire_sessions(30, now=start + timedelta(seconds=30)) == [idle]
+    assert not active._ended
+    assert manager.get_session("modbus", "4.3.2.1", 1000) is active
+
+    assert manager.expire_sessions(30, now=start + timedelta(seconds=50)) == [active]
+    assert len(manager) == 0
+
+
+def test_purge_sessions_drops_sessions():
+    manager = SessionManager()
+    session = manager.get_session("modbus", "1.2.3.4", 1000)
+
+    manager.purge_sessions()
+
+    assert len(manager) == 0
+    assert (
+        manager.expire_sessions(0, now=session.last_activity + timedelta(seconds=1))
+        == []
+    )
+
+
+def test_removed_sessions_leave_the_totals():
+    manager = SessionManager()
+    total_events = AttackSession.total_events
+    total_memory = AttackSession.total_memory
+    expired = manager.get_session("modbus", "1.2.3.4", 1000)
+    purged = manager.get_session("modbus", "4.3.2.1", 1000)
+    expired.add_event({"request": b"\x00" * 10})
+    purged.add_event({"request": b"\x00" * 10})
+    assert AttackSession.total_events == total_events + 2
+
+    manager.expire_sessions(0, now=expired.last_activity)
+    manager.purge_sessions()
+    # handlers still holding a removed session keep adding events to it
+    expired.add_event({"request": b"\x00" * 10})
+    purged.add_event({"request": b"\x00" * 10})
+
+    assert AttackSession.total_events == total_events
+    assert AttackSession.total_memory == total_memory
+
+
+def test_summary_mode_requires_the_json_logger():
+    config = ConfigParser()
+    config.read_dict({"session": {"log_mode": "summary"}, "json": {"enabled": False}})
+    manager = SessionManager()
+
+    with pytest.raises(ValueError):
+        manager.configure(config)
+    assert manager.log_mode == "event"
+
+    config["json"]["enabled"] = "True"
+    manager.configure(config)
+    assert manager.log_mode == "summary"
+
+
+def test_summary_mode_logs_events_added_after_expiry():
+    manager = SessionManager()
+    manager.log_mode = "summary"
+    session = manager.get_session("modbus", "1.2.3.4", 1000)
+    session.add_event({"request": b"\x00", "function_code": 3})
+
+    manager.expire_sessions(0, now=session.last_activity)
+    assert manager.log_queue.get_nowait()["data"]["summary"]["events"] == 1
+    # a handler still holding the expired session adds another event
+    session.add_event({"request": b"\x00\x01", "function_code": 1})
+
+    summary = manager.log_queue.get_nowait()["data"]["summary"]
+    assert summary["events"] == 1
+    assert summary["bytes_in"] == 2
+    assert summary["function_codes"] == [1]
+    assert manager.log_queue.empty()
@@ -21,6 +21,8 @@ from tempfile import TemporaryDirectory
 import pytest
 from pysnmp.smi.error import MibNotFoundError
 
+import conpot
+from conpot.protocols.snmp import mib_bundle
 from conpot.protocols.snmp.command_responder import CommandResponder
 
 
@@ -44,3 +46,29 @@ def test_register_loads_custom_mib():
         responder.register("VOGON-POEM-MIB", "poemNumber", (0,), 42, None)
 
         assert responder._get_mibSymbol("VOGON-POEM-MIB", "poemNumber")
+
+
+def test_mib_bundle_is_loaded_without_compiler():
+    template_directory = os.path.join(
+        os.path.dirname(conpot.__file__), "templates", "snmp"
+    )
+    bundle = mib_bundle.find_bundle(template_directory, ["HOST-RESOURCES-MIB"])
+    assert bundle
+
+    responder = CommandResponder("", 0, "/tmp", None, bundle)
+    responder.load_mibs("HOST-RESOURCES-MIB", "IF-MIB")
+
+    mib_builder = responder.snmpEngine.getMibBuilder()
+    assert mib_builder.getMibCompiler() is None
+    assert responder._get_mibSymbol("HOST-RESOURCES-MIB", "hrSystemUptime")
+
+
+def test_build_mib_bundle(tmp_path):
+    os.mkdir(tmp_path / "snmp")
+    (tmp_path / "snmp" / "snmp.xml").write_text(
+        '<snmp><mibs><mib name="SNMPv2-MIB"/><mib name="TCP-MIB"/></mibs></snmp>'
+    )
+
+    assert mib_bundle.build_bundle(str(tmp_path)) == ["TCP-MIB"]
+    assert mib_bundle.find_bundle(str(tmp_path), ["TCP-MIB"])
+    assert not mib_bundle.find_bundle(str(tmp_path), ["UDP-MIB"])
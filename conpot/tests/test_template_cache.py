@@ -0,0 +1,144 @@
+import os
+from configparser import ConfigParser
+
+import pytest
+
+import conpot
+from conpot.core.databus import Databus, compile_key_value_mappings
+from conpot.core.template_cache import TemplateCache, TemplateError
+from conpot.protocols.modbus.modbus_server import compile_template
+
+package_directory = os.path.dirname(conpot.__file__)
+template_xsd = os.path.join(package_directory, "template.xsd")
+default_template = os.path.join(package_directory, "templates", "default")
+
+
+def cache_config(directory):
+    config = ConfigParser()
+    config.read_dict({"template_cache": {"enabled": True, "directory": directory}})
+    return config
+
+
+@pytest.fixture
+def template(tmp_path):
+    with open(os.path.join(default_template, "template.xml")) as f:
+        content = f.read()
+    path = tmp_path / "template.xml"
+    path.write_text(
+        content.replace("[random.randint(0,1) for b in range(0,128)]", "[1, 1, 1]", 1)
+    )
+    return str(path)
+
+
+def test_databus_is_initialized_from_the_compiled_template(template):
+    databus = Databus()
+    databus.initialize(template, template_xsd)
+
+    assert databus.get_value("SystemName") == "Technodrome"
+    assert databus.get_value("memoryModbusSlave0BlockA") == [1, 1, 1]
+    assert len(databus.get_value("memoryModbusSlave0BlockB")) == 32
+    # values are not shared between initializations
+    databus.get_value("memoryModbusSlave0BlockA")[0] = 0
+    databus.initialize(template, template_xsd)
+    assert databus.get_value("memoryModbusSlave0BlockA")[0] == 1
+    assert databus.template_cache.misses == 1
+    assert databus.template_cache.hits == 1
+    databus.reset()
+
+
+def test_warm_start_skips_compilation(template, tmp_path, monkeypatch):
+    directory = str(tmp_path / "cache")
+    cold = TemplateCache()
+    cold.configure(cache_config(directory))
+    settings = cold.compile(template, compile_key_value_mappings, template_xsd)
+    assert cold.misses == 1
+
+    warm = TemplateCache()
+    warm.configure(cache_config(directory))
+    # neither the schema nor the template are parsed on a warm start
+    monkeypatch.setattr("conpot.core.template_cache.etree", None)
+    assert warm.compile(template, compile_key_value_mappings, template_xsd) == settings
+    assert (warm.hits, warm.misses) == (1, 0)
+
+
+def test_changed_template_is_compiled_again(template, tmp_path):
+    directory = str(tmp_path / "cache")
+    cache = TemplateCache()
+    cache.configure(cache_config(directory))
+    cache.compile(template, compile_key_value_mappings, template_xsd)
+
+    with open(template) as f:
+        content = f.read()
+    with open(template, "w") as f:
+        f.write(content.replace("Technodrome", "Technodrome 2"))
+
+    warm = TemplateCache()
+    warm.configure(cache_config(directory))
+    warm.compile(template, compile_key_value_mappings, template_xsd)
+    assert (warm.hits, warm.misses) == (0, 1)
+
+
+def test_invalid_template(template):
+    with open(template, "w") as f:
+        f.write("<core><unknown/></core>")
+
+    with pytest.raises(TemplateError):
+        TemplateCache().compile(template, compile_key_value_mappings, template_xsd)
+
+
+def test_modbus_template():
+    settings = TemplateCache().compile(
+        os.path.join(default_template, "modbus", "modbus.xml"), compile_template
+    )
+
+    assert settings["mode"] == "serial"
+    assert settings["device_info"][0] == "Siemens"
+    assert ("memoryModbusSlave0BlockA", "COILS", "1", "128") in settings["slaves"][0][1]
+
+
+def test_default_directory_is_private(template, tmp_path):
+    config = ConfigParser()
+    config.read_dict({"template_cache": {"enabled": True}})
+    cache = TemplateCache()
+    cache.configure(config, str(tmp_path))
+
+    assert os.path.dirname(cache.directory) == str(tmp_path)
+    assert os.stat(cache.directory).st_mode & 0o777 == 0o700
+
+
+def test_shared_directory_is_refused(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+    cache = TemplateCache()
+    cache.configure(cache_config(str(directory)))
+
+    assert cache.directory is None
+
+
+def test_entries_writable_by_others_are_not_loaded(template, tmp_path):
+    directory = str(tmp_path / "cache")
+    cold = TemplateCache()
+    cold.configure(cache_config(directory))
+    cold.compile(template, compile_key_value_mappings, template_xsd)
+    (entry,) = os.listdir(directory)
+    os.chmod(os.path.join(directory, entry), 0o666)
+
+    warm = TemplateCache()
+    warm.configure(cache_config(directory))
+    warm.compile(template, compile_key_value_mappings, template_xsd)
+    assert (warm.hits, warm.misses) == (0, 1)
+
+
+def test_entries_of_other_users_are_not_loaded(template, tmp_path, monkeypatch):
+    directory = str(tmp_path / "cache")
+    cold = TemplateCache()
+    cold.configure(cache_config(directory))
+    cold.compile(template, compile_key_value_mappings, template_xsd)
+
+    warm = TemplateCache()
+    warm.configure(cache_config(directory))
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    warm.compile(template, compile_key_value_mappings, template_xsd)
+    assert (warm.hits, warm.misses) == (0, 1)
@@ -0,0 +1,96 @@
+import os
+from datetime import datetime
+
+import gevent
+import pytest
+from gevent import socket
+from gevent.queue import Queue
+
+import conpot
+from conpot.core.session_manager import SessionManager
+from conpot.core.workers import EventForwarder, EventReceiver
+from conpot.protocols.http.command_responder import (
+    CommandResponder as HTTPCommandResponder,
+)
+from conpot.protocols.snmp.command_responder import (
+    CommandResponder as SNMPCommandResponder,
+)
+from conpot.utils import networking
+from conpot.utils.greenlet import spawn_startable_greenlet, teardown_test_server
+
+
+def test_events_are_relayed_to_the_main_process():
+    worker_end, main_end = socket.socketpair()
+    session_manager = SessionManager()
+    log_queue = Queue()
+    forwarder = EventForwarder(session_manager, worker_end)
+    receiver = EventReceiver(main_end, log_queue)
+    forwarder_greenlet = spawn_startable_greenlet(forwarder)
+    receiver_greenlet = spawn_startable_greenlet(receiver)
+
+    session = session_manager.get_session("modbus", "1.2.3.4", 1000, "127.0.0.1", 502)
+    session.add_event({"request": b"\x00" * 100000, "response": b"\x01"})
+    event = log_queue.get(timeout=5)
+
+    assert event["id"] == session.id
+    assert event["remote"] == ("1.2.3.4", 1000)
+    assert event["data"] == {"request": b"\x00" * 100000, "response": b"\x01"}
+    assert isinstance(event["timestamp"], datetime)
+
+    teardown_test_server(forwarder, forwarder_greenlet)
+    teardown_test_server(receiver, receiver_greenlet)
+
+    # the worker ends its sessions when it stops
+    assert len(session_manager) == 0
+    assert forwarder.forwarded == receiver.received == 1
+
+
+def test_receiver_stops_without_worker():
+    worker_end, main_end = socket.socketpair()
+    receiver = EventReceiver(main_end, Queue())
+    greenlet = spawn_startable_greenlet(receiver)
+    gevent.sleep(0)
+
+    receiver.stop(timeout=0.1)
+    greenlet.join(1)
+
+    assert greenlet.dead
+    worker_end.close()
+
+
+def test_workers_share_listening_ports(monkeypatch):
+    monkeypatch.setattr(networking, "_reuse_port", True)
+
+    first = SNMPCommandResponder("127.0.0.1", 0, "/tmp", None)
+    second = SNMPCommandResponder("127.0.0.1", first.server_port, "/tmp", None)
+    assert second.server_port == first.server_port
+    first.snmpEngine.transportDispatcher.close()
+    second.snmpEngine.transportDispatcher.close()
+
+    http_directory = os.path.join(
+        os.path.dirname(conpot.__file__), "templates", "default", "http"
+    )
+    template = os.path.join(http_directory, "http.xml")
+    first = HTTPCommandResponder("127.0.0.1", 0, template, http_directory)
+    second = HTTPCommandResponder(
+        "127.0.0.1", first.server_port, template, http_directory
+    )
+    assert second.server_port == first.server_port
+    first.httpd.server_close()
+    second.httpd.server_close()
+
+
+@pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 is not available")
+def test_listeners_bind_the_family_of_the_host():
+    listeners = [
+        networking.stream_listener(("127.0.0.1", 0)),
+        networking.stream_listener(("::1", 0)),
+        networking.datagram_listener(("::1", 0)),
+    ]
+    assert [listener.family for listener in listeners] == [
+        socket.AF_INET,
+        socket.AF_INET6,
+        socket.AF_INET6,
+    ]
+    for listener in listeners:
+        listener.close()
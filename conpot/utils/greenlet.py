@@ -67,10 +67,10 @@ def teardown_test_server(server, greenlet):
 
 
 # this is really a test helper but start_protocol.py wants to use it too
-def init_test_server_by_name(name, port=0):
+def init_test_server_by_name(name, port=0, template=None):
     server_class = protocols.name_mapping[name]
 
-    template = {
+    template = template or {
         "guardian_ast": "guardian_ast",
         "IEC104": "IEC104",
         "kamstrup_management": "kamstrup_382",
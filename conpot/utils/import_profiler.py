@@ -0,0 +1,94 @@
+# Copyright (C) 2026 MushMush Foundation
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""
+Measures how long the execution of every imported module takes, used by ``conpot --profile-imports``.
+
+Like ``python -X importtime`` the self time of a module excludes the modules it imports, the cumulative time
+includes them.
+"""
+
+import logging
+import resource
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ImportProfiler(object):
+    def __init__(self):
+        # module name -> (self time, cumulative time) in seconds, in import order
+        self.timings = {}
+        # time spent in the modules imported by the modules being executed
+        self._stack = []
+        self._started = time.perf_counter()
+
+    @classmethod
+    def install(cls):
+        profiler = cls()
+        sys.meta_path.insert(0, profiler)
+        return profiler
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        # loaders of source and extension modules are created per module, builtin modules are not timed
+        loader = spec.loader
+        if loader is not None and not isinstance(loader, type):
+            if hasattr(loader, "exec_module") and "exec_module" not in vars(loader):
+                loader.exec_module = self._timed(fullname, loader.exec_module)
+        return spec
+
+    def _timed(self, name, exec_module):
+        def timed_exec_module(module):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                imported = self._stack.pop()
+                self.timings[name] = (elapsed - imported, elapsed)
+                if self._stack:
+                    self._stack[-1] += elapsed
+
+        return timed_exec_module
+
+    def report(self, limit=25):
+        """Log the modules with the highest cumulative import time."""
+        logger.info(
+            "Imported %d modules in %.1f ms, %.1f ms since start, max RSS %d kB",
+            len(self.timings),
+            sum(own for own, _ in self.timings.values()) * 1000,
+            (time.perf_counter() - self._started) * 1000,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        )
+        logger.info("%10s %10s  module", "self [us]", "cumul [us]")
+        ranked = sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (own, cumulative) in ranked[:limit]:
+            logger.info("%10d %10d  %s", own * 1e6, cumulative * 1e6, name)
@@ -1,3 +1,4 @@
+import ipaddress
 import socket
 from datetime import datetime
 
@@ -82,3 +83,62 @@ def get_interface_ip(destination_ip: str):
     socket_ip = s.getsockname()[0]
     s.close()
     return socket_ip
+
+
+# set by enable_reuse_port in the worker processes
+_reuse_port = False
+
+
+def set_reuse_port(sock):
+    """Let sock share its port with the same socket of the other worker processes."""
+    if _reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+
+def _listener(address, sock_type):
+    # the servers of all protocols are gevent based
+    from gevent import socket as gsocket
+
+    try:
+        # the family of an address literal, e.g. AF_INET6 for "::". Unlike getaddrinfo
+        # this does not yield to the hub, so the socket is bound before the server greenlet
+        # lets anyone else run.
+        family = (
+            socket.AF_INET6
+            if ipaddress.ip_address(address[0]).version == 6
+            else socket.AF_INET
+        )
+    except ValueError:
+        if address[0]:
+            family = socket.getaddrinfo(
+                address[0], address[1], 0, sock_type, 0, socket.AI_PASSIVE
+            )[0][0]
+        else:
+            # like gevent, an empty host binds all IPv4 addresses
+            family = socket.AF_INET
+    sock = gsocket.socket(family, sock_type)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    set_reuse_port(sock)
+    sock.bind(address)
+    return sock
+
+
+def stream_listener(address, backlog=256):
+    """Return a listening TCP socket bound to address, for gevent StreamServers."""
+    sock = _listener(address, socket.SOCK_STREAM)
+    sock.listen(backlog)
+    return sock
+
+
+def datagram_listener(address):
+    """Return a UDP socket bound to address, for gevent DatagramServers."""
+    return _listener(address, socket.SOCK_DGRAM)
+
+
+def enable_reuse_port():
+    """
+    Bind the listening sockets created from now on with SO_REUSEPORT, so the kernel spreads
+    connections and datagrams over the worker processes listening on the same port.
+    """
+    global _reuse_port
+    _reuse_port = True